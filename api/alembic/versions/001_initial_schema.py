@@ -20,14 +20,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Create ENUM types first
-    tier_enum = postgresql.ENUM("free", "pro", "enterprise", name="tierenum", create_type=True)
-    tier_enum.create(op.get_bind(), checkfirst=True)
-    
-    dependency_type_enum = postgresql.ENUM(
-        "direct", "dev", "optional", "peer", name="dependencytypeenum", create_type=True
+    # Create ENUM types first (fresh schema, so no checkfirst catalog lookups)
+    op.execute("CREATE TYPE tierenum AS ENUM ('free', 'pro', 'enterprise')")
+    op.execute(
+        "CREATE TYPE dependencytypeenum AS ENUM ('direct', 'dev', 'optional', 'peer')"
     )
-    dependency_type_enum.create(op.get_bind(), checkfirst=True)
 
     # Create organizations table
     op.create_table(
@@ -61,9 +58,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("name"),
     )
-    op.create_index(
-        "ix_organizations_name", "organizations", ["name"], unique=True
-    )
 
     # Create packages table
     op.create_table(
@@ -95,12 +89,6 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        "ix_packages_ecosystem_name",
-        "packages",
-        ["ecosystem", "name"],
-        unique=True,
-    )
 
     # Create repositories table
     op.create_table(
@@ -139,16 +127,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("github_url"),
     )
-    op.create_index(
-        "ix_repositories_organization_id",
-        "repositories",
-        ["organization_id"],
-    )
-    op.create_index(
-        "ix_repositories_stars_desc",
-        "repositories",
-        ["stars"],
-    )
 
     # Create dependencies table (junction table)
     op.create_table(
@@ -158,7 +136,14 @@ def upgrade() -> None:
         sa.Column("version", sa.String(), nullable=True),
         sa.Column(
             "dependency_type",
-            postgresql.ENUM("direct", "dev", "optional", "peer", name="dependencytypeenum", create_type=False),
+            postgresql.ENUM(
+                "direct",
+                "dev",
+                "optional",
+                "peer",
+                name="dependencytypeenum",
+                create_type=False,
+            ),
             nullable=True,
         ),
         sa.Column("detected_at", sa.DateTime(timezone=True), nullable=True),
@@ -194,16 +179,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("repository_id", "package_id"),
     )
-    op.create_index(
-        "ix_dependencies_repository_id",
-        "dependencies",
-        ["repository_id"],
-    )
-    op.create_index(
-        "ix_dependencies_package_id",
-        "dependencies",
-        ["package_id"],
-    )
 
     # Create api_keys table
     op.create_table(
@@ -241,6 +216,49 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("key_hash"),
     )
+
+    # Create indexes once all tables exist so each btree is built in a single pass
+    op.create_index(
+        "ix_organizations_name", "organizations", ["name"], unique=True
+    )
+    # Pattern-ops twins of the unique indexes so LIKE 'prefix%' searches can use an index
+    op.create_index(
+        "ix_organizations_name_pattern",
+        "organizations",
+        ["name"],
+        postgresql_ops={"name": "varchar_pattern_ops"},
+    )
+    op.create_index(
+        "ix_packages_ecosystem_name",
+        "packages",
+        ["ecosystem", "name"],
+        unique=True,
+    )
+    op.create_index(
+        "ix_packages_ecosystem_name_pattern",
+        "packages",
+        ["ecosystem", "name"],
+        postgresql_ops={"ecosystem": "varchar_pattern_ops", "name": "varchar_pattern_ops"},
+    )
+    # Serves both "repositories of org X" and "top repositories of org X" without a sort
+    op.create_index(
+        "ix_repositories_org_stars",
+        "repositories",
+        ["organization_id", sa.text("stars DESC NULLS LAST")],
+    )
+    # Descending and covering so "top repositories by stars" is an index-only scan
+    op.create_index(
+        "ix_repositories_stars_desc",
+        "repositories",
+        [sa.text("stars DESC NULLS LAST")],
+        postgresql_include=["name", "organization_id"],
+    )
+    # repository_id lookups are served by the (repository_id, package_id) unique index
+    op.create_index(
+        "ix_dependencies_package_id",
+        "dependencies",
+        ["package_id"],
+    )
     op.create_index(
         "ix_api_keys_key_hash", "api_keys", ["key_hash"], unique=True
     )
@@ -251,10 +269,11 @@ def downgrade() -> None:
     # Drop indexes
     op.drop_index("ix_api_keys_key_hash", table_name="api_keys")
     op.drop_index("ix_dependencies_package_id", table_name="dependencies")
-    op.drop_index("ix_dependencies_repository_id", table_name="dependencies")
     op.drop_index("ix_repositories_stars_desc", table_name="repositories")
-    op.drop_index("ix_repositories_organization_id", table_name="repositories")
+    op.drop_index("ix_repositories_org_stars", table_name="repositories")
+    op.drop_index("ix_packages_ecosystem_name_pattern", table_name="packages")
     op.drop_index("ix_packages_ecosystem_name", table_name="packages")
+    op.drop_index("ix_organizations_name_pattern", table_name="organizations")
     op.drop_index("ix_organizations_name", table_name="organizations")
 
     # Drop tables in reverse dependency order
@@ -265,9 +284,4 @@ def downgrade() -> None:
     op.drop_table("organizations")
 
     # Drop ENUM types
-    postgresql.ENUM("free", "pro", "enterprise", name="tierenum").drop(
-        op.get_bind(), checkfirst=True
-    )
-    postgresql.ENUM("direct", "dev", "optional", "peer", name="dependencytypeenum").drop(
-        op.get_bind(), checkfirst=True
-    )
+    op.execute("DROP TYPE IF EXISTS tierenum, dependencytypeenum")
@@ -0,0 +1,67 @@
+"""Switch dependencies primary key to a 64-bit time-ordered ID
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002"
+down_revision: str | Sequence[str] | None = "001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match app.core.skid (2025-01-01T00:00:00Z epoch, 22 low bits of worker/sequence)
+SKID_EPOCH_MS = 1_735_689_600_000
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("dependencies", sa.Column("skid", sa.BigInteger(), nullable=True))
+
+    # Backfill existing rows in creation order; the row number fills the low
+    # 22 bits so rows created in the same millisecond stay unique
+    op.execute(
+        f"""
+        UPDATE dependencies AS d
+        SET skid = (
+            (GREATEST(
+                (EXTRACT(EPOCH FROM numbered.created_at) * 1000)::bigint - {SKID_EPOCH_MS},
+                0
+            ) << 22)
+            | (numbered.rn & 4194303)
+        )
+        FROM (
+            SELECT id, created_at, row_number() OVER (ORDER BY created_at, id) AS rn
+            FROM dependencies
+        ) AS numbered
+        WHERE d.id = numbered.id
+        """
+    )
+
+    op.drop_constraint("dependencies_pkey", "dependencies", type_="primary")
+    op.drop_column("dependencies", "id")
+    op.alter_column("dependencies", "skid", new_column_name="id", nullable=False)
+    op.create_primary_key("dependencies_pkey", "dependencies", ["id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("dependencies_pkey", "dependencies", type_="primary")
+    op.drop_column("dependencies", "id")
+    op.add_column(
+        "dependencies",
+        sa.Column(
+            "id",
+            sa.UUID(),
+            server_default=sa.text("gen_random_uuid()"),
+            nullable=False,
+        ),
+    )
+    op.create_primary_key("dependencies_pkey", "dependencies", ["id"])
@@ -0,0 +1,58 @@
+"""Store dependencies.dependency_type as SMALLINT codes
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003"
+down_revision: str | Sequence[str] | None = "002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match app.models.dependency.DEPENDENCY_TYPE_CODES
+CODES = {"direct": 1, "dev": 2, "optional": 3, "peer": 4}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    to_code = " ".join(f"WHEN '{label}' THEN {code}" for label, code in CODES.items())
+    op.alter_column(
+        "dependencies",
+        "dependency_type",
+        type_=sa.SmallInteger(),
+        postgresql_using=f"CASE dependency_type::text {to_code} END",
+        existing_nullable=True,
+    )
+    # The codes in CODES; the model builds this constraint from
+    # DEPENDENCY_TYPE_CODES, so keep the two in step
+    op.create_check_constraint(
+        "ck_dependencies_dependency_type",
+        "dependencies",
+        "dependency_type IN (1, 2, 3, 4)",
+    )
+    op.execute("DROP TYPE IF EXISTS dependencytypeenum")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(
+        "CREATE TYPE dependencytypeenum AS ENUM ('direct', 'dev', 'optional', 'peer')"
+    )
+    op.drop_constraint("ck_dependencies_dependency_type", "dependencies", type_="check")
+    to_label = " ".join(f"WHEN {code} THEN '{label}'" for label, code in CODES.items())
+    op.alter_column(
+        "dependencies",
+        "dependency_type",
+        type_=postgresql.ENUM(*CODES, name="dependencytypeenum", create_type=False),
+        postgresql_using=f"(CASE dependency_type {to_label} END)::dependencytypeenum",
+        existing_nullable=True,
+    )
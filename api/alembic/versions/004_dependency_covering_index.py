@@ -0,0 +1,44 @@
+"""Make the dependencies (repository_id, package_id) unique index covering
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004"
+down_revision: str | Sequence[str] | None = "003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Same uniqueness as before; the INCLUDE columns let per-repository
+    # listings be answered from the index alone
+    op.create_index(
+        "idx_dependencies_repo_package",
+        "dependencies",
+        ["repository_id", "package_id"],
+        unique=True,
+        postgresql_include=["version", "dependency_type", "detected_at"],
+    )
+    op.drop_constraint(
+        "dependencies_repository_id_package_id_key", "dependencies", type_="unique"
+    )
+    # Redundant with the leading column above (only present on create_all schemas)
+    op.execute("DROP INDEX IF EXISTS idx_dependencies_repo_id")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint(
+        "dependencies_repository_id_package_id_key",
+        "dependencies",
+        ["repository_id", "package_id"],
+    )
+    op.drop_index("idx_dependencies_repo_package", table_name="dependencies")
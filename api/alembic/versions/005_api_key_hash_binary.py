@@ -0,0 +1,44 @@
+"""Store api_keys.key_hash as a raw 32-byte SHA-256 digest
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005"
+down_revision: str | Sequence[str] | None = "004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ix_api_keys_key_hash is already unique; the constraint was a second index
+    op.drop_constraint("api_keys_key_hash_key", "api_keys", type_="unique")
+    # Existing values are hex SHA-256 digests; decode them to raw bytes
+    op.alter_column(
+        "api_keys",
+        "key_hash",
+        type_=sa.LargeBinary(32),
+        postgresql_using="decode(key_hash, 'hex')",
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        "api_keys",
+        "key_hash",
+        type_=sa.String(),
+        postgresql_using="encode(key_hash, 'hex')",
+        existing_nullable=False,
+    )
+    op.create_unique_constraint("api_keys_key_hash_key", "api_keys", ["key_hash"])
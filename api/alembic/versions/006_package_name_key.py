@@ -0,0 +1,74 @@
+"""Enforce package uniqueness on a 64-bit (ecosystem, name) hash key
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+import hashlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006"
+down_revision: str | Sequence[str] | None = "005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def package_name_key(ecosystem: str, name: str) -> int:
+    """Frozen copy of app.models.package.package_name_key at this revision."""
+    digest = hashlib.blake2b(f"{ecosystem}\0{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("packages", sa.Column("name_key", sa.BigInteger(), nullable=True))
+
+    # The key is computed in Python (same hash as the model), in batches
+    packages = sa.table(
+        "packages",
+        sa.column("id", sa.UUID()),
+        sa.column("ecosystem", sa.String()),
+        sa.column("name", sa.String()),
+        sa.column("name_key", sa.BigInteger()),
+    )
+    update = (
+        sa.update(packages)
+        .where(packages.c.id == sa.bindparam("package_id"))
+        .values(name_key=sa.bindparam("key"))
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(packages.c.id, packages.c.ecosystem, packages.c.name))
+    while batch := rows.fetchmany(BACKFILL_BATCH_SIZE):
+        bind.execute(
+            update,
+            [
+                {"package_id": row.id, "key": package_name_key(row.ecosystem, row.name)}
+                for row in batch
+            ],
+        )
+
+    op.alter_column("packages", "name_key", nullable=False)
+    op.create_index("ix_packages_name_key", "packages", ["name_key"], unique=True)
+    # Uniqueness now lives on name_key; ix_packages_ecosystem_name_pattern
+    # still serves exact and prefix lookups by (ecosystem, name)
+    op.drop_index("ix_packages_ecosystem_name", table_name="packages")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_packages_ecosystem_name",
+        "packages",
+        ["ecosystem", "name"],
+        unique=True,
+    )
+    op.drop_index("ix_packages_name_key", table_name="packages")
+    op.drop_column("packages", "name_key")
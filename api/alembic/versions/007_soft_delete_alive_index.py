@@ -0,0 +1,42 @@
+"""Add organizations.deleted_at and its partial live-row index
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007"
+down_revision: str | Sequence[str] | None = "006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Soft-delete timestamp from SoftDeleteMixin; NULL for live rows
+    op.add_column(
+        "organizations",
+        sa.Column("deleted_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # Only live rows are indexed, matching the deleted_at IS NULL criteria
+    # every app-session ORM SELECT carries
+    op.create_index(
+        "idx_organizations_alive",
+        "organizations",
+        ["id"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_organizations_alive", table_name="organizations")
+    op.drop_column("organizations", "deleted_at")
@@ -1,29 +1,37 @@
 #!/usr/bin/env python3
-"""Test runner that ensures clean exit after pytest completes.
+"""Test runner that selects default pytest arguments for CI and local runs.
 
-This script uses os._exit() instead of sys.exit() to force immediate termination
-without cleanup. This prevents hanging on background threads from OpenTelemetry,
-FastAPI, SQLAlchemy connection pools, or other async resources.
+This script replaces its own process with `python -m pytest` via os.execvp() instead
+of calling pytest.main() in-process. Nothing from this wrapper (imports, threads,
+pools) survives into the test run, and pytest's exit code becomes the process exit
+code directly.
 """
 import os
 import sys
-import pytest
 
 if __name__ == "__main__":
     # Build pytest arguments from command line args if provided
     # Otherwise use defaults optimized for CI/local testing
-    args = sys.argv[1:] if len(sys.argv) > 1 else [
-        "src/tests/",
-        "-n", "auto",  # Parallel execution using all CPU cores
-        "--tb=line",  # Compact traceback for faster output
-        "--cov=src/app",
-        "--cov-report=term-missing",
-        "--durations=10",  # Show 10 slowest tests
-    ]
+    if len(sys.argv) > 1:
+        args = sys.argv[1:]
+    elif os.environ.get("FAST_TESTS"):
+        # Fast local loop: no coverage tracing, no on-disk cache contention
+        args = [
+            "src/tests/",
+            "-n", "logical",  # One worker per logical CPU
+            "--dist=loadgroup",  # Keep xdist_group-marked tests on one worker
+            "--tb=line",
+            "-p", "no:cacheprovider",
+        ]
+    else:
+        args = [
+            "src/tests/",
+            "-n", "auto",  # Parallel execution using all CPU cores
+            "--tb=line",  # Compact traceback for faster output
+            "--cov=src/app",
+            "--cov-report=term-missing",
+            "--durations=10",  # Show 10 slowest tests
+        ]
 
-    # Run pytest
-    exit_code = pytest.main(args)
-
-    # Force exit without cleanup to prevent hanging on background threads
-    # This is necessary because OpenTelemetry and FastAPI may leave threads running
-    os._exit(exit_code)
+    # Hand the process over to pytest; this call does not return
+    os.execvp(sys.executable, [sys.executable, "-m", "pytest", *args])
@@ -1,9 +1,14 @@
 """Valkey/Redis connection management with async client."""
 
+import asyncio
+import socket
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.asyncio.connection import Connection, DefaultParser, SSLConnection
+from redis.utils import HIREDIS_AVAILABLE
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -18,6 +23,10 @@ except ImportError:
 
 logger = get_logger(__name__)
 
+# Socket buffer size for Valkey connections (512 KiB) so large MGET/pipeline
+# replies are read in a few syscalls instead of many small recv() calls
+SOCKET_BUFFER_SIZE = 512 * 1024
+
 
 class CacheErrorMessage:
     """Standardized cache error messages."""
@@ -25,21 +34,41 @@ class CacheErrorMessage:
     CREATE_CLIENT_NO_URL = "Valkey URL is not configured"
     CREATE_CLIENT_POOL_MIN_SIZE = "VALKEY_POOL_SIZE must be at least 1"
     CREATE_CLIENT_FAILED = "Failed to create Valkey client"
-    GET_CACHE_FAILED = "Failed to get cache connection"
     CLOSE_CACHE_FAILED = "Failed to close cache connections"
 
 
+class BufferedConnection(Connection):
+    """TCP connection with enlarged kernel send/receive buffers."""
+
+    async def _connect(self) -> None:
+        await super()._connect()
+        sock = self._writer.transport.get_extra_info("socket") if self._writer else None
+        if sock is not None:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
+
+
+class BufferedSSLConnection(SSLConnection, BufferedConnection):
+    """TLS connection (rediss://) with enlarged kernel send/receive buffers."""
+
+
 def create_client() -> Redis:
-    """Create async Redis client with connection pooling.
+    """Create async Redis client with a blocking connection pool.
 
     Returns:
         Redis: Configured async Redis client (or FakeRedis for testing)
 
     Connection Pool Configuration (real Redis only):
-        - max_connections: Maximum connections in the pool (default: 20)
+        - max_connections: Maximum connections in the pool (default: 10)
+        - timeout: Seconds to wait for a free connection when the pool is
+          exhausted before raising (default: 2.0)
         - decode_responses: Whether to decode responses (True for string)
         - socket_connect_timeout: Timeout for socket connection (default: 5s)
         - socket_keepalive: Enable TCP keepalive (True)
+        - parser_class: hiredis C parser when installed (redis[hiredis])
+        - socket_read_size / SO_RCVBUF / SO_SNDBUF: 512 KiB buffers for
+          large replies on redis:// and rediss:// (see BufferedConnection);
+          unix:// sockets keep redis-py's defaults
         - health_check_interval: Health check interval (30s)
 
     Raises:
@@ -54,24 +83,41 @@ def create_client() -> Redis:
         if not settings.valkey_url:
             raise ValueError(CacheErrorMessage.CREATE_CLIENT_NO_URL)
 
+        if settings.valkey_pool_size < 1:
+            raise ValueError(CacheErrorMessage.CREATE_CLIENT_POOL_MIN_SIZE)
+
+        if not HIREDIS_AVAILABLE:
+            logger.warning("hiredis is not installed, falling back to the pure-Python parser")
+
         logger.info(
             "Creating async Valkey client",
-            url=settings.valkey_url.split("@")[1] if "@" in settings.valkey_url else "***",
-            max_connections=20,
+            url=settings.valkey_url_safe,
+            max_connections=settings.valkey_pool_size,
+            pool_timeout=settings.valkey_pool_timeout,
+            parser=DefaultParser.__name__,
         )
 
-        # Create connection pool with configuration
-        client: Redis = redis.from_url(  # type: ignore[no-untyped-call]
+        # Blocking pool: callers wait for a free connection instead of opening
+        # new sockets (or failing) when the pool is exhausted under burst load.
+        pool = redis.BlockingConnectionPool.from_url(
             settings.valkey_url,
             encoding="utf-8",
             decode_responses=True,
-            max_connections=20,
+            max_connections=settings.valkey_pool_size,
+            timeout=settings.valkey_pool_timeout,
             socket_connect_timeout=5,
             socket_keepalive=True,
+            socket_read_size=SOCKET_BUFFER_SIZE,
+            connection_class=BufferedConnection,
+            parser_class=DefaultParser,
             health_check_interval=30,
         )
+        # from_url swaps in SSLConnection for rediss:// URLs, overriding
+        # connection_class; use its buffered counterpart instead
+        if pool.connection_class is SSLConnection:
+            pool.connection_class = BufferedSSLConnection
 
-        return client
+        return Redis.from_pool(pool)
     except ValueError:
         raise
     except Exception as e:
@@ -81,19 +127,40 @@ def create_client() -> Redis:
         raise ValueError(CacheErrorMessage.CREATE_CLIENT_FAILED) from e
 
 
-# Create client instance
-cache_client: Any = create_client()
+# One client (and pool) per event loop. redis-py connections are bound to the
+# loop that opened them, and per-loop pools avoid cross-loop contention on a
+# single pool lock. Entries disappear with their loop.
+_clients: WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = WeakKeyDictionary()
+
+
+def get_client() -> Any:
+    """Get the cache client for the running event loop, creating it on first use.
+
+    Deferring creation keeps imports free of pool setup, so workers and test
+    collection only build a pool once something actually needs the cache.
+
+    Returns:
+        Redis: Async Redis client (or FakeRedis for testing) for this loop
+
+    Raises:
+        RuntimeError: If called outside a running event loop
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = _clients[loop] = create_client()
+    return client
 
 
 async def get_cache() -> Any:
     """FastAPI dependency for cache access.
 
+    Connection liveness is handled by the pool's periodic health checks,
+    so no per-request PING is issued here.
+
     Returns:
         Redis: Cache client for route handlers
 
-    Raises:
-        RuntimeError: If cache client cannot be accessed
-
     Example:
         @app.get("/data")
         async def get_data(cache: Redis = Depends(get_cache)):
@@ -102,13 +169,7 @@ async def get_cache() -> Any:
                 return json.loads(cached)
             # Fetch and cache data
     """
-    try:
-        # Test connection is alive
-        await cache_client.ping()
-        return cache_client
-    except Exception as e:
-        logger.error(f"Cache connection error occurred: {e}")
-        raise RuntimeError(CacheErrorMessage.GET_CACHE_FAILED) from e
+    return get_client()
 
 
 @trace_cache()
@@ -121,7 +182,7 @@ async def check_cache_connection() -> bool:
         bool: True if connection successful, False otherwise
     """
     try:
-        await cache_client.ping()
+        await get_client().ping()
         logger.debug("Cache connection check passed")
         return True
     except Exception as e:
@@ -131,19 +192,24 @@ async def check_cache_connection() -> bool:
 
 @trace_cache()
 async def close_cache() -> None:
-    """Close all cache connections.
+    """Close the running event loop's cache connections.
 
-    Should be called during application shutdown.
+    Should be called during application shutdown. Does nothing if the client
+    was never created; otherwise the next get_client() call builds a new one.
 
     Raises:
         RuntimeError: If graceful shutdown fails
     """
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is None:
+        return
+
     try:
         logger.info("Closing cache connections")
-        await cache_client.close()
+        await client.close()
         # Wait for connection pool to be cleaned up (real Redis only)
-        if hasattr(cache_client, 'connection_pool'):
-            await cache_client.connection_pool.disconnect()
+        if hasattr(client, 'connection_pool'):
+            await client.connection_pool.disconnect()
     except Exception as e:
         logger.error(f"Error closing cache connections: {e}")
         raise RuntimeError(CacheErrorMessage.CLOSE_CACHE_FAILED) from e
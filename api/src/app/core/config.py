@@ -1,4 +1,7 @@
 """Core configuration management using pydantic-settings."""
+import logging
+from functools import cached_property
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,9 +22,15 @@ class Settings(BaseSettings):
     database_url: str = "sqlite+aiosqlite:///./test.db"
     database_pool_size: int = 20
     database_max_overflow: int = 10
+    # Lazy relationship loads from repositories raise (N+1 guard); enable in development
+    database_raiseload: bool = False
+    # 0-1023, unique per process writing SKID rows; random if unset
+    skid_worker_id: int | None = None
 
     # Valkey/Redis
     valkey_url: str = "redis://localhost:6379/0"
+    valkey_pool_size: int = 10
+    valkey_pool_timeout: float = 2.0
 
     # API Configuration
     api_host: str = "0.0.0.0"
@@ -45,15 +54,33 @@ class Settings(BaseSettings):
     otel_exporter_otlp_endpoint: str = "http://jaeger:4317"  # Docker service default; override via OTEL_EXPORTER_OTLP_ENDPOINT env var or copy .env.example to .env
     otel_exporter_insecure: bool = False  # Secure by default; set to True for local development via OTEL_EXPORTER_INSECURE env var
     otel_service_name: str = "wump-api"
+    # Fraction of new traces to sample; override via OTEL_SAMPLE_RATIO
+    otel_sample_ratio: float = 0.05
+
+    @cached_property
+    def cors_origins_list(self) -> tuple[str, ...]:
+        """Parse CORS origins from comma-separated string (computed once)."""
+        return tuple(origin.strip() for origin in self.cors_origins.split(","))
+
+    @cached_property
+    def database_url_safe(self) -> str:
+        """Database URL host part with credentials stripped, for logging."""
+        return self.database_url.split("@", 1)[1] if "@" in self.database_url else "***"
+
+    @cached_property
+    def valkey_url_safe(self) -> str:
+        """Valkey URL host part with credentials stripped, for logging."""
+        return self.valkey_url.split("@", 1)[1] if "@" in self.valkey_url else "***"
 
-    @property
-    def cors_origins_list(self) -> list[str]:
-        """Parse CORS origins from comma-separated string."""
-        return [origin.strip() for origin in self.cors_origins.split(",")]
+    @cached_property
+    def log_level_int(self) -> int:
+        """Resolve log_level to a stdlib logging level, defaulting to INFO."""
+        level = getattr(logging, self.log_level.upper(), logging.INFO)
+        return level if isinstance(level, int) else logging.INFO
 
-    @property
+    @cached_property
     def is_production(self) -> bool:
-        """Check if running in production environment."""
+        """Check if running in production environment (computed once)."""
         return self.environment.lower() == "production"
 
 
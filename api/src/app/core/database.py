@@ -1,9 +1,10 @@
 """Database connection management with async SQLAlchemy."""
 
 import asyncio
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator
 
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -14,6 +15,7 @@ from sqlalchemy.ext.asyncio import (
 from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.tracing import trace_database
+from app.models.base import AppSession
 
 logger = get_logger(__name__)
 
@@ -28,6 +30,17 @@ class DBErrorMessage:
     CLOSE_DATABASE_FAILED = "Failed to close database connections"
 
 
+def _enable_sqlite_wal(dbapi_connection: Any, connection_record: Any) -> None:
+    """Switch new SQLite connections to write-ahead logging.
+    
+    In the default rollback-journal mode every commit rewrites the journal,
+    so batching inserts into one transaction gains little; WAL appends instead.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.close()
+
+
 def create_engine() -> AsyncEngine:
     """Create AsyncEngine with connection pooling configuration.
     
@@ -38,6 +51,13 @@ def create_engine() -> AsyncEngine:
         - pool_size: Number of connections to keep in the pool (default: 20)
         - max_overflow: Maximum overflow connections (default: 10)
         - pool_timeout: Timeout for acquiring a connection (default: 30s)
+        - pool_use_lifo: Reuse the most recently returned (warm) connection
+        - pool_recycle: Recycle connections after 1 hour; there is no per-checkout
+          pre-ping, which would cost an extra round-trip on every checkout
+        - connect_args: Driver-specific prepared statement cache sizing
+        - SQLite only: journal_mode=WAL on every new connection
+        - query_cache_size: Compiled SQL cache entries (SQLAlchemy default 500),
+          sized so repository templates and ad-hoc queries are not evicted
         - echo: Log all SQL statements (False in production)
         
     Raises:
@@ -55,20 +75,35 @@ def create_engine() -> AsyncEngine:
         
         logger.info(
             "Creating async database engine",
-            url=settings.database_url.split("@")[1] if "@" in settings.database_url else "***",
+            url=settings.database_url_safe,
             pool_size=settings.database_pool_size,
             max_overflow=settings.database_max_overflow,
         )
         
+        connect_args: dict[str, Any] = {}
+        if settings.database_url.startswith("postgresql+asyncpg"):
+            connect_args = {
+                "prepared_statement_cache_size": 1024,
+                # Short OLTP queries do not benefit from JIT compilation
+                "server_settings": {"jit": "off"},
+            }
+        elif settings.database_url.startswith("sqlite+aiosqlite"):
+            connect_args = {"cached_statements": 1024}
+        
         engine = create_async_engine(
             settings.database_url,
             echo=False,  # Set to True for SQL logging
             pool_size=settings.database_pool_size,
             max_overflow=settings.database_max_overflow,
-            pool_pre_ping=True,  # Test connections before using them
+            pool_use_lifo=True,  # Keep hot connections warm
             pool_recycle=3600,  # Recycle connections after 1 hour
+            query_cache_size=1200,
+            connect_args=connect_args,
         )
         
+        if settings.database_url.startswith("sqlite"):
+            event.listen(engine.sync_engine, "connect", _enable_sqlite_wal)
+        
         return engine
     except ValueError:
         raise
@@ -77,17 +112,36 @@ def create_engine() -> AsyncEngine:
         raise ValueError(DBErrorMessage.CREATE_ENGINE_FAILED) from e
 
 
-# Create engine instance
-engine: AsyncEngine = create_engine()
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """Get the process-wide engine, creating it on first use.
+    
+    Deferring creation keeps imports free of pool setup, so workers and test
+    collection only build a pool once something actually needs the database.
+    
+    Returns:
+        AsyncEngine: Shared async SQLAlchemy engine
+    """
+    return create_engine()
 
-# Create async session factory
-async_session_maker: async_sessionmaker[AsyncSession] = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+@lru_cache(maxsize=1)
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """Get the process-wide session factory bound to the shared engine.
+    
+    Sessions use AppSession, so ORM SELECTs hide soft-deleted rows.
+    
+    Returns:
+        async_sessionmaker[AsyncSession]: Shared session factory
+    """
+    return async_sessionmaker(
+        get_engine(),
+        class_=AsyncSession,
+        sync_session_class=AppSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
 
 
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
@@ -105,14 +159,13 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             result = await db.execute(select(Item))
             return result.scalars().all()
     """
-    session = async_session_maker()
-    try:
-        async with session:
+    async with get_session_maker()() as session:
+        try:
             yield session
-    except Exception as e:
-        await session.rollback()
-        logger.error(f"Database session error occurred: {e}")
-        raise RuntimeError(DBErrorMessage.GET_DB_SESSION_FAILED) from e
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database session error occurred: {e}")
+            raise RuntimeError(DBErrorMessage.GET_DB_SESSION_FAILED) from e
 
 
 @trace_database()
@@ -125,7 +178,7 @@ async def check_database_connection() -> bool:
         bool: True if connection successful, False otherwise
     """
     try:
-        async with engine.begin() as conn:
+        async with get_engine().begin() as conn:
             await conn.execute(text("SELECT 1"))
         logger.debug("Database connection check passed")
         return True
@@ -138,17 +191,24 @@ async def check_database_connection() -> bool:
 async def close_database() -> None:
     """Close all database connections.
 
-    Should be called during application shutdown.
+    Should be called during application shutdown. Does nothing if the engine
+    was never created; otherwise the next get_engine() call builds a new one.
 
     Raises:
         RuntimeError: If graceful shutdown fails (connection closure is attempted once)
     """
+    if get_engine.cache_info().currsize == 0:
+        return
+    
     try:
         logger.info("Closing database connections")
-        await engine.dispose()
+        await get_engine().dispose()
         # Allow asyncpg to clean up pending cancellation tasks.
         # This prevents RuntimeWarning about unawaited coroutines.
         await asyncio.sleep(0.25)
     except Exception as e:
         logger.error(f"Error closing database connections: {e}")
-        raise RuntimeError(DBErrorMessage.CLOSE_DATABASE_FAILED) from e
\ No newline at end of file
+        raise RuntimeError(DBErrorMessage.CLOSE_DATABASE_FAILED) from e
+    finally:
+        get_session_maker.cache_clear()
+        get_engine.cache_clear()
\ No newline at end of file
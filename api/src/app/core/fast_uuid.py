@@ -0,0 +1,38 @@
+"""Fast UUID4-formatted request ID generation."""
+import os
+import random
+
+# Clear the version nibble / variant bits, then set version 4 and RFC 4122 variant
+_VERSION_MASK = ~(0xF000 << 64)
+_VERSION_4 = 0x4000 << 64
+_VARIANT_MASK = ~(0xC000 << 48)
+_VARIANT_RFC4122 = 0x8000 << 48
+
+_rng = random.Random(os.urandom(32))
+
+
+def _reseed() -> None:
+    """Reseed the generator so forked workers do not share a sequence."""
+    _rng.seed(os.urandom(32))
+
+
+os.register_at_fork(after_in_child=_reseed)
+
+
+def new_request_id() -> str:
+    """Generate a random UUID4 string for request correlation.
+
+    Draws from a per-process PRNG seeded from os.urandom instead of making an
+    os.urandom syscall per ID as uuid.uuid4() does. IDs are unique but not
+    unpredictable, so they must not be used as secrets or tokens.
+
+    Returns:
+        str: Canonical 36-character UUID4 string
+    """
+    value = _rng.getrandbits(128) & _VERSION_MASK & _VARIANT_MASK
+    value |= _VERSION_4 | _VARIANT_RFC4122
+    hex_value = f"{value:032x}"
+    return (
+        f"{hex_value[:8]}-{hex_value[8:12]}-{hex_value[12:16]}-"
+        f"{hex_value[16:20]}-{hex_value[20:]}"
+    )
@@ -2,25 +2,30 @@
 import logging
 import sys
 
+import orjson
 import structlog
-from structlog.types import EventDict, Processor
+from structlog.types import Processor
 
 from app.core.config import settings
 
-
-def add_app_context(logger: logging.Logger, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add application context to log entries."""
-    event_dict["service"] = settings.otel_service_name
-    event_dict["environment"] = settings.environment
-    return event_dict
+# Set once configure_logging() has run; later calls are no-ops
+_configured = False
 
 
 def configure_logging() -> None:
-    """Configure structlog for structured JSON logging."""
+    """Configure structlog for structured JSON logging.
+
+    Idempotent: the processor chain is built once per process, so repeated
+    calls (worker imports, test setup, get_logger) do not reconfigure structlog.
+    """
     import os
 
-    # Determine log level
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    global _configured
+    if _configured:
+        return
+    _configured = True
+
+    log_level = settings.log_level_int
 
     # Configure standard logging
     logging.basicConfig(
@@ -34,7 +39,6 @@ def configure_logging() -> None:
         structlog.contextvars.merge_contextvars,
         structlog.processors.add_log_level,
         structlog.processors.TimeStamper(fmt="iso"),
-        add_app_context,
         structlog.processors.StackInfoRenderer(),
     ]
 
@@ -46,26 +50,49 @@ def configure_logging() -> None:
     )
 
     # Add JSON renderer for production, console renderer for development
+    logger_factory: structlog.BytesLoggerFactory | structlog.WriteLoggerFactory
     if settings.log_format == "json" or settings.is_production or is_testing:
-        # JSONRenderer handles exception formatting better than format_exc_info
-        # Also skip format_exc_info during testing to avoid warnings
-        processors.append(structlog.processors.JSONRenderer())
+        # dict_tracebacks only does work for events carrying exc_info and emits
+        # a structured traceback; format_exc_info is kept out of this branch
+        processors.append(structlog.processors.dict_tracebacks)
+        # Non-string dict keys and values orjson has no encoding for (Decimal,
+        # arbitrary objects) are written as str instead of raising from the
+        # log call
+        processors.append(
+            structlog.processors.JSONRenderer(
+                serializer=orjson.dumps, option=orjson.OPT_NON_STR_KEYS, default=str
+            )
+        )
+        # orjson emits bytes; write them straight to stdout's binary buffer
+        logger_factory = structlog.BytesLoggerFactory()
     else:
         # format_exc_info is only needed for console development output
         processors.append(structlog.processors.format_exc_info)
         processors.append(structlog.dev.ConsoleRenderer())
+        logger_factory = structlog.WriteLoggerFactory()
 
-    # Configure structlog
+    # Configure structlog. The filtering bound logger turns calls below
+    # log_level into no-ops before any processor (timestamp, JSON) runs.
     structlog.configure(
         processors=processors,
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=logger_factory,
         cache_logger_on_first_use=True,
     )
 
 
 def get_logger(name: str | None = None) -> structlog.BoundLogger:
-    """Get a configured logger instance."""
-    logger: structlog.BoundLogger = structlog.get_logger(name)
+    """Get a configured logger instance.
+
+    Static application context (service, environment) is bound once as the
+    logger's initial values rather than added by a processor on every event.
+    Logging is configured on first use, so callers need not do it themselves.
+    """
+    configure_logging()
+    logger: structlog.BoundLogger = structlog.get_logger(
+        name,
+        service=settings.otel_service_name,
+        environment=settings.environment,
+    )
     return logger
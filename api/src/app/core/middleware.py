@@ -1,131 +1,107 @@
 """Request ID middleware for distributed tracing."""
 import time
-import uuid
-from collections.abc import Awaitable, Callable
 from contextvars import ContextVar
 
 import structlog
-from fastapi import Request, Response
-from opentelemetry.trace.status import Status, StatusCode
-from starlette.middleware.base import BaseHTTPMiddleware
+from opentelemetry import trace
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from app.core.fast_uuid import new_request_id
 from app.core.logging import get_logger
-from app.core.tracing import create_span, get_tracer
+from app.core.tracing import is_tracing_enabled
 
 # Context variable for storing request ID
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
 
 logger = get_logger(__name__)
-tracer = get_tracer(__name__)
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware:
     """Middleware to generate and track unique request IDs for distributed tracing.
 
     This middleware:
     - Generates a unique UUID4 for each incoming request
     - Adds the request ID to response headers as 'X-Request-ID'
     - Stores the request ID in contextvars for use throughout the request lifecycle
-    - Logs request start and completion with timing information
-    - Integrates with structlog's contextvars for automatic inclusion in all logs
-    - Creates OpenTelemetry spans for distributed tracing (when enabled)
+    - Logs one completion (or failure) event per request with timing information
+    - Scopes request_id in structlog's contextvars for automatic inclusion in all logs
+    - Tags the OpenTelemetry server span with the request ID (when enabled)
+
+    The HTTP server span itself comes from FastAPIInstrumentor (see
+    instrument_fastapi_app); this middleware does not start a second one.
+
+    Implemented as a pure ASGI middleware: unlike BaseHTTPMiddleware it does not
+    run the app in a separate task or build Request/Response objects, and the
+    request's contextvars stay visible to the endpoint.
     """
 
-    async def dispatch(
-        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Process incoming request with request ID generation and logging."""
-        # Generate unique request ID
-        request_id = str(uuid.uuid4())
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Generate unique request ID; the header value is encoded once up front
+        request_id = new_request_id()
+        request_id_bytes = request_id.encode("ascii")
 
         # Store in contextvar for use throughout request
         request_id_var.set(request_id)
 
-        # Bind to structlog context for automatic inclusion in all logs
-        structlog.contextvars.bind_contextvars(request_id=request_id)
-
-        # Create OpenTelemetry span if tracing is enabled
-        with create_span(
-            tracer,
-            f"{request.method} {request.url.path}",
-            **{
-                "http.method": request.method,
-                "http.url": str(request.url),
-                "http.route": request.url.path,
-                "request.id": request_id,
-                "user_agent.original": request.headers.get("user-agent", ""),
-            }
-        ) as span:
+        # Correlate the instrumentor's server span with logs and the response header
+        if is_tracing_enabled():
+            trace.get_current_span().set_attribute("request.id", request_id)
+
+        # Bind to structlog context for automatic inclusion in all logs; only the
+        # request_id key is reset on exit, leaving unrelated bindings untouched
+        with structlog.contextvars.bound_contextvars(request_id=request_id):
             # Record start time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
 
-            # Log request start
-            logger.info(
-                "Request started",
-                method=request.method,
-                path=request.url.path,
-                query_params=str(request.query_params) if request.query_params else None,
-            )
+            status_code = 500
+
+            async def send_wrapper(message: Message) -> None:
+                nonlocal status_code
+                if message["type"] == "http.response.start":
+                    status_code = message["status"]
+                    # Append the raw header tuple; no MutableHeaders scan or rebuild
+                    headers = list(message.get("headers", ()))
+                    headers.append((b"x-request-id", request_id_bytes))
+                    message["headers"] = headers
+                await send(message)
 
             try:
                 # Process request
-                response = await call_next(request)
-
-                # Add request ID to response headers
-                response.headers["X-Request-ID"] = request_id
-
-                # Calculate duration
-                duration_ms = round((time.time() - start_time) * 1000, 2)
-
-                # Update span with response information
-                span.set_attribute("http.status_code", response.status_code)
-                content_length = response.headers.get("content-length", "0")
-                try:
-                    response_size = int(content_length) if content_length else 0
-                except (ValueError, TypeError):
-                    response_size = 0
-                span.set_attribute("http.response.size", response_size)
-                span.set_attribute("request.duration_ms", duration_ms)
-
-                # Set span status based on HTTP status code
-                if response.status_code >= 400:
-                    span.set_status(Status(StatusCode.ERROR, f"HTTP {response.status_code}"))
-                else:
-                    span.set_status(Status(StatusCode.OK))
-
-                # Log request completion
-                logger.info(
-                    "Request completed",
-                    status_code=response.status_code,
-                    duration_ms=duration_ms,
-                )
-
-                return response
-
+                await self.app(scope, receive, send_wrapper)
             except Exception as exc:
-                # Calculate duration for error case
-                duration_ms = round((time.time() - start_time) * 1000, 2)
-
-                # Update span with error information
-                span.record_exception(exc)
-                span.set_attribute("request.duration_ms", duration_ms)
-                span.set_status(Status(StatusCode.ERROR, str(exc)))
-
                 # Log request error
                 logger.error(
                     "Request failed",
+                    method=scope["method"],
+                    path=scope["path"],
                     error=str(exc),
                     error_type=type(exc).__name__,
-                    duration_ms=duration_ms,
+                    duration_ms=round((time.perf_counter_ns() - start_ns) / 1e6, 2),
                     exc_info=True,
                 )
 
                 # Re-raise the exception
                 raise
 
-            finally:
-                # Clear contextvars for this request
-                structlog.contextvars.clear_contextvars()
+            # Log request completion; this single event carries the request line,
+            # so no separate start event is emitted
+            query_string = scope.get("query_string", b"")
+            logger.info(
+                "Request completed",
+                method=scope["method"],
+                path=scope["path"],
+                query_params=query_string.decode("latin-1") if query_string else None,
+                status_code=status_code,
+                duration_ms=round((time.perf_counter_ns() - start_ns) / 1e6, 2),
+            )
 
 
 def get_request_id() -> str:
@@ -0,0 +1,75 @@
+"""Time-ordered 64-bit (snowflake-style) ID generation."""
+import os
+import threading
+import time
+
+from app.core.config import settings
+
+# Bit layout: 41-bit millisecond timestamp | 10-bit worker id | 12-bit sequence.
+# The top bit stays clear so IDs fit a signed BIGINT column.
+WORKER_BITS = 10
+SEQUENCE_BITS = 12
+MAX_WORKER_ID = (1 << WORKER_BITS) - 1
+_MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+# Custom epoch (2025-01-01T00:00:00Z) so 41 bits of milliseconds last ~69 years
+EPOCH_MS = 1_735_689_600_000
+
+_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+
+
+def _resolve_worker_id() -> int:
+    """Use the configured worker id, or a random one when none is set."""
+    if settings.skid_worker_id is not None:
+        if not 0 <= settings.skid_worker_id <= MAX_WORKER_ID:
+            raise ValueError(f"SKID_WORKER_ID must be between 0 and {MAX_WORKER_ID}")
+        return settings.skid_worker_id
+    return int.from_bytes(os.urandom(2), "big") & MAX_WORKER_ID
+
+
+_worker_id = _resolve_worker_id()
+
+
+def _reset_after_fork() -> None:
+    """Give forked workers their own worker id and sequence state."""
+    global _worker_id, _last_ms, _sequence, _lock
+    _lock = threading.Lock()
+    _worker_id = _resolve_worker_id()
+    _last_ms = 0
+    _sequence = 0
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def next_skid() -> int:
+    """Generate the next 64-bit time-ordered ID.
+
+    IDs from one process are strictly increasing. If the clock steps back or
+    the 4096 IDs of a millisecond are used up, the timestamp is carried
+    forward from the last ID instead of waiting.
+
+    Without SKID_WORKER_ID, each process draws a random worker id, so
+    processes writing the same table should be given distinct ids.
+
+    Returns:
+        int: Positive ID that fits a signed BIGINT column
+    """
+    global _last_ms, _sequence
+    with _lock:
+        now_ms = time.time_ns() // 1_000_000 - EPOCH_MS
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _sequence = 0
+        elif _sequence < _MAX_SEQUENCE:
+            _sequence += 1
+        else:
+            _last_ms += 1
+            _sequence = 0
+        return (
+            (_last_ms << (WORKER_BITS + SEQUENCE_BITS))
+            | (_worker_id << SEQUENCE_BITS)
+            | _sequence
+        )
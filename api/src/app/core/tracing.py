@@ -1,14 +1,17 @@
 """OpenTelemetry configuration and utilities."""
 import functools
 import os
+import random
 from typing import Any, Callable, TypeVar
 
+from grpc import Compression
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
 from opentelemetry.trace.status import Status, StatusCode
 
 from app.core.config import settings
@@ -17,7 +20,7 @@ from app.core.config import settings
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def is_tracing_enabled() -> bool:
+def _compute_tracing_enabled() -> bool:
     """Check if tracing should be enabled.
 
     Tracing is disabled during tests and when explicitly disabled in config.
@@ -30,9 +33,21 @@ def is_tracing_enabled() -> bool:
     return settings.otel_enabled
 
 
+# Resolved once at import (and again by configure_tracing) so spans and
+# decorators do not probe os.environ on every call
+_TRACING_ENABLED = _compute_tracing_enabled()
+
+
+def is_tracing_enabled() -> bool:
+    """Check if tracing is enabled for this process."""
+    return _TRACING_ENABLED
+
+
 def configure_tracing() -> None:
     """Configure OpenTelemetry tracing if enabled."""
-    if not is_tracing_enabled():
+    global _TRACING_ENABLED
+    _TRACING_ENABLED = _compute_tracing_enabled()
+    if not _TRACING_ENABLED:
         return
 
     # Create resource with service information
@@ -44,16 +59,28 @@ def configure_tracing() -> None:
         "service.instance.id": f"{settings.otel_service_name}-1",
     })
 
-    # Configure tracer provider
-    tracer_provider = TracerProvider(resource=resource)
+    # Configure tracer provider. Head sampling drops unsampled traces before any
+    # span data is recorded; ParentBased keeps upstream sampling decisions intact.
+    tracer_provider = TracerProvider(
+        resource=resource,
+        sampler=ParentBased(TraceIdRatioBased(settings.otel_sample_ratio)),
+    )
 
-    # Add OTLP exporter for Jaeger
+    # Add OTLP exporter for Jaeger; gzip keeps each export batch small on the wire
     otlp_exporter = OTLPSpanExporter(
         endpoint=settings.otel_exporter_otlp_endpoint,
         insecure=settings.otel_exporter_insecure,
-        headers={}
+        headers={},
+        compression=Compression.Gzip,
+    )
+    # Larger queue and batches with a shorter delay so export keeps up with span
+    # production under load instead of dropping spans from a full queue
+    span_processor = BatchSpanProcessor(
+        otlp_exporter,
+        max_queue_size=8192,
+        max_export_batch_size=1024,
+        schedule_delay_millis=2000,
     )
-    span_processor = BatchSpanProcessor(otlp_exporter)
     tracer_provider.add_span_processor(span_processor)
 
     # Set the tracer provider
@@ -67,22 +94,27 @@ def get_tracer(name: str) -> trace.Tracer:
 
 def instrument_fastapi_app(app: Any) -> None:
     """Instrument FastAPI app with OpenTelemetry if tracing is enabled."""
-    if not is_tracing_enabled():
+    if not _TRACING_ENABLED:
         return
 
     FastAPIInstrumentor.instrument_app(app)
 
 
 def create_span(tracer: trace.Tracer, name: str, **attributes: Any) -> Any:
-    """Create a span if tracing is enabled, otherwise return a no-op context manager."""
-    if not is_tracing_enabled():
-        return _NoOpSpan()
+    """Create a span if tracing is enabled, otherwise return a no-op context manager.
+
+    The span is made current for the duration of the ``with`` block, so spans
+    started inside it (e.g. traced repository calls) become its children.
+    Attribute values are passed through with their native types; None values
+    are dropped. Exceptions escaping the block are recorded on the span.
+    """
+    if not _TRACING_ENABLED:
+        return NOOP_SPAN
 
-    span = tracer.start_span(name)
-    for key, value in attributes.items():
-        if value is not None:
-            span.set_attribute(key, str(value))
-    return span
+    return tracer.start_as_current_span(
+        name,
+        attributes={key: value for key, value in attributes.items() if value is not None},
+    )
 
 
 # Tracing Decorators
@@ -90,6 +122,7 @@ def create_span(tracer: trace.Tracer, name: str, **attributes: Any) -> Any:
 def trace_async(
     span_name: str | None = None,
     tracer_name: str | None = None,
+    sample_rate: float = 1.0,
     **span_attributes: Any
 ) -> Callable[[F], F]:
     """Decorator to trace async functions with OpenTelemetry spans.
@@ -97,38 +130,50 @@ def trace_async(
     Args:
         span_name: Custom span name. If None, uses module.function_name
         tracer_name: Custom tracer name. If None, uses function's module
+        sample_rate: Fraction of calls that get a span when the current
+            context is not already sampled. Calls inside a sampled trace are
+            always traced. Defaults to 1.0 (every call)
         **span_attributes: Additional span attributes to set
     
     Example:
         @trace_async("cache.check_connection", cache_type="redis")
         async def check_cache_connection() -> bool:
-            return await cache_client.ping()
+            return await get_client().ping()
     """
     def decorator(func: F) -> F:
-        if not is_tracing_enabled():
-            return func
+        # Always wrap: the tracer is a proxy until configure_tracing() installs
+        # the SDK provider, and unsampled or disabled spans are cheap no-ops.
+        # Resolve tracer, span name and attributes once at decoration time
+        tracer = get_tracer(tracer_name or func.__module__)
+        name = span_name or f"{func.__module__}.{func.__name__}"
+        attributes = {
+            key: value for key, value in span_attributes.items() if value is not None
+        }
             
         @functools.wraps(func)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            tracer = get_tracer(tracer_name or func.__module__)
-            name = span_name or f"{func.__module__}.{func.__name__}"
-            
-            with tracer.start_span(name) as span:
-                # Set provided attributes
-                for key, value in span_attributes.items():
-                    if value is not None:
-                        span.set_attribute(key, str(value))
-                
-                try:
-                    result = await func(*args, **kwargs)
-                    span.set_status(Status(StatusCode.OK))
-                    return result
-                except Exception as exc:
-                    span.record_exception(exc)
-                    span.set_status(Status(StatusCode.ERROR, str(exc)))
-                    raise
-        
-        return async_wrapper  # type: ignore
+            # The span is current while func runs, so nested spans become its
+            # children; escaping exceptions are recorded and mark it as ERROR
+            with tracer.start_as_current_span(name, attributes=attributes) as span:
+                result = await func(*args, **kwargs)
+                span.set_status(Status(StatusCode.OK))
+                return result
+
+        if sample_rate >= 1.0:
+            return async_wrapper  # type: ignore
+
+        @functools.wraps(func)
+        async def sampled_wrapper(*args: Any, **kwargs: Any) -> Any:
+            # Hot reads skip span creation entirely unless they run inside a
+            # sampled trace or win the local coin flip
+            if (
+                not trace.get_current_span().get_span_context().trace_flags.sampled
+                and random.random() >= sample_rate
+            ):
+                return await func(*args, **kwargs)
+            return await async_wrapper(*args, **kwargs)
+
+        return sampled_wrapper  # type: ignore
     return decorator
 
 
@@ -150,38 +195,37 @@ def trace_sync(
             return {"host": "localhost", "port": 5432}
     """
     def decorator(func: F) -> F:
-        if not is_tracing_enabled():
-            return func
+        # Always wrap: the tracer is a proxy until configure_tracing() installs
+        # the SDK provider, and unsampled or disabled spans are cheap no-ops.
+        # Resolve tracer, span name and attributes once at decoration time
+        tracer = get_tracer(tracer_name or func.__module__)
+        name = span_name or f"{func.__module__}.{func.__name__}"
+        attributes = {
+            key: value for key, value in span_attributes.items() if value is not None
+        }
             
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            tracer = get_tracer(tracer_name or func.__module__)
-            name = span_name or f"{func.__module__}.{func.__name__}"
-            
-            with tracer.start_span(name) as span:
-                # Set provided attributes
-                for key, value in span_attributes.items():
-                    if value is not None:
-                        span.set_attribute(key, str(value))
-                
-                try:
-                    result = func(*args, **kwargs)
-                    span.set_status(Status(StatusCode.OK))
-                    return result
-                except Exception as exc:
-                    span.record_exception(exc)
-                    span.set_status(Status(StatusCode.ERROR, str(exc)))
-                    raise
+            # The span is current while func runs, so nested spans become its
+            # children; escaping exceptions are recorded and mark it as ERROR
+            with tracer.start_as_current_span(name, attributes=attributes) as span:
+                result = func(*args, **kwargs)
+                span.set_status(Status(StatusCode.OK))
+                return result
         
         return sync_wrapper  # type: ignore
     return decorator
 
 
-def trace_database(operation: str | None = None) -> Callable[[F], F]:
+def trace_database(
+    operation: str | None = None, sample_rate: float = 1.0
+) -> Callable[[F], F]:
     """Specialized decorator for database operations.
     
     Args:
         operation: Database operation type. If None, uses function name
+        sample_rate: Fraction of calls traced outside a sampled trace (see
+            trace_async). Use a low rate for high-QPS reads; keep writes at 1.0
     
     Example:
         @trace_database()
@@ -193,6 +237,7 @@ def trace_database(operation: str | None = None) -> Callable[[F], F]:
         op_name = operation or func.__name__
         return trace_async(
             span_name=op_name,
+            sample_rate=sample_rate,
             **{
                 "db.operation": op_name,
                 "db.system": "postgresql",
@@ -244,3 +289,7 @@ class _NoOpSpan:
 
     def record_exception(self, exception: Exception) -> None:
         pass
+
+
+# Shared no-op span; it is stateless so one instance serves every caller
+NOOP_SPAN = _NoOpSpan()
@@ -1,7 +1,7 @@
 """Database models."""
 
 from app.models.api_key import APIKey
-from app.models.base import Base, TimestampMixin, UUIDMixin
+from app.models.base import Base, SKIDMixin, TimestampMixin, UUIDMixin
 from app.models.dependency import Dependency
 from app.models.organization import Organization
 from app.models.package import Package
@@ -9,6 +9,7 @@ from app.models.repository import Repository
 
 __all__ = [
     "Base",
+    "SKIDMixin",
     "TimestampMixin",
     "UUIDMixin",
     "APIKey",
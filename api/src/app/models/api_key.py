@@ -1,9 +1,10 @@
 """API Key model for authentication and rate limiting."""
 
+import hashlib
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import DateTime, Enum as SQLEnum, Index, Integer, String
+from sqlalchemy import DateTime, Enum as SQLEnum, Index, Integer, LargeBinary, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.models.base import Base, TimestampMixin, UUIDMixin, generate_repr
@@ -17,12 +18,22 @@ class TierEnum(str, Enum):
     PREMIUM = "premium"
 
 
+def hash_api_key(raw_key: str) -> bytes:
+    """Hash a raw API key for storage and lookup in APIKey.key_hash.
+
+    Returns the raw 32-byte SHA-256 digest rather than its 64-character hex
+    form, which halves the width of the key_hash index. hashlib uses
+    OpenSSL, which picks the SHA-NI/ARMv8 SHA instructions when available.
+    """
+    return hashlib.sha256(raw_key.encode()).digest()
+
+
 class APIKey(Base, UUIDMixin, TimestampMixin):
     """API key for authentication and rate limiting.
     
     Attributes:
         id: Primary key UUID
-        key_hash: Hashed API key (SHA-256)
+        key_hash: Raw SHA-256 digest of the API key (see hash_api_key)
         name: Friendly name for the key
         tier: Tier level (free, standard, premium)
         rate_limit: Requests per hour limit
@@ -34,7 +45,7 @@ class APIKey(Base, UUIDMixin, TimestampMixin):
 
     __tablename__ = "api_keys"
 
-    key_hash: Mapped[str] = mapped_column(String(255), nullable=False, unique=True)
+    key_hash: Mapped[bytes] = mapped_column(LargeBinary(32), nullable=False)
     name: Mapped[str | None] = mapped_column(String(255), nullable=True)
     tier: Mapped[TierEnum] = mapped_column(
         SQLEnum(TierEnum, native_enum=True),
@@ -45,7 +56,7 @@ class APIKey(Base, UUIDMixin, TimestampMixin):
     expires_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
     last_used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
 
-    # Indexes
-    __table_args__ = (Index("idx_api_keys_key_hash", "key_hash"),)
+    # Indexes (the unique index doubles as the uniqueness constraint)
+    __table_args__ = (Index("idx_api_keys_key_hash", "key_hash", unique=True),)
 
     __repr__ = generate_repr("id", "name", "tier")
@@ -1,11 +1,44 @@
 """Base model classes and mixins for SQLAlchemy models."""
 
+import operator
 import uuid
-from datetime import datetime
-from typing import Any
-
-from sqlalchemy import DateTime, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, TypeVar
+
+from sqlalchemy import (
+    BigInteger,
+    DateTime,
+    Dialect,
+    Index,
+    SmallInteger,
+    Table,
+    TypeDecorator,
+    event,
+    func,
+)
+from sqlalchemy.orm import (
+    DeclarativeBase,
+    Mapped,
+    ORMExecuteState,
+    Session,
+    mapped_column,
+    with_loader_criteria,
+)
+
+from app.core.skid import next_skid
+
+E = TypeVar("E", bound=Enum)
+
+
+def utc_now() -> datetime:
+    """Current UTC time, used as the client-side default for timestamp columns.
+
+    Generating timestamps in Python means inserts need no RETURNING to learn
+    them, so bulk inserts stay on the batched executemany path.
+    """
+    return datetime.now(timezone.utc)
 
 
 class Base(DeclarativeBase):
@@ -17,49 +50,139 @@ class Base(DeclarativeBase):
 class TimestampMixin:
     """Mixin that adds created_at and updated_at timestamp columns."""
 
-    @declared_attr
-    def created_at(cls) -> Mapped[datetime]:
-        """Timestamp when the record was created."""
-        return mapped_column(
-            DateTime(timezone=True),
-            nullable=False,
-            server_default=func.now(),
-        )
+    # Timestamp when the record was created
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+        server_default=func.now(),  # Backstop for raw SQL inserts
+    )
 
-    @declared_attr
-    def updated_at(cls) -> Mapped[datetime]:
-        """Timestamp when the record was last updated."""
-        return mapped_column(
-            DateTime(timezone=True),
-            nullable=False,
-            server_default=func.now(),
-            onupdate=func.now(),
-        )
+    # Timestamp when the record was last updated
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=utc_now,
+        server_default=func.now(),  # Backstop for raw SQL inserts
+        onupdate=utc_now,
+    )
 
 
 class SoftDeleteMixin:
-    """Mixin that adds soft delete functionality with deleted_at timestamp."""
-
-    @declared_attr
-    def deleted_at(cls) -> Mapped[datetime | None]:
-        """Timestamp when the record was soft-deleted. None if not deleted."""
-        return mapped_column(
-            DateTime(timezone=True),
-            nullable=True,
-            default=None,
+    """Mixin that adds soft delete functionality with deleted_at timestamp.
+
+    ORM SELECTs through an AppSession skip soft-deleted rows unless executed
+    with the option include_deleted=True, and each table gets a partial primary key index
+    over its live rows (idx_<table>_alive).
+    """
+
+    # Timestamp when the record was soft-deleted. None if not deleted.
+    deleted_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+        default=None,
+    )
+
+
+@event.listens_for(SoftDeleteMixin, "instrument_class", propagate=True)
+def _add_alive_index(mapper: Any, cls: type) -> None:
+    """Index the live rows of each soft-delete table (Postgres partial index)."""
+    table: Table = cls.__table__  # type: ignore[attr-defined]
+    Index(
+        f"idx_{table.name}_alive",
+        table.c.id,
+        postgresql_where=table.c.deleted_at.is_(None),
+    )
+
+
+class AppSession(Session):
+    """Session class for the application's session factories.
+
+    Carries the soft-delete SELECT criteria below, so sessions created
+    elsewhere (plain Session/AsyncSession) are left untouched. Repositories
+    filter deleted_at themselves and do not depend on it.
+    """
+
+
+@event.listens_for(AppSession, "do_orm_execute")
+def _exclude_soft_deleted(execute_state: ORMExecuteState) -> None:
+    """Add the deleted_at IS NULL criteria once per top-level ORM SELECT.
+
+    SQLAlchemy carries it into eager relationship loads of the same statement.
+    """
+    if (
+        execute_state.is_select
+        and not execute_state.is_column_load
+        and not execute_state.is_relationship_load
+        and not execute_state.execution_options.get("include_deleted", False)
+    ):
+        execute_state.statement = execute_state.statement.options(
+            with_loader_criteria(
+                SoftDeleteMixin,
+                lambda cls: cls.deleted_at.is_(None),
+                include_aliases=True,
+            )
         )
 
 
 class UUIDMixin:
-    """Mixin that adds a UUID primary key."""
-
-    @declared_attr
-    def id(cls) -> Mapped[uuid.UUID]:
-        """Primary key UUID."""
-        return mapped_column(
-            primary_key=True,
-            default=uuid.uuid4,
-        )
+    """Mixin that adds a time-ordered UUID primary key.
+
+    UUIDv7 values lead with a millisecond timestamp, so new rows land at the
+    right edge of the primary key B-tree instead of at random pages.
+    """
+
+    # Primary key UUID (version 7)
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=uuid.uuid7,
+    )
+
+
+class SKIDMixin:
+    """Mixin that adds a time-ordered 64-bit integer primary key.
+
+    Half the width of a UUID key, for internal tables that are never
+    addressed from outside the API (see app.core.skid for the layout).
+    """
+
+    # Primary key snowflake ID
+    id: Mapped[int] = mapped_column(
+        BigInteger,
+        primary_key=True,
+        autoincrement=False,
+        default=next_skid,
+    )
+
+
+class SmallIntEnum(TypeDecorator[E]):
+    """Store a Python enum as a SMALLINT code instead of a native ENUM.
+
+    Two bytes on disk and integer comparisons in indexes and joins. The
+    code mapping is part of the schema: never renumber existing members.
+    Bind values may be enum members or their raw values (e.g. "dev").
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class: type[E], codes: Mapping[E, int]) -> None:
+        super().__init__()
+        self.enum_class = enum_class
+        # Stored as a tuple so the type stays hashable for the statement cache
+        self.codes = tuple(codes.items())
+        self._to_code = dict(self.codes)
+        self._from_code = {code: member for member, code in self.codes}
+
+    def process_bind_param(self, value: E | Any | None, dialect: Dialect) -> int | None:
+        if value is None:
+            return None
+        return self._to_code[self.enum_class(value)]
+
+    def process_result_value(self, value: int | None, dialect: Dialect) -> E | None:
+        if value is None:
+            return None
+        return self._from_code[value]
 
 
 def generate_repr(*attrs: str) -> Any:
@@ -75,9 +198,22 @@ def generate_repr(*attrs: str) -> Any:
         __repr__ = generate_repr("id", "name", "email")
     """
 
-    def __repr__(self: Any) -> str:
-        class_name = self.__class__.__name__
-        attr_strs = [f"{attr}={getattr(self, attr)!r}" for attr in attrs]
-        return f"{class_name}({', '.join(attr_strs)})"
+    # Build the format string and C-level getter once, so each call is a single
+    # attrgetter call plus one %-interpolation
+    template = "%s(" + ", ".join(f"{attr}=%r" for attr in attrs) + ")"
+
+    if not attrs:
+        def _repr(self: Any) -> str:
+            return template % type(self).__name__
+    elif len(attrs) == 1:
+        get_value = operator.attrgetter(attrs[0])
+
+        def _repr(self: Any) -> str:
+            return template % (type(self).__name__, get_value(self))
+    else:
+        get_values = operator.attrgetter(*attrs)
+
+        def _repr(self: Any) -> str:
+            return template % (type(self).__name__, *get_values(self))
 
-    return __repr__
+    return _repr
@@ -5,10 +5,17 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, Index, String, func
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.models.base import Base, TimestampMixin, UUIDMixin, generate_repr
+from app.models.base import (
+    Base,
+    SKIDMixin,
+    SmallIntEnum,
+    TimestampMixin,
+    generate_repr,
+    utc_now,
+)
 
 if TYPE_CHECKING:
     from app.models.package import Package
@@ -20,18 +27,28 @@ class DependencyTypeEnum(str, Enum):
 
     DIRECT = "direct"
     DEV = "dev"
+    OPTIONAL = "optional"
     PEER = "peer"
 
 
-class Dependency(Base, UUIDMixin, TimestampMixin):
+# Stored SMALLINT codes; part of the schema, so never renumber existing members
+DEPENDENCY_TYPE_CODES = {
+    DependencyTypeEnum.DIRECT: 1,
+    DependencyTypeEnum.DEV: 2,
+    DependencyTypeEnum.OPTIONAL: 3,
+    DependencyTypeEnum.PEER: 4,
+}
+
+
+class Dependency(Base, SKIDMixin, TimestampMixin):
     """Junction table linking repositories to packages they depend on.
     
     Attributes:
-        id: Primary key UUID
+        id: Time-ordered 64-bit primary key
         repository_id: Foreign key to repositories table
         package_id: Foreign key to packages table
         version: Package version string
-        dependency_type: Type of dependency (direct, dev, peer)
+        dependency_type: Type of dependency (direct, dev, optional, peer), stored as SMALLINT
         detected_at: Timestamp when dependency was detected
         created_at: Record creation timestamp
         updated_at: Record last update timestamp
@@ -51,30 +68,47 @@ class Dependency(Base, UUIDMixin, TimestampMixin):
     )
     version: Mapped[str | None] = mapped_column(String(50), nullable=True)
     dependency_type: Mapped[DependencyTypeEnum | None] = mapped_column(
-        SQLEnum(DependencyTypeEnum, native_enum=True),
+        SmallIntEnum(DependencyTypeEnum, DEPENDENCY_TYPE_CODES),
         nullable=True,
     )
     detected_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        server_default=func.now(),
+        default=utc_now,
+        server_default=func.now(),  # Backstop for raw SQL inserts
     )
 
-    # Relationships
+    # Relationships (many-to-one, so each loads in one batched IN query per
+    # result set instead of one query per row)
     repository: Mapped[Repository] = relationship(
         "Repository",
         back_populates="dependencies",
+        lazy="selectin",
     )
     package: Mapped[Package] = relationship(
         "Package",
         back_populates="dependencies",
+        lazy="selectin",
     )
 
-    # Indexes
+    # Indexes. repository_id lookups use the leading column of the unique
+    # index, which also carries the listed columns so per-repository
+    # dependency listings can be index-only scans on Postgres.
     __table_args__ = (
-        Index("idx_dependencies_repo_id", "repository_id"),
         Index("idx_dependencies_package_id", "package_id"),
-        Index("idx_dependencies_repo_package", "repository_id", "package_id", unique=True),
+        Index(
+            "idx_dependencies_repo_package",
+            "repository_id",
+            "package_id",
+            unique=True,
+            postgresql_include=["version", "dependency_type", "detected_at"],
+        ),
+        CheckConstraint(
+            "dependency_type IN ({})".format(
+                ", ".join(str(code) for code in sorted(DEPENDENCY_TYPE_CODES.values()))
+            ),
+            name="ck_dependencies_dependency_type",
+        ),
     )
 
     __repr__ = generate_repr("id", "repository_id", "package_id", "version")
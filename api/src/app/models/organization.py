@@ -46,6 +46,13 @@ class Organization(Base, UUIDMixin, TimestampMixin, SoftDeleteMixin):
     )
 
     # Indexes
-    __table_args__ = (Index("idx_organizations_name", "name"),)
+    __table_args__ = (
+        Index("idx_organizations_name", "name"),
+        Index(
+            "idx_organizations_name_pattern",
+            "name",
+            postgresql_ops={"name": "varchar_pattern_ops"},
+        ),
+    )
 
     __repr__ = generate_repr("id", "name")
@@ -1,9 +1,11 @@
 """Package model for dependency packages."""
 
-from typing import TYPE_CHECKING
+import hashlib
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Index, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import BigInteger, Index, String, Text
+from sqlalchemy.engine.interfaces import ExecutionContext
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
 from app.models.base import Base, TimestampMixin, UUIDMixin, generate_repr
 
@@ -11,6 +13,24 @@ if TYPE_CHECKING:
     from app.models.dependency import Dependency
 
 
+def package_name_key(ecosystem: str, name: str) -> int:
+    """Deterministic signed 64-bit key for an (ecosystem, name) pair.
+
+    Uniqueness is enforced on this 8-byte key instead of the two wide string
+    columns. Part of the schema: stored values depend on it never changing.
+    """
+    # NUL cannot occur in either column (Postgres text rejects it), so two
+    # distinct pairs never join to the same bytes
+    digest = hashlib.blake2b(f"{ecosystem}\0{name}".encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big", signed=True)
+
+
+def _name_key_default(context: ExecutionContext) -> int:
+    """Column default so Core and bulk inserts get name_key too."""
+    params = context.get_current_parameters()
+    return package_name_key(params["ecosystem"], params["name"])
+
+
 class Package(Base, UUIDMixin, TimestampMixin):
     """Represents a software package (npm, PyPI, RubyGems, etc.).
     
@@ -18,7 +38,8 @@ class Package(Base, UUIDMixin, TimestampMixin):
         id: Primary key UUID
         name: Package name (e.g., "fastapi", "react")
         ecosystem: Package ecosystem (e.g., "npm", "pypi", "rubygems")
-        description: Package description
+        name_key: 64-bit hash of (ecosystem, name), unique (see package_name_key)
+        description: Package description (deferred, not loaded by default)
         repository_url: Source code repository URL
         homepage_url: Project homepage URL
         latest_version: Latest version string
@@ -31,7 +52,12 @@ class Package(Base, UUIDMixin, TimestampMixin):
 
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     ecosystem: Mapped[str] = mapped_column(String(50), nullable=False)
-    description: Mapped[str | None] = mapped_column(Text, nullable=True)
+    name_key: Mapped[int] = mapped_column(BigInteger, nullable=False, default=_name_key_default)
+    # Deferred: long descriptions live in TOAST pages that list queries never
+    # need. Load them with options=[undefer(Package.description)].
+    description: Mapped[str | None] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group="body"
+    )
     repository_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     homepage_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     latest_version: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -43,9 +69,39 @@ class Package(Base, UUIDMixin, TimestampMixin):
         cascade="all, delete-orphan",
     )
 
-    # Indexes
+    # Indexes. The 8-byte name_key index enforces (ecosystem, name)
+    # uniqueness; exact and prefix lookups by name use the pattern-ops index.
     __table_args__ = (
-        Index("idx_packages_name_ecosystem", "name", "ecosystem", unique=True),
+        Index("idx_packages_name_key", "name_key", unique=True),
+        Index(
+            "idx_packages_ecosystem_name_pattern",
+            "ecosystem",
+            "name",
+            postgresql_ops={"ecosystem": "varchar_pattern_ops", "name": "varchar_pattern_ops"},
+        ),
     )
 
+    @validates("name", "ecosystem")
+    def _sync_name_key(self, key: str, value: Any) -> Any:
+        """Keep name_key in step when name or ecosystem is set on an instance."""
+        name = value if key == "name" else self.__dict__.get("name")
+        ecosystem = value if key == "ecosystem" else self.__dict__.get("ecosystem")
+        if name is not None and ecosystem is not None:
+            self.name_key = package_name_key(ecosystem, name)
+        return value
+
+    # Columns derive_update_values() reads together; BaseRepository fills in
+    # the ones an UPDATE leaves out from the current row
+    derive_update_sources = ("ecosystem", "name")
+
+    @staticmethod
+    def derive_update_values(values: dict[str, Any]) -> None:
+        """Add name_key to UPDATE values that set name and ecosystem.
+
+        Repository UPDATEs bypass _sync_name_key, so BaseRepository calls
+        this on their values to keep the unique key in step with the row.
+        """
+        if "name" in values and "ecosystem" in values:
+            values["name_key"] = package_name_key(values["ecosystem"], values["name"])
+
     __repr__ = generate_repr("id", "name", "ecosystem")
@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base, TimestampMixin, UUIDMixin, generate_repr
@@ -56,10 +56,16 @@ class Repository(Base, UUIDMixin, TimestampMixin):
         cascade="all, delete-orphan",
     )
 
-    # Indexes
+    # Indexes. Declared dialect-neutral, since SQLite rejects NULLS LAST in
+    # indexes; the NULLS LAST that PostgreSQL needs for DESC order lives in
+    # migration 001.
     __table_args__ = (
-        Index("idx_repositories_org_id", "organization_id"),
-        Index("idx_repositories_stars", "stars"),
+        Index("idx_repositories_org_stars", "organization_id", text("stars DESC")),
+        Index(
+            "idx_repositories_stars",
+            text("stars DESC"),
+            postgresql_include=["name", "organization_id"],
+        ),
     )
 
     __repr__ = generate_repr("id", "name", "organization_id")
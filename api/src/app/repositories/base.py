@@ -1,13 +1,24 @@
+import functools
+import itertools
+import logging
 import uuid
+from collections.abc import AsyncIterator, Iterable, Sequence
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
-from typing import Any, Generic, Optional, TypeVar, Union, cast
+from typing import Any, Generic, Literal, Optional, Self, TypeVar, Union, cast, overload
 
-from sqlalchemy import and_, select, update, func, CursorResult
+from asyncpg import PostgresError
+from sqlalchemy import (
+    Select, and_, bindparam, delete, insert, inspect, select, text, tuple_, update, func,
+    CursorResult
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, raiseload
+from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.engine import Result
 
+from app.core.config import settings
 from app.core.logging import get_logger
 from app.core.tracing import trace_database
 
@@ -22,6 +33,102 @@ ModelType = TypeVar("ModelType", bound=DeclarativeBase)
 logger = get_logger(__name__)
 
 
+# ============================================================================
+# STATEMENT TEMPLATES
+# ============================================================================
+# Primary-key lookups and counts have the same shape for every call on a
+# model, so they are built once per model (with a bound parameter) and shared
+# by every repository instance. Reusing the same statement object skips
+# per-call construction and keeps the engine's compiled cache hit cheap; only
+# the parameter value changes. UPDATEs are not templated: bound parameters
+# there defeat the session's in-memory "evaluate" sync.
+#
+# SELECTs filter soft-deleted rows themselves rather than relying on the
+# AppSession criteria (see app.models.base), so a repository built on any
+# other session still hides them.
+
+
+def _exclude_deleted(
+    query: Select[Any], model: type[DeclarativeBase], include_deleted: bool
+) -> Select[Any]:
+    """Add deleted_at IS NULL unless include_deleted is set or model has no deleted_at."""
+    if not include_deleted and hasattr(model, 'deleted_at'):
+        query = query.where(getattr(model, 'deleted_at').is_(None))
+    return query
+
+
+@functools.lru_cache(maxsize=256)
+def _get_by_id_statement(model: type[DeclarativeBase], include_deleted: bool) -> Select[Any]:
+    """SELECT by primary key (``entity_id`` parameter), skipping soft-deleted rows."""
+    query = select(model).where(getattr(model, 'id') == bindparam("entity_id"))
+    return _exclude_deleted(query, model, include_deleted)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_many_statement(model: type[DeclarativeBase], include_deleted: bool) -> Select[Any]:
+    """SELECT by a list of primary keys (expanding ``entity_ids`` parameter)."""
+    query = select(model).where(
+        getattr(model, 'id').in_(bindparam("entity_ids", expanding=True))
+    )
+    return _exclude_deleted(query, model, include_deleted)
+
+
+@functools.lru_cache(maxsize=256)
+def _count_statement(model: type[DeclarativeBase], include_deleted: bool) -> Select[Any]:
+    """SELECT COUNT(*) over the table, skipping soft-deleted rows.
+
+    COUNT(*) rather than COUNT(id) leaves the planner free to count from the
+    smallest index (e.g. the partial idx_<table>_alive) without NULL checks.
+    """
+    return _exclude_deleted(select(func.count()).select_from(model), model, include_deleted)
+
+
+@functools.lru_cache(maxsize=256)
+def _lazy_relationships(model: type[DeclarativeBase]) -> tuple[tuple[str, Any], ...]:
+    """(key, attribute) of each relationship mapped with the default lazy="select".
+
+    Relationships mapped with an eager strategy (e.g. lazy="selectin") are
+    left out, so raiseload never replaces them.
+    """
+    return tuple(
+        (relationship.key, relationship.class_attribute)
+        for relationship in inspect(model).relationships
+        if relationship.lazy == "select"
+    )
+
+
+def _strategy_keys(options: Sequence[ExecutableOption]) -> set[str]:
+    """Keys of the top-level relationships that loader options set a strategy for."""
+    keys = set()
+    for option in options:
+        for element in getattr(option, 'context', ()):
+            path = element.path.path
+            if len(path) > 1 and getattr(element, 'strategy', None):
+                keys.add(path[1].key)
+    return keys
+
+
+# Planner row estimate from the catalog, refreshed by VACUUM/ANALYZE. reltuples
+# is -1 for a table that has never been vacuumed or analyzed (PostgreSQL 14+)
+_APPROX_COUNT = text("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:table)")
+
+
+class _DefaultContext:
+    """Stand-in for the execution context passed to column default callables.
+    
+    Lets context-sensitive defaults (e.g. Package.name_key) run for rows that
+    are written with COPY instead of a compiled INSERT.
+    """
+    
+    __slots__ = ("current_parameters",)
+    
+    def __init__(self, parameters: dict[str, Any]) -> None:
+        self.current_parameters = parameters
+    
+    def get_current_parameters(self, isolate_multiinsert_groups: bool = True) -> dict[str, Any]:
+        return self.current_parameters
+
+
 # ============================================================================
 # CUSTOM EXCEPTION HIERARCHY
 # ============================================================================
@@ -64,11 +171,28 @@ class ConflictError(RepositoryError):
     pass
 
 
+# PostgreSQL unique_violation, as exposed on asyncpg errors and on SQLAlchemy's
+# asyncpg DBAPI adapter; SQLite reports extended result code names instead
+_UNIQUE_VIOLATION_SQLSTATE = "23505"
+_SQLITE_UNIQUE_ERRORS = frozenset({"SQLITE_CONSTRAINT_UNIQUE", "SQLITE_CONSTRAINT_PRIMARYKEY"})
+
+
+def _is_unique_violation(error: Exception) -> bool:
+    """Whether a database error is a unique constraint violation, by error code."""
+    orig = getattr(error, "orig", error)
+    if getattr(orig, "sqlstate", None) == _UNIQUE_VIOLATION_SQLSTATE:
+        return True
+    if getattr(orig, "pgcode", None) == _UNIQUE_VIOLATION_SQLSTATE:
+        return True
+    return getattr(orig, "sqlite_errorname", None) in _SQLITE_UNIQUE_ERRORS
+
+
 # ============================================================================
 # PAGINATION SUPPORT
 # ============================================================================
-# These classes implement offset/limit pagination with validation to prevent
-# common errors like requesting too many records or negative offsets.
+# These classes implement offset/limit and cursor (keyset) pagination with
+# validation to prevent common errors like requesting too many records or
+# negative offsets.
 
 
 
@@ -86,6 +210,9 @@ class PaginationParams:
         ValueError: If offset is negative or limit is out of range
     """
     
+    # Built per request; slots avoid a per-instance __dict__
+    __slots__ = ("offset", "limit")
+    
     def __init__(self, offset: int = 0, limit: int = 50) -> None:
         if offset < 0:
             raise ValueError("Offset must be non-negative")
@@ -111,6 +238,8 @@ class PaginatedResult(Generic[ModelType]):
         has_prev: Boolean indicating if previous pages exist before this one
     """
     
+    __slots__ = ("items", "total", "offset", "limit", "has_next", "has_prev")
+    
     def __init__(
         self, 
         items: list[ModelType], 
@@ -127,6 +256,62 @@ class PaginatedResult(Generic[ModelType]):
         self.has_prev = offset > 0
 
 
+class CursorPaginationParams:
+    """Cursor (keyset) pagination parameters for list operations.
+    
+    Pages are read in primary key order starting after the given cursor, so
+    each page is an index range scan instead of skipping `offset` rows, and
+    no total COUNT(*) is needed. Time-ordered keys (UUIDv7, SKID) make this
+    creation order.
+    
+    Attributes:
+        after: Primary key of the last entity of the previous page, or None
+            for the first page
+        limit: Number of records to return (default: 50, must be 1-1000)
+    
+    Raises:
+        ValueError: If limit is out of range
+    """
+    
+    __slots__ = ("after", "limit")
+    
+    def __init__(self, after: Union[uuid.UUID, str, int, None] = None, limit: int = 50) -> None:
+        if limit <= 0 or limit > 1000:
+            raise ValueError("Limit must be between 1 and 1000")
+        
+        self.after = after
+        self.limit = limit
+
+
+class CursorPaginatedResult(Generic[ModelType]):
+    """Cursor-paginated result container.
+    
+    Returned by list() when called with CursorPaginationParams. There is no
+    total; use count() when a total is actually needed.
+    
+    Attributes:
+        items: List of entities in this page
+        limit: Current page limit
+        next_cursor: Cursor to pass as `after` for the next page (a primary
+            key, or a (created_at, id) tuple from list_keyset()), or None if
+            this is the last page
+        has_next: Boolean indicating if more pages exist after this one
+    """
+    
+    __slots__ = ("items", "limit", "next_cursor", "has_next")
+    
+    def __init__(
+        self,
+        items: list[ModelType],
+        limit: int,
+        next_cursor: Union[uuid.UUID, str, int, tuple[Any, ...], None]
+    ) -> None:
+        self.items = items
+        self.limit = limit
+        self.next_cursor = next_cursor
+        self.has_next = next_cursor is not None
+
+
 # ============================================================================
 # BASE REPOSITORY - MAIN CRUD IMPLEMENTATION
 # ============================================================================
@@ -144,7 +329,7 @@ class BaseRepository(Generic[ModelType]):
     - GENERIC TYPE SAFETY: Works with any SQLAlchemy model via TypeVar
     - SOFT DELETE: Automatic deleted_at filtering (models using SoftDeleteMixin)
     - PAGINATION: Built-in offset/limit with total count and navigation flags
-    - TRANSACTIONS: Explicit commit/rollback for multi-step operations
+    - TRANSACTIONS: Explicit commit/rollback, or one commit per unit_of_work() block
     - TRACING: OpenTelemetry integration via @trace_database decorators
     - STRUCTURED LOGGING: All operations logged with contextual information
     - ERROR HANDLING: Custom exception hierarchy for granular error handling
@@ -153,11 +338,19 @@ class BaseRepository(Generic[ModelType]):
         session: AsyncSession for database communication
         model: SQLAlchemy model class (e.g., Organization, User)
         use_cache: Enable caching (prepared for future implementation)
+        load_defaults: Loader options applied to every entity read (get,
+            get_many, list, list_keyset, iter_all) before per-call options,
+            so an entity repository declares its eager-load policy once.
+            With DATABASE_RAISELOAD set, relationships mapped with the
+            default lazy="select" and not loaded by these options raise on
+            access instead of lazy loading (one query per row)
     
     Example (Composition Pattern):
         class UserRepository:
             def __init__(self, session: AsyncSession) -> None:
-                self._base_repo = BaseRepository(session, User)
+                self._base_repo = BaseRepository(
+                    session, User, load_defaults=(selectinload(User.roles),)
+                )
             
             async def get(self, user_id: uuid.UUID) -> Optional[User]:
                 return await self._base_repo.get(user_id)
@@ -171,12 +364,93 @@ class BaseRepository(Generic[ModelType]):
         self, 
         session: AsyncSession, 
         model: type[ModelType],
-        use_cache: bool = False
+        use_cache: bool = False,
+        load_defaults: Sequence[ExecutableOption] = ()
     ) -> None:
         self._session = session
         self._model = model
         self._use_cache = use_cache
-        self._logger = get_logger(f"{__name__}.{model.__name__}Repository")
+        self._load_defaults = tuple(load_defaults)
+        # Lazy relationships that raise on access unless a loader option
+        # covers them (DATABASE_RAISELOAD, to surface N+1 queries)
+        self._raiseload_relationships = (
+            _lazy_relationships(model) if settings.database_raiseload else ()
+        )
+        self._model_name = model.__name__
+        self._logger = get_logger(f"{__name__}.{self._model_name}Repository")
+        # Debug calls are guarded so hot paths skip building their kwargs when
+        # debug is off; the level is fixed once configure_logging() has run
+        self._debug_enabled = self._logger.is_enabled_for(logging.DEBUG)
+        
+        # Mapped columns resolved once; None when the model lacks the mixin
+        self._id_column = getattr(model, 'id')
+        # get() can use Session.get() (identity map first) when id is the
+        # whole primary key
+        primary_key = inspect(model).primary_key
+        self._id_is_primary_key = len(primary_key) == 1 and primary_key[0].key == 'id'
+        self._created_column = getattr(model, 'created_at', None)
+        self._updated_column = getattr(model, 'updated_at', None)
+        self._deleted_column = getattr(model, 'deleted_at', None)
+        # "Not soft-deleted" guard for UPDATEs
+        self._not_deleted = (
+            self._deleted_column.is_(None) if self._deleted_column is not None else None
+        )
+        # Optional model hook that adds derived columns (e.g. Package.name_key)
+        # to UPDATE values, which bypass ORM validators
+        self._derive_update_values = getattr(model, 'derive_update_values', None)
+        self._derive_update_sources = frozenset(getattr(model, 'derive_update_sources', ()))
+    
+    def _needs_update_sources(self, values: dict[str, Any]) -> bool:
+        """Whether values set some, but not all, of the derive_update_sources columns."""
+        touched = self._derive_update_sources.intersection(values)
+        return bool(touched) and touched != self._derive_update_sources
+    
+    async def _fill_update_sources(
+        self, entity_values: Sequence[tuple[Any, dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Complete partial derive_update_sources values from the current rows.
+        
+        One SELECT for all the entities. Columns already in an entity's
+        values are kept.
+        
+        Returns:
+            The completed values of the entities whose row exists
+        """
+        sources = sorted(self._derive_update_sources)
+        result = await self._session.execute(
+            select(self._id_column, *(getattr(self._model, name) for name in sources))
+            .where(self._id_column.in_([entity_id for entity_id, _ in entity_values]))
+            .execution_options(include_deleted=True)
+        )
+        # Rows come back with typed IDs; callers may pass strings
+        current = {str(row[0]): row[1:] for row in result}
+        completed = []
+        for entity_id, values in entity_values:
+            row = current.get(str(entity_id))
+            if row is not None:
+                values.update(
+                    (name, value) for name, value in zip(sources, row) if name not in values
+                )
+                completed.append(values)
+        return completed
+    
+    def _loader_options(
+        self, options: Sequence[ExecutableOption]
+    ) -> list[ExecutableOption]:
+        """load_defaults plus per-call options, and raiseload for uncovered lazy relationships.
+        
+        raiseload is only added for relationships no other option sets a
+        strategy for, since two strategies on one path conflict.
+        """
+        loaders = [*self._load_defaults, *options]
+        if self._raiseload_relationships:
+            covered = _strategy_keys(loaders)
+            loaders.extend(
+                raiseload(attribute)
+                for key, attribute in self._raiseload_relationships
+                if key not in covered
+            )
+        return loaders
     
     # ========================================================================
     # CREATE OPERATION
@@ -187,12 +461,14 @@ class BaseRepository(Generic[ModelType]):
     async def create(self, **kwargs: Any) -> ModelType:
         """Create a new entity and return it.
         
-        Instantiates a new model with the provided attributes, adds it to
-        the session, and flushes to get the auto-generated ID without
-        committing the transaction.
+        Issues a single INSERT ... RETURNING without committing the
+        transaction. Python-side column defaults (IDs, timestamps) are applied
+        by the INSERT and the returned row hydrates the entity, which joins
+        the session's identity map, so no flush/refresh round-trips follow.
         
         Args:
-            **kwargs: Model attributes (e.g., name="Test", email="test@example.com")
+            **kwargs: Column attributes (e.g., name="Test", email="test@example.com");
+                relationships must be passed via their foreign key columns
             
         Returns:
             Created entity instance with auto-generated fields populated
@@ -203,22 +479,21 @@ class BaseRepository(Generic[ModelType]):
         
         Example:
             org = await repo.create(name="My Organization", slug="my-org")
-            # org.id is now populated from database auto-increment/sequence
+            # org.id and all other columns are populated from RETURNING
         """
         try:
-            self._logger.debug("Creating new entity", model=self._model.__name__)
+            if self._debug_enabled:
+                self._logger.debug("Creating new entity", model=self._model_name)
             
-            # Instantiate model with provided attributes
-            entity = self._model(**kwargs)
+            # One round-trip: INSERT the row and read it back as an entity
+            query = insert(self._model).values(**kwargs).returning(self._model)
             
-            # Add to session and flush to get auto-generated ID
-            self._session.add(entity)
-            await self._session.flush()  # Get the ID without committing
-            await self._session.refresh(entity)
+            result = await self._session.execute(query)
+            entity = result.scalar_one()
             
             self._logger.info(
                 "Entity created successfully",
-                model=self._model.__name__,
+                model=self._model_name,
                 entity_id=getattr(entity, 'id', None)
             )
             
@@ -227,28 +502,182 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to create entity",
-                model=self._model.__name__,
+                model=self._model_name,
                 error=str(e)
             )
             # Check for common constraint violations
-            if "unique" in str(e).lower() or "duplicate" in str(e).lower():
+            if _is_unique_violation(e):
                 raise ConflictError(f"Entity conflicts with existing data: {e}") from e
             raise RepositoryError(f"Failed to create entity: {e}") from e
     
+    @trace_database()
+    async def bulk_create(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = 1000,
+        returning: bool = False,
+        commit_each_batch: bool = False
+    ) -> list[ModelType]:
+        """Insert many entities in batched executemany INSERTs.
+        
+        Each batch is a single ORM bulk INSERT, which SQLAlchemy sends as
+        multi-row "insertmanyvalues" statements instead of one round-trip per
+        row. On PostgreSQL via asyncpg, batches that share one set of keys are
+        streamed with binary COPY instead (see _copy_batch), unless
+        returning=True. Rows are consumed lazily, so at most batch_size dicts
+        are held at once. Python-side column defaults (ids, timestamps) are
+        still applied.
+        
+        Args:
+            rows: Iterable of attribute dicts, one per entity
+            batch_size: Rows per INSERT batch (default: 1000)
+            returning: If True, return the created entities (adds RETURNING);
+                if False, skip RETURNING and return an empty list
+            commit_each_batch: If True, commit after every batch so very large
+                loads do not build up one long transaction. Batches committed
+                before a failure stay committed.
+            
+        Returns:
+            Created entities in insertion order when returning=True, else []
+            
+        Raises:
+            ValueError: If batch_size is less than 1
+            ConflictError: If a row conflicts with constraints (unique, foreign key)
+            RepositoryError: For other database errors
+        
+        Example:
+            await repo.bulk_create(
+                {"repository_id": repo_id, "package_id": pkg.id} for pkg in packages
+            )
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        statement = insert(self._model)
+        if returning:
+            statement = statement.returning(self._model)
+        
+        created: list[ModelType] = []
+        inserted = 0
+        use_copy = not returning and self._supports_copy()
+        try:
+            iterator = iter(rows)
+            while batch := list(itertools.islice(iterator, batch_size)):
+                if returning:
+                    result = await self._session.scalars(statement, batch)
+                    created.extend(result.all())
+                elif not (use_copy and await self._copy_batch(batch)):
+                    await self._session.execute(statement, batch)
+                if commit_each_batch:
+                    await self._session.commit()
+                inserted += len(batch)
+            
+            self._logger.info(
+                "Entities bulk created successfully",
+                model=self._model_name,
+                count=inserted
+            )
+            
+            return created
+            
+        except (SQLAlchemyError, PostgresError) as e:
+            self._logger.error(
+                "Failed to bulk create entities",
+                model=self._model_name,
+                inserted=inserted,
+                error=str(e)
+            )
+            if _is_unique_violation(e):
+                raise ConflictError(f"Entities conflict with existing data: {e}") from e
+            raise RepositoryError(f"Failed to bulk create entities: {e}") from e
+    
+    def _supports_copy(self) -> bool:
+        """Whether the session is bound to PostgreSQL through asyncpg."""
+        dialect = self._session.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "asyncpg"
+    
+    async def _copy_batch(self, batch: list[dict[str, Any]]) -> bool:
+        """Insert one batch with asyncpg's binary COPY inside the session transaction.
+        
+        COPY bypasses SQLAlchemy's INSERT compilation, so Python-side column
+        defaults and type bind processing (e.g. SmallIntEnum codes) are applied
+        here; columns left out get their server defaults. Row keys must be
+        column names, as they are for every model in this app.
+        
+        Returns:
+            False if the batch cannot be copied (rows with differing keys or a
+            SQL-expression default) and should go through INSERT instead
+        """
+        table = self._model.__table__
+        keys = batch[0].keys()
+        if any(row.keys() != keys for row in batch):
+            return False
+        
+        defaults = [
+            column for column in table.columns
+            if column.key not in keys and column.default is not None
+        ]
+        if any(not (column.default.is_callable or column.default.is_scalar)
+               for column in defaults):
+            return False
+        
+        # COPY skips autoflush, so write pending ORM changes first
+        await self._session.flush()
+        connection = await self._session.connection()
+        dialect = connection.dialect
+        columns = [table.columns[key] for key in keys] + defaults
+        processors = [column.type.dialect_impl(dialect).bind_processor(dialect)
+                      for column in columns]
+        
+        records = []
+        for row in batch:
+            params = dict(row)
+            context = _DefaultContext(params)
+            for column in defaults:
+                default = column.default
+                params[column.key] = (
+                    default.arg(context) if default.is_callable else default.arg
+                )
+            record = [params[column.key] for column in columns]
+            records.append(tuple(
+                process(value) if process is not None else value
+                for process, value in zip(processors, record)
+            ))
+        
+        # The asyncpg adapter opens its transaction lazily on the first statement;
+        # make sure it is open so COPY commits or rolls back with the session
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+        if not driver_connection.is_in_transaction():
+            await connection.execute(text("SELECT 1"))
+        
+        await driver_connection.copy_records_to_table(
+            table.name,
+            records=records,
+            columns=[column.name for column in columns],
+            schema_name=table.schema,
+        )
+        return True
+    
     # ========================================================================
     # READ OPERATIONS (GET)
     # ========================================================================
     
-    @trace_database()
+    @trace_database(sample_rate=0.01)
     async def get(
         self, 
         entity_id: Union[uuid.UUID, str, int], 
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = ()
     ) -> Optional[ModelType]:
         """Get entity by ID.
         
-        Performs a database lookup by primary key. Soft-deleted entities are
-        automatically excluded unless include_deleted=True.
+        Performs a lookup by primary key through Session.get(), which returns
+        an entity already loaded in this session without a round-trip.
+        Soft-deleted entities are excluded unless include_deleted=True; the
+        check is done on the loaded entity, so it works for identity-map hits.
+        Per-call options reload the row (populate_existing) so their eager
+        loads apply even on a hit, replacing unflushed attribute changes.
         
         Note: Uses getattr() for model attribute access to maintain type safety
         with mixins that add attributes to models at runtime.
@@ -256,6 +685,8 @@ class BaseRepository(Generic[ModelType]):
         Args:
             entity_id: Entity identifier (UUID, string, or integer)
             include_deleted: If True, include soft-deleted entities (deleted_at is not None)
+            options: Loader options applied after the repository's
+                load_defaults, e.g. selectinload(Organization.repositories)
             
         Returns:
             Entity instance if found, None if not found
@@ -272,35 +703,49 @@ class BaseRepository(Generic[ModelType]):
             deleted_org = await repo.get(org_id, include_deleted=True)
         """
         try:
-            self._logger.debug(
-                "Getting entity by ID",
-                model=self._model.__name__,
-                entity_id=entity_id,
-                include_deleted=include_deleted
-            )
-            
-            # Build SELECT query by ID
-            # Using getattr() to handle attributes added by mixins (e.g., SoftDeleteMixin)
-            query = select(self._model).where(getattr(self._model, 'id') == entity_id)
-            
-            # Add soft delete filter if model has deleted_at column
-            # This is how we implement soft delete: just filter on deleted_at IS NULL
-            if not include_deleted and hasattr(self._model, 'deleted_at'):
-                query = query.where(getattr(self._model, 'deleted_at').is_(None))
-            
-            result = await self._session.execute(query)
-            entity = result.scalar_one_or_none()
-            
-            if entity:
+            if self._debug_enabled:
                 self._logger.debug(
-                    "Entity found",
-                    model=self._model.__name__,
-                    entity_id=entity_id
+                    "Getting entity by ID",
+                    model=self._model_name,
+                    entity_id=entity_id,
+                    include_deleted=include_deleted
+                )
+            
+            if self._id_is_primary_key:
+                # Loaded regardless of deleted_at so the row is cached in the
+                # identity map; soft-deleted entities are filtered below
+                entity = await self._session.get(
+                    self._model,
+                    entity_id,
+                    options=self._loader_options(options),
+                    populate_existing=bool(options),
+                    execution_options={"include_deleted": True}
                 )
+                if (
+                    entity is not None
+                    and not include_deleted
+                    and self._deleted_column is not None
+                    and getattr(entity, 'deleted_at') is not None
+                ):
+                    entity = None
             else:
+                # Cached SELECT-by-ID template; soft-deleted rows are filtered
+                # out (deleted_at IS NULL) unless include_deleted is set
+                query = _get_by_id_statement(self._model, include_deleted)
+                if loaders := self._loader_options(options):
+                    query = query.options(*loaders)
+                
+                result = await self._session.execute(
+                    query,
+                    {"entity_id": entity_id},
+                    execution_options={"include_deleted": include_deleted}
+                )
+                entity = result.scalar_one_or_none()
+            
+            if self._debug_enabled:
                 self._logger.debug(
-                    "Entity not found",
-                    model=self._model.__name__,
+                    "Entity found" if entity else "Entity not found",
+                    model=self._model_name,
                     entity_id=entity_id
                 )
             
@@ -309,7 +754,7 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to get entity",
-                model=self._model.__name__,
+                model=self._model_name,
                 entity_id=entity_id,
                 error=str(e)
             )
@@ -319,7 +764,8 @@ class BaseRepository(Generic[ModelType]):
     async def get_or_404(
         self, 
         entity_id: Union[uuid.UUID, str, int], 
-        include_deleted: bool = False
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = ()
     ) -> ModelType:
         """Get entity by ID, raising NotFoundError if not found.
         
@@ -330,6 +776,7 @@ class BaseRepository(Generic[ModelType]):
         Args:
             entity_id: Entity identifier
             include_deleted: If True, include soft-deleted entities
+            options: Loader options passed through to get()
             
         Returns:
             Entity instance
@@ -344,97 +791,369 @@ class BaseRepository(Generic[ModelType]):
             except NotFoundError as e:
                 raise HTTPException(status_code=404, detail=str(e))
         """
-        entity = await self.get(entity_id, include_deleted=include_deleted)
+        entity = await self.get(entity_id, include_deleted=include_deleted, options=options)
         if entity is None:
-            raise NotFoundError(f"{self._model.__name__} with id {entity_id} not found")
+            raise NotFoundError(f"{self._model_name} with id {entity_id} not found")
         return entity
     
+    @trace_database()
+    async def get_many(
+        self,
+        entity_ids: Iterable[Union[uuid.UUID, str, int]],
+        include_deleted: bool = False,
+        batch_size: int = 1000
+    ) -> dict[Any, ModelType]:
+        """Get many entities by ID in one query per batch.
+        
+        Prefer this over awaiting get() in a loop: a page of IDs costs one
+        round-trip (WHERE id IN (...)) instead of one per ID. IDs are sent in
+        batches of batch_size so IN lists stay small enough to plan cheaply.
+        
+        Args:
+            entity_ids: Entity identifiers; duplicates are allowed
+            include_deleted: If True, include soft-deleted entities
+            batch_size: IDs per IN list (default: 1000)
+            
+        Returns:
+            Mapping of ID to entity for the IDs that were found; missing IDs
+            are simply absent
+            
+        Raises:
+            ValueError: If batch_size is less than 1
+            RepositoryError: For database errors
+        
+        Example:
+            packages = await repo.get_many(dep.package_id for dep in dependencies)
+            names = [packages[dep.package_id].name for dep in dependencies]
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        found: dict[Any, ModelType] = {}
+        try:
+            query = _get_many_statement(self._model, include_deleted)
+            if loaders := self._loader_options(()):
+                query = query.options(*loaders)
+            iterator = iter(entity_ids)
+            while batch := list(itertools.islice(iterator, batch_size)):
+                result = await self._session.execute(
+                    query,
+                    {"entity_ids": batch},
+                    execution_options={"include_deleted": include_deleted}
+                )
+                found.update((getattr(entity, 'id'), entity) for entity in result.scalars())
+            
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Got entities by ID",
+                    model=self._model_name,
+                    found=len(found),
+                    include_deleted=include_deleted
+                )
+            
+            return found
+            
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to get entities by ID",
+                model=self._model_name,
+                error=str(e)
+            )
+            raise RepositoryError(f"Failed to get entities: {e}") from e
+    
     # ========================================================================
     # UPDATE OPERATION
     # ========================================================================
     
+    @overload
+    async def update(
+        self,
+        entity_id: Union[uuid.UUID, str, int],
+        *,
+        return_row: Literal[False] = False,
+        **kwargs: Any
+    ) -> bool: ...
+    
+    @overload
+    async def update(
+        self,
+        entity_id: Union[uuid.UUID, str, int],
+        *,
+        return_row: Literal[True],
+        **kwargs: Any
+    ) -> Optional[ModelType]: ...
+    
     @trace_database()
     async def update(
         self, 
         entity_id: Union[uuid.UUID, str, int], 
+        *,
+        return_row: bool = False,
         **kwargs: Any
-    ) -> Optional[ModelType]:
+    ) -> Union[bool, Optional[ModelType]]:
         """Update entity by ID.
         
         Performs an UPDATE query on the entity, filtering by ID and soft-deleted
         status. Automatically adds updated_at timestamp if the model has that field.
-        Returns the updated entity with all new values populated.
+        
+        By default this is a plain UPDATE judged by its rowcount: nothing is
+        read back, and an instance already in the session is updated in place.
+        Pass return_row=True to get the updated entity via UPDATE ... RETURNING.
+        
+        Model-derived columns (e.g. Package.name_key) are recomputed; any of
+        their source columns that kwargs leaves out are read from the row first.
         
         Args:
             entity_id: Entity identifier
+            return_row: If True, return the updated entity instead of a flag
             **kwargs: Attributes to update (e.g., name="New Name", status="active")
             
         Returns:
-            Updated entity instance or None if entity not found
+            Whether an entity was updated; with return_row=True, the updated
+            entity instance or None if entity not found
             
         Raises:
             ConflictError: If update conflicts with constraints (unique, foreign key)
             RepositoryError: For other database errors
         
         Example:
-            org = await repo.update(org_id, name="New Name", slug="new-slug")
-            if org is None:
+            if not await repo.update(org_id, name="New Name"):
                 print("Organization not found")
-            else:
-                print(f"Updated to {org.name}")
+            
+            org = await repo.update(org_id, return_row=True, slug="new-slug")
         """
         try:
-            self._logger.debug(
-                "Updating entity",
-                model=self._model.__name__,
-                entity_id=entity_id,
-                fields=list(kwargs.keys())
-            )
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Updating entity",
+                    model=self._model_name,
+                    entity_id=entity_id,
+                    fields=list(kwargs.keys())
+                )
             
             # Automatically add updated_at timestamp if model supports it
             # This ensures every update records when it happened
-            if hasattr(self._model, 'updated_at'):
+            if self._updated_column is not None:
                 kwargs['updated_at'] = datetime.now(timezone.utc)
+            if self._derive_update_values is not None:
+                if self._needs_update_sources(kwargs):
+                    await self._fill_update_sources([(entity_id, kwargs)])
+                self._derive_update_values(kwargs)
             
             # Build UPDATE query with soft delete filter
             # Only update entities that haven't been soft-deleted
-            query = update(self._model).where(getattr(self._model, 'id') == entity_id)
+            query = update(self._model).where(self._id_column == entity_id)
             
-            if hasattr(self._model, 'deleted_at'):
-                query = query.where(getattr(self._model, 'deleted_at').is_(None))
+            if self._not_deleted is not None:
+                query = query.where(self._not_deleted)
             
-            # Apply the update and return the updated entity
-            query = query.values(**kwargs).returning(self._model)
+            query = query.values(**kwargs)
             
-            result = await self._session.execute(query)
-            entity = result.scalar_one_or_none()
+            entity: Optional[ModelType] = None
+            if return_row:
+                result = await self._session.execute(query.returning(self._model))
+                entity = result.scalar_one_or_none()
+                updated = entity is not None
+            else:
+                result = await self._session.execute(query)
+                updated = bool(getattr(result, 'rowcount', 0) > 0)
             
-            if entity:
+            if updated:
                 self._logger.info(
                     "Entity updated successfully",
-                    model=self._model.__name__,
+                    model=self._model_name,
                     entity_id=entity_id
                 )
-            else:
+            elif self._debug_enabled:
                 self._logger.debug(
                     "Entity not found for update",
-                    model=self._model.__name__,
+                    model=self._model_name,
                     entity_id=entity_id
                 )
             
-            return entity
+            return entity if return_row else updated
             
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to update entity",
-                model=self._model.__name__,
+                model=self._model_name,
                 entity_id=entity_id,
                 error=str(e)
             )
-            if "unique" in str(e).lower() or "duplicate" in str(e).lower():
+            if _is_unique_violation(e):
                 raise ConflictError(f"Update conflicts with existing data: {e}") from e
             raise RepositoryError(f"Failed to update entity: {e}") from e
     
+    @trace_database()
+    async def bulk_update(
+        self,
+        entity_ids: Iterable[Union[uuid.UUID, str, int]],
+        batch_size: int = 1000,
+        **kwargs: Any
+    ) -> int:
+        """Apply the same attribute values to many entities by ID.
+        
+        Issues one UPDATE ... WHERE id IN (...) per batch of IDs instead of one
+        statement per entity. Like update(), soft-deleted entities are skipped
+        and updated_at is refreshed if the model has it.
+        
+        Args:
+            entity_ids: Identifiers of the entities to update
+            batch_size: IDs per UPDATE statement (default: 1000)
+            **kwargs: Attributes to update (e.g., version="2.0.0")
+            
+        Returns:
+            Number of entities updated
+            
+        Raises:
+            ValueError: If batch_size is less than 1
+            ConflictError: If the update conflicts with constraints (unique, foreign key)
+            RepositoryError: For other database errors
+        
+        Example:
+            updated = await repo.bulk_update(stale_ids, dependency_type="dev")
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        if self._needs_update_sources(kwargs):
+            # Derived columns then differ per entity (e.g. a Package rename
+            # across ecosystems), so each entity gets its own parameter set
+            return await self.bulk_update_rows(
+                ({"id": entity_id, **kwargs} for entity_id in entity_ids),
+                batch_size=batch_size
+            )
+        
+        if self._updated_column is not None:
+            kwargs['updated_at'] = datetime.now(timezone.utc)
+        if self._derive_update_values is not None:
+            self._derive_update_values(kwargs)
+        
+        updated = 0
+        try:
+            iterator = iter(entity_ids)
+            while batch := list(itertools.islice(iterator, batch_size)):
+                query = update(self._model).where(self._id_column.in_(batch))
+                if self._not_deleted is not None:
+                    query = query.where(self._not_deleted)
+                
+                result = await self._session.execute(query.values(**kwargs))
+                updated += getattr(result, 'rowcount', 0)
+            
+            self._logger.info(
+                "Entities bulk updated successfully",
+                model=self._model_name,
+                count=updated,
+                fields=list(kwargs.keys())
+            )
+            
+            return updated
+            
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to bulk update entities",
+                model=self._model_name,
+                updated=updated,
+                error=str(e)
+            )
+            if _is_unique_violation(e):
+                raise ConflictError(f"Update conflicts with existing data: {e}") from e
+            raise RepositoryError(f"Failed to bulk update entities: {e}") from e
+    
+    @trace_database()
+    async def bulk_update_rows(
+        self,
+        rows: Iterable[dict[str, Any]],
+        batch_size: int = 1000
+    ) -> int:
+        """Apply per-entity attribute values to many entities in executemany UPDATEs.
+        
+        Each row is a dict with the entity's "id" plus the columns to set on
+        it; every row must set the same columns. One UPDATE ... WHERE id = :id
+        statement is executed per batch with all of the batch's parameter sets.
+        Soft-deleted entities are skipped and updated_at is refreshed if the
+        model has it. Instances already loaded in the session are not
+        refreshed.
+        
+        Args:
+            rows: Attribute dicts, each including "id"
+            batch_size: Rows per executemany batch (default: 1000)
+            
+        Returns:
+            Number of entities updated, as reported by the driver
+            
+        Raises:
+            ValueError: If batch_size is less than 1 or a row has no "id"
+            ConflictError: If an update conflicts with constraints (unique, foreign key)
+            RepositoryError: For other database errors
+        
+        Example:
+            await repo.bulk_update_rows(
+                {"id": pkg_id, "latest_version": version}
+                for pkg_id, version in releases.items()
+            )
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        # Core UPDATE against the table: the ORM's bulk-by-primary-key mode
+        # cannot add the soft-delete guard or report a rowcount. "id" is bound
+        # as "_id" so it is matched in WHERE instead of being SET.
+        table = self._model.__table__  # type: ignore[attr-defined]
+        query = update(table).where(table.c.id == bindparam("_id"))
+        if self._not_deleted is not None:
+            query = query.where(table.c.deleted_at.is_(None))
+        
+        updated_at = datetime.now(timezone.utc) if self._updated_column is not None else None
+        
+        updated = 0
+        try:
+            iterator = iter(rows)
+            while batch := list(itertools.islice(iterator, batch_size)):
+                params = []
+                for row in batch:
+                    if "id" not in row:
+                        raise ValueError("Every row passed to bulk_update_rows needs an 'id'")
+                    values = {key: value for key, value in row.items() if key != "id"}
+                    values["_id"] = row["id"]
+                    if updated_at is not None:
+                        values["updated_at"] = updated_at
+                    params.append(values)
+                
+                if self._needs_update_sources(params[0]):
+                    # Rows without a match would update nothing, and their
+                    # parameter sets would lack the filled-in columns
+                    params = await self._fill_update_sources(
+                        [(values["_id"], values) for values in params]
+                    )
+                    if not params:
+                        continue
+                if self._derive_update_values is not None:
+                    for values in params:
+                        self._derive_update_values(values)
+                
+                result = await self._session.execute(query, params)
+                updated += getattr(result, 'rowcount', 0)
+            
+            self._logger.info(
+                "Entity rows bulk updated successfully",
+                model=self._model_name,
+                count=updated
+            )
+            
+            return updated
+            
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to bulk update entity rows",
+                model=self._model_name,
+                updated=updated,
+                error=str(e)
+            )
+            if _is_unique_violation(e):
+                raise ConflictError(f"Update conflicts with existing data: {e}") from e
+            raise RepositoryError(f"Failed to bulk update entities: {e}") from e
+    
     # ========================================================================
     # DELETE OPERATIONS
     # ========================================================================
@@ -473,25 +1192,28 @@ class BaseRepository(Generic[ModelType]):
             deleted = await repo.delete(org_id, soft=False)
         """
         try:
-            self._logger.debug(
-                "Deleting entity",
-                model=self._model.__name__,
-                entity_id=entity_id,
-                soft_delete=soft
-            )
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Deleting entity",
+                    model=self._model_name,
+                    entity_id=entity_id,
+                    soft_delete=soft
+                )
             
-            if soft and hasattr(self._model, 'deleted_at'):
+            if soft and self._not_deleted is not None:
                 # SOFT DELETE: Set deleted_at timestamp instead of removing
                 # Also updates updated_at if the model has it
-                update_data = {'deleted_at': datetime.now(timezone.utc)}
-                if hasattr(self._model, 'updated_at'):
-                    update_data['updated_at'] = datetime.now(timezone.utc)
+                # One timestamp, so updated_at == deleted_at on the record
+                now = datetime.now(timezone.utc)
+                update_data = {'deleted_at': now}
+                if self._updated_column is not None:
+                    update_data['updated_at'] = now
                 
                 # Build update query that only affects non-deleted entities
                 query = update(self._model).where(
                     and_(
-                        getattr(self._model, 'id') == entity_id,
-                        getattr(self._model, 'deleted_at').is_(None)
+                        self._id_column == entity_id,
+                        self._not_deleted
                     )
                 ).values(**update_data)
                 
@@ -500,25 +1222,24 @@ class BaseRepository(Generic[ModelType]):
                 deleted = bool(getattr(result, 'rowcount', 0) > 0)
                 
             else:
-                # HARD DELETE: Remove entity from database permanently
-                entity = await self.get(entity_id, include_deleted=True)
-                if entity:
-                    await self._session.delete(entity)
-                    deleted = True
-                else:
-                    deleted = False
+                # HARD DELETE: Remove entity from database permanently in one
+                # DELETE; dependent rows go via the foreign keys' ON DELETE CASCADE
+                query = delete(self._model).where(self._id_column == entity_id)
+                
+                result = await self._session.execute(query)
+                deleted = bool(getattr(result, 'rowcount', 0) > 0)
             
             if deleted:
                 self._logger.info(
                     "Entity deleted successfully",
-                    model=self._model.__name__,
+                    model=self._model_name,
                     entity_id=entity_id,
                     soft_delete=soft
                 )
-            else:
+            elif self._debug_enabled:
                 self._logger.debug(
                     "Entity not found for deletion",
-                    model=self._model.__name__,
+                    model=self._model_name,
                     entity_id=entity_id
                 )
             
@@ -527,7 +1248,7 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to delete entity",
-                model=self._model.__name__,
+                model=self._model_name,
                 entity_id=entity_id,
                 error=str(e)
             )
@@ -537,27 +1258,65 @@ class BaseRepository(Generic[ModelType]):
     # LIST OPERATION (WITH PAGINATION)
     # ========================================================================
     
-    @trace_database()
+    @overload
     async def list(
-        self, 
+        self,
+        pagination: CursorPaginationParams,
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = ()
+    ) -> CursorPaginatedResult[ModelType]: ...
+    
+    @overload
+    async def list(
+        self,
         pagination: Optional[PaginationParams] = None,
-        include_deleted: bool = False
-    ) -> PaginatedResult[ModelType]:
-        """List entities with offset/limit pagination.
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = (),
+        exact_total: bool = True
+    ) -> PaginatedResult[ModelType]: ...
+    
+    @trace_database(sample_rate=0.01)
+    async def list(
+        self, 
+        pagination: Union[PaginationParams, CursorPaginationParams, None] = None,
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = (),
+        exact_total: bool = True
+    ) -> Union[PaginatedResult[ModelType], CursorPaginatedResult[ModelType]]:
+        """List entities with offset/limit or cursor pagination.
         
         Returns all entities (excluding soft-deleted by default) in pages
-        of configurable size. Results include total count for building
+        of configurable size. Offset results include total count for building
         pagination UI (has_next, has_prev, etc).
         
-        Ordering: Results are ordered by created_at (descending) if available,
-        otherwise by ID.
+        The offset total comes from COUNT(*) OVER () on the page query itself,
+        so no separate count query is issued (except for an empty page past
+        the end, where no row carries it).
+        
+        Cursor pagination (CursorPaginationParams) is preferred for large
+        tables: it seeks past the cursor with WHERE id > :after instead of
+        scanning skipped rows, and fetches one extra row to detect has_next
+        instead of running COUNT(*).
+        
+        Ordering: Offset results are ordered by created_at (descending) if
+        available, otherwise by ID. Cursor results are ordered by ID ascending;
+        list_keyset() seeks in the offset order instead.
         
         Args:
-            pagination: PaginationParams with offset/limit (default: 0, 50)
+            pagination: PaginationParams with offset/limit (default: 0, 50),
+                or CursorPaginationParams with after/limit
             include_deleted: If True, include soft-deleted entities
+            options: Loader options applied to the items query, e.g.
+                selectinload(Package.dependencies) to batch-load a lazy
+                relationship for the whole page instead of once per row
+            exact_total: If False, the offset total comes from approx_count()
+                instead of counting matching rows, so has_next follows the
+                estimate (raised to cover the rows actually returned)
             
         Returns:
-            PaginatedResult with items, total, offset, limit, has_next, has_prev
+            PaginatedResult with items, total, offset, limit, has_next, has_prev;
+            or CursorPaginatedResult with items, limit, next_cursor, has_next
+            when called with CursorPaginationParams
             
         Raises:
             RepositoryError: For database errors
@@ -575,53 +1334,74 @@ class BaseRepository(Generic[ModelType]):
                         limit=50
                     )
                 )
+            
+            # Cursor pagination
+            page = await repo.list(pagination=CursorPaginationParams(limit=50))
+            if page.has_next:
+                page = await repo.list(
+                    pagination=CursorPaginationParams(after=page.next_cursor, limit=50)
+                )
         """
+        if isinstance(pagination, CursorPaginationParams):
+            return await self._list_after(pagination, include_deleted, options)
+        
         try:
             if pagination is None:
                 pagination = PaginationParams()
             
-            self._logger.debug(
-                "Listing entities",
-                model=self._model.__name__,
-                offset=pagination.offset,
-                limit=pagination.limit,
-                include_deleted=include_deleted
-            )
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Listing entities",
+                    model=self._model_name,
+                    offset=pagination.offset,
+                    limit=pagination.limit,
+                    include_deleted=include_deleted
+                )
             
-            # Base SELECT query
-            query = select(self._model)
-            # Separate query for counting total (doesn't need pagination)
-            count_query = select(func.count(getattr(self._model, 'id')))
+            # Page query with the total folded in as COUNT(*) OVER (), so one
+            # round-trip returns both (plus any caller-supplied eager loading).
+            # An approximate total skips the window and its full scan.
+            if exact_total:
+                total_column = func.count().over().label("_total")
+                query = select(self._model, total_column)
+            else:
+                query = select(self._model)
+            query = query.options(*self._loader_options(options))
             
-            # Add soft delete filter if model has deleted_at column
-            # This makes soft-deleted entities invisible by default
-            if not include_deleted and hasattr(self._model, 'deleted_at'):
-                query = query.where(getattr(self._model, 'deleted_at').is_(None))
-                count_query = count_query.where(getattr(self._model, 'deleted_at').is_(None))
+            # Soft-deleted entities are invisible unless include_deleted is set
+            query = _exclude_deleted(query, self._model, include_deleted)
+            query = query.execution_options(include_deleted=include_deleted)
             
             # Add ordering (by created_at if available, otherwise by id)
             # Descending order shows most recent items first
-            if hasattr(self._model, 'created_at'):
-                query = query.order_by(getattr(self._model, 'created_at').desc())
+            if self._created_column is not None:
+                query = query.order_by(self._created_column.desc())
             else:
-                query = query.order_by(getattr(self._model, 'id'))
+                query = query.order_by(self._id_column)
             
             # Add pagination (offset and limit)
             query = query.offset(pagination.offset).limit(pagination.limit)
             
-            # Execute both queries
-            items_result = await self._session.execute(query)
-            items = list(items_result.scalars().all())
+            rows = (await self._session.execute(query)).all()
+            items = [row[0] for row in rows]
             
-            total_result = await self._session.execute(count_query)
-            total = total_result.scalar() or 0
+            if not exact_total:
+                total = max(await self.approx_count(), pagination.offset + len(items))
+            elif rows:
+                total = rows[0][1]
+            elif pagination.offset == 0:
+                total = 0
+            else:
+                # Past the last page no row carries the window total
+                total = await self.count(include_deleted=include_deleted)
             
-            self._logger.debug(
-                "Listed entities successfully",
-                model=self._model.__name__,
-                count=len(items),
-                total=total
-            )
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Listed entities successfully",
+                    model=self._model_name,
+                    count=len(items),
+                    total=total
+                )
             
             return PaginatedResult(
                 items=items,
@@ -633,16 +1413,221 @@ class BaseRepository(Generic[ModelType]):
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to list entities",
-                model=self._model.__name__,
+                model=self._model_name,
                 error=str(e)
             )
             raise RepositoryError(f"Failed to list entities: {e}") from e
     
+    async def _list_after(
+        self,
+        pagination: CursorPaginationParams,
+        include_deleted: bool,
+        options: Sequence[ExecutableOption]
+    ) -> CursorPaginatedResult[ModelType]:
+        """Keyset page: entities with id > pagination.after, in id order."""
+        try:
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Listing entities after cursor",
+                    model=self._model_name,
+                    after=pagination.after,
+                    limit=pagination.limit,
+                    include_deleted=include_deleted
+                )
+            
+            query = select(self._model).options(*self._loader_options(options))
+            if pagination.after is not None:
+                query = query.where(self._id_column > pagination.after)
+            query = _exclude_deleted(query, self._model, include_deleted)
+            query = query.execution_options(include_deleted=include_deleted)
+            
+            # Fetch one extra row to learn whether another page exists
+            query = query.order_by(self._id_column).limit(pagination.limit + 1)
+            
+            items_result = await self._session.execute(query)
+            # all() already builds a fresh list; no need to copy it again
+            items = cast(list[ModelType], items_result.scalars().all())
+            
+            next_cursor = None
+            if len(items) > pagination.limit:
+                del items[pagination.limit:]
+                next_cursor = getattr(items[-1], 'id')
+            
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Listed entities after cursor successfully",
+                    model=self._model_name,
+                    count=len(items),
+                    has_next=next_cursor is not None
+                )
+            
+            return CursorPaginatedResult(
+                items=items,
+                limit=pagination.limit,
+                next_cursor=next_cursor
+            )
+            
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to list entities after cursor",
+                model=self._model_name,
+                error=str(e)
+            )
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+    
+    @trace_database()
+    async def list_keyset(
+        self,
+        after: Optional[tuple[Any, ...]] = None,
+        limit: int = 50,
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = ()
+    ) -> CursorPaginatedResult[ModelType]:
+        """List entities newest first, seeking past a (created_at, id) cursor.
+        
+        Same order as offset list(), but each page is a seek with
+        WHERE (created_at, id) < (:created_at, :id) instead of skipping
+        `offset` rows, so deep pages cost the same as the first. The id
+        breaks ties between equal timestamps. Models without created_at are
+        paged by id alone, with a one-element (id,) cursor.
+        
+        On large tables, back it with a matching index, e.g.
+        CREATE INDEX ON organizations (created_at DESC, id DESC)
+        WHERE deleted_at IS NULL.
+        
+        Args:
+            after: next_cursor of the previous page, or None for the first page
+            limit: Number of records to return (default: 50, must be 1-1000)
+            include_deleted: If True, include soft-deleted entities
+            options: Loader options applied to the items query
+            
+        Returns:
+            CursorPaginatedResult whose next_cursor is the (created_at, id)
+            tuple of the last item, or None on the last page
+            
+        Raises:
+            ValueError: If limit is out of range
+            RepositoryError: For database errors
+        
+        Example:
+            page = await repo.list_keyset(limit=50)
+            if page.has_next:
+                page = await repo.list_keyset(after=page.next_cursor, limit=50)
+        """
+        if limit <= 0 or limit > 1000:
+            raise ValueError("Limit must be between 1 and 1000")
+        
+        try:
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Listing entities by keyset",
+                    model=self._model_name,
+                    after=after,
+                    limit=limit,
+                    include_deleted=include_deleted
+                )
+            
+            key_columns = [self._id_column]
+            if self._created_column is not None:
+                key_columns.insert(0, self._created_column)
+            
+            query = select(self._model).options(*self._loader_options(options))
+            if after is not None:
+                query = query.where(tuple_(*key_columns) < tuple_(*after))
+            query = _exclude_deleted(query, self._model, include_deleted)
+            query = query.execution_options(include_deleted=include_deleted)
+            
+            # Fetch one extra row to learn whether another page exists
+            query = query.order_by(*(column.desc() for column in key_columns))
+            query = query.limit(limit + 1)
+            
+            items_result = await self._session.execute(query)
+            items = cast(list[ModelType], items_result.scalars().all())
+            
+            next_cursor = None
+            if len(items) > limit:
+                del items[limit:]
+                last = items[-1]
+                next_cursor = tuple(getattr(last, column.key) for column in key_columns)
+            
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Listed entities by keyset successfully",
+                    model=self._model_name,
+                    count=len(items),
+                    has_next=next_cursor is not None
+                )
+            
+            return CursorPaginatedResult(items=items, limit=limit, next_cursor=next_cursor)
+            
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to list entities by keyset",
+                model=self._model_name,
+                error=str(e)
+            )
+            raise RepositoryError(f"Failed to list entities: {e}") from e
+    
+    async def iter_all(
+        self,
+        batch_size: int = 1000,
+        include_deleted: bool = False,
+        options: Sequence[ExecutableOption] = ()
+    ) -> AsyncIterator[Sequence[ModelType]]:
+        """Stream every entity in primary key order, batch_size at a time.
+        
+        Rows are read from a server-side cursor with yield_per, so an export
+        of any size holds one batch in memory instead of the whole table.
+        The session stays busy until iteration finishes or the generator
+        is closed.
+        
+        Args:
+            batch_size: Entities per yielded batch (default: 1000)
+            include_deleted: If True, include soft-deleted entities
+            options: Loader options applied to the query
+            
+        Yields:
+            Lists of up to batch_size entities
+            
+        Raises:
+            ValueError: If batch_size is less than 1
+            RepositoryError: For database errors
+        
+        Example:
+            async for batch in repo.iter_all(batch_size=500):
+                await writer.write_rows(batch)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        
+        query = select(self._model).options(*self._loader_options(options))
+        query = _exclude_deleted(query, self._model, include_deleted)
+        query = query.order_by(self._id_column).execution_options(
+            yield_per=batch_size, include_deleted=include_deleted
+        )
+        
+        try:
+            result = await self._session.stream(query)
+            try:
+                async for batch in result.scalars().partitions():
+                    yield batch
+            finally:
+                # Release the cursor when the caller stops early or the
+                # generator is closed before the last batch
+                await result.close()
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to stream entities",
+                model=self._model_name,
+                error=str(e)
+            )
+            raise RepositoryError(f"Failed to stream entities: {e}") from e
+    
     # ========================================================================
     # COUNT OPERATION
     # ========================================================================
     
-    @trace_database()
+    @trace_database(sample_rate=0.01)
     async def count(self, include_deleted: bool = False) -> int:
         """Count total entities.
         
@@ -666,36 +1651,82 @@ class BaseRepository(Generic[ModelType]):
             deleted_count = await repo.count(include_deleted=True)
         """
         try:
-            self._logger.debug(
-                "Counting entities",
-                model=self._model.__name__,
-                include_deleted=include_deleted
-            )
-            
-            query = select(func.count(getattr(self._model, 'id')))
-            
-            if not include_deleted and hasattr(self._model, 'deleted_at'):
-                query = query.where(getattr(self._model, 'deleted_at').is_(None))
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Counting entities",
+                    model=self._model_name,
+                    include_deleted=include_deleted
+                )
             
-            result = await self._session.execute(query)
+            # Cached COUNT template, one per include_deleted value
+            result = await self._session.execute(
+                _count_statement(self._model, include_deleted),
+                execution_options={"include_deleted": include_deleted}
+            )
             total = result.scalar() or 0
             
-            self._logger.debug(
-                "Counted entities successfully",
-                model=self._model.__name__,
-                total=total
-            )
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Counted entities successfully",
+                    model=self._model_name,
+                    total=total
+                )
             
             return total
             
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to count entities",
-                model=self._model.__name__,
+                model=self._model_name,
                 error=str(e)
             )
             raise RepositoryError(f"Failed to count entities: {e}") from e
     
+    @trace_database(sample_rate=0.01)
+    async def approx_count(self) -> int:
+        """Estimate the number of rows from PostgreSQL's catalog statistics.
+        
+        Reads pg_class.reltuples, a single catalog lookup, instead of
+        scanning the table like count(). Use it for dashboards and totals on
+        large tables where an exact figure is not needed.
+        
+        Accuracy caveats:
+            - The estimate is only as fresh as the last VACUUM/ANALYZE
+              (autovacuum included), so recent inserts/deletes may be missing
+            - It covers every row in the table, soft-deleted ones included
+        
+        On other databases, or for a table that has never been analyzed,
+        falls back to the exact count().
+        
+        Returns:
+            Estimated number of rows
+            
+        Raises:
+            RepositoryError: For database errors
+        
+        Example:
+            users = await repo.approx_count()
+            print(f"About {users} users")
+        """
+        if self._session.get_bind().dialect.name != "postgresql":
+            return await self.count()
+        
+        table_name = self._model.__table__.fullname  # type: ignore[attr-defined]
+        try:
+            result = await self._session.execute(_APPROX_COUNT, {"table": table_name})
+            estimate = result.scalar()
+        except SQLAlchemyError as e:
+            self._logger.error(
+                "Failed to estimate entity count",
+                model=self._model_name,
+                error=str(e)
+            )
+            raise RepositoryError(f"Failed to estimate entity count: {e}") from e
+        
+        if estimate is None or estimate < 0:
+            return await self.count()
+        return estimate
+    
     # ========================================================================
     # TRANSACTION MANAGEMENT
     # ========================================================================
@@ -704,7 +1735,8 @@ class BaseRepository(Generic[ModelType]):
         """Commit the current transaction.
         
         Persists all pending changes to the database. Call after create/update
-        operations when not using an async context manager.
+        operations when not using an async context manager. Commits the
+        outer transaction, so do not call it inside a savepoint() block.
         
         Example:
             org = await repo.create(name="Test")
@@ -715,11 +1747,12 @@ class BaseRepository(Generic[ModelType]):
         """
         try:
             await self._session.commit()
-            self._logger.debug("Transaction committed", model=self._model.__name__)
+            if self._debug_enabled:
+                self._logger.debug("Transaction committed", model=self._model_name)
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to commit transaction",
-                model=self._model.__name__,
+                model=self._model_name,
                 error=str(e)
             )
             raise RepositoryError(f"Failed to commit transaction: {e}") from e
@@ -728,7 +1761,8 @@ class BaseRepository(Generic[ModelType]):
         """Rollback the current transaction.
         
         Discards all pending changes since the last commit. Use after catching
-        exceptions to undo operations.
+        exceptions to undo operations. Rolls back the outer transaction, so
+        use savepoint() instead when only part of the work should be undone.
         
         Example:
             try:
@@ -742,11 +1776,63 @@ class BaseRepository(Generic[ModelType]):
         """
         try:
             await self._session.rollback()
-            self._logger.debug("Transaction rolled back", model=self._model.__name__)
+            if self._debug_enabled:
+                self._logger.debug("Transaction rolled back", model=self._model_name)
         except SQLAlchemyError as e:
             self._logger.error(
                 "Failed to rollback transaction",
-                model=self._model.__name__,
+                model=self._model_name,
                 error=str(e)
             )
             raise RepositoryError(f"Failed to rollback transaction: {e}") from e
+    
+    @asynccontextmanager
+    async def unit_of_work(self) -> AsyncIterator[Self]:
+        """Group operations into a single transaction with one commit.
+        
+        create/update/delete and the bulk methods only flush; nothing is
+        committed until the block exits. Committing once per batch instead of
+        once per operation avoids a durable log flush (fsync) per row.
+        
+        Yields:
+            This repository
+            
+        Raises:
+            RepositoryError: If the final commit or the rollback fails
+        
+        Example:
+            async with repo.unit_of_work():
+                for row in rows:
+                    await repo.create(**row)
+            # Committed once here; rolled back if the block raised
+        """
+        try:
+            yield self
+        except BaseException:
+            await self.rollback()
+            raise
+        await self.commit()
+    
+    @asynccontextmanager
+    async def savepoint(self) -> AsyncIterator[Self]:
+        """Run a block in a SAVEPOINT nested inside the current transaction.
+        
+        If the block raises, only its own work is rolled back and the outer
+        transaction stays usable; otherwise the savepoint is released. The
+        outer transaction still has to be committed (commit() or
+        unit_of_work()) for anything to persist.
+        
+        Yields:
+            This repository
+        
+        Example:
+            for row in rows:
+                try:
+                    async with repo.savepoint():
+                        await repo.create(**row)
+                except ConflictError:
+                    continue  # Skip the duplicate, keep the other rows
+            await repo.commit()
+        """
+        async with self._session.begin_nested():
+            yield self
@@ -1,10 +1,14 @@
+import logging
+from collections.abc import Iterable
 from typing import Any, Optional, Union
 import uuid
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.logging import get_logger
+from app.models.base import utc_now
 from app.models.organization import Organization
+from app.models.repository import Repository
 from app.repositories.base import (
     BaseRepository,
     PaginationParams,
@@ -34,6 +38,7 @@ class OrganizationRepository:
         # COMPOSITION: Inject BaseRepository as dependency, not inheritance
         self._base_repo = BaseRepository(session, Organization, use_cache=use_cache)
         self._logger = get_logger(f"{__name__}.OrganizationRepository")
+        self._debug_enabled = self._logger.is_enabled_for(logging.DEBUG)
     
     # ========================================================================
     # DELEGATED CRUD METHODS
@@ -107,6 +112,27 @@ class OrganizationRepository:
         """
         return await self._base_repo.get_or_404(entity_id, include_deleted=include_deleted)
     
+    async def get_many(
+        self,
+        entity_ids: Iterable[Union[uuid.UUID, str, int]],
+        include_deleted: bool = False
+    ) -> dict[Any, Organization]:
+        """Get many organizations by ID in one query.
+        
+        Delegates to BaseRepository. Use instead of calling get() in a loop.
+        
+        Args:
+            entity_ids: Organization UUIDs, strings, or integer IDs
+            include_deleted: If True, include soft-deleted organizations
+            
+        Returns:
+            Mapping of ID to Organization for the IDs that were found
+            
+        Raises:
+            RepositoryError: For database errors
+        """
+        return await self._base_repo.get_many(entity_ids, include_deleted=include_deleted)
+    
     async def update(
         self, 
         entity_id: Union[uuid.UUID, str, int], 
@@ -128,7 +154,7 @@ class OrganizationRepository:
             ConflictError: If update conflicts with constraints (unique keys, etc)
             RepositoryError: For other database errors
         """
-        return await self._base_repo.update(entity_id, **kwargs)
+        return await self._base_repo.update(entity_id, return_row=True, **kwargs)
     
     async def delete(
         self, 
@@ -239,10 +265,11 @@ class OrganizationRepository:
             RepositoryError: For database errors
         """
         try:
-            self._logger.debug(
-                "Getting organization by name",
-                name=name
-            )
+            if self._debug_enabled:
+                self._logger.debug(
+                    "Getting organization by name",
+                    name=name
+                )
 
             exclude_soft_deleted = Organization.deleted_at.is_(None)
             query = select(Organization).where(
@@ -253,17 +280,18 @@ class OrganizationRepository:
             result = await self._session.execute(query)
             org = result.scalar_one_or_none()
             
-            if org:
-                self._logger.debug(
-                    "Organization found by name",
-                    name=name,
-                    org_id=org.id
-                )
-            else:
-                self._logger.debug(
-                    "Organization not found by name",
-                    name=name
-                )
+            if self._debug_enabled:
+                if org:
+                    self._logger.debug(
+                        "Organization found by name",
+                        name=name,
+                        org_id=org.id
+                    )
+                else:
+                    self._logger.debug(
+                        "Organization not found by name",
+                        name=name
+                    )
             
             return org
             
@@ -273,4 +301,54 @@ class OrganizationRepository:
                 name=name,
                 error=str(e)
             )
-            raise RepositoryError(f"Failed to get organization by name: {e}") from e
\ No newline at end of file
+            raise RepositoryError(f"Failed to get organization by name: {e}") from e
+    
+    async def refresh_stats(self) -> int:
+        """Recompute total_repositories and total_stars for every organization.
+        
+        Issues a single UPDATE driven by correlated COUNT/SUM subqueries over
+        the repositories table, so the aggregates are computed in the database
+        instead of loading every Repository row into Python.
+        
+        Returns:
+            Number of organizations updated
+            
+        Raises:
+            RepositoryError: For database errors
+        """
+        try:
+            if self._debug_enabled:
+                self._logger.debug("Refreshing organization stats")
+
+            repository_count = (
+                select(func.count())
+                .where(Repository.organization_id == Organization.id)
+                .scalar_subquery()
+            )
+            star_total = (
+                select(func.coalesce(func.sum(Repository.stars), 0))
+                .where(Repository.organization_id == Organization.id)
+                .scalar_subquery()
+            )
+            query = update(Organization).values(
+                total_repositories=repository_count,
+                total_stars=star_total,
+                updated_at=utc_now(),
+            )
+            
+            result = await self._session.execute(query)
+            updated = int(getattr(result, 'rowcount', 0))
+            
+            self._logger.info(
+                "Organization stats refreshed",
+                organizations=updated
+            )
+            
+            return updated
+            
+        except Exception as e:
+            self._logger.error(
+                "Failed to refresh organization stats",
+                error=str(e)
+            )
+            raise RepositoryError(f"Failed to refresh organization stats: {e}") from e
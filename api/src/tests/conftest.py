@@ -28,7 +28,7 @@ from sqlalchemy.ext.asyncio import (
 
 from app.core.config import Settings
 from app.main import app
-from app.models.base import Base
+from app.models.base import AppSession, Base
 
 # Test Environment Configuration:
 # Critical environment variables (ENVIRONMENT, LOG_LEVEL, OTEL_ENABLED, VALKEY_URL)
@@ -118,6 +118,7 @@ async def test_session(test_engine: AsyncEngine) -> AsyncGenerator[AsyncSession,
     async_session_maker = async_sessionmaker(
         test_engine,
         class_=AsyncSession,
+        sync_session_class=AppSession,
         expire_on_commit=False,
         autocommit=False,
         autoflush=False,
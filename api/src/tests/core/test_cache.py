@@ -1,16 +1,24 @@
 """Test Valkey/Redis cache connection management."""
 
-import pytest
+import asyncio
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 from redis.asyncio import Redis
+from redis.asyncio.connection import DefaultParser
 
 from app.core.cache import (
+    SOCKET_BUFFER_SIZE,
+    BufferedConnection,
+    BufferedSSLConnection,
     CacheErrorMessage,
-    create_client,
-    get_cache,
+    _clients,
     check_cache_connection,
     close_cache,
-    cache_client,
+    create_client,
+    get_cache,
+    get_client,
 )
 
 
@@ -21,19 +29,27 @@ class TestCreateClient:
         """Test successful client creation with valid config."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
 
-            with patch("app.core.cache.redis.from_url") as mock_from_url:
-                mock_client = MagicMock(spec=Redis)
-                mock_from_url.return_value = mock_client
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
+                mock_pool = MagicMock()
+                mock_from_url.return_value = mock_pool
 
-                result = create_client()
+                with patch("app.core.cache.Redis.from_pool") as mock_from_pool:
+                    mock_client = MagicMock(spec=Redis)
+                    mock_from_pool.return_value = mock_client
+
+                    result = create_client()
 
                 assert result is mock_client
+                mock_from_pool.assert_called_once_with(mock_pool)
                 mock_from_url.assert_called_once()
                 call_kwargs = mock_from_url.call_args[1]
                 assert call_kwargs["encoding"] == "utf-8"
                 assert call_kwargs["decode_responses"] is True
-                assert call_kwargs["max_connections"] == 20
+                assert call_kwargs["max_connections"] == 10
+                assert call_kwargs["timeout"] == 2.0
                 assert call_kwargs["socket_connect_timeout"] == 5
                 assert call_kwargs["socket_keepalive"] is True
                 assert call_kwargs["health_check_interval"] == 30
@@ -42,12 +58,17 @@ class TestCreateClient:
         """Test client creation with docker-compose service name."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = "redis://valkey:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
+
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
+                mock_from_url.return_value = MagicMock()
 
-            with patch("app.core.cache.redis.from_url") as mock_from_url:
-                mock_client = MagicMock(spec=Redis)
-                mock_from_url.return_value = mock_client
+                with patch("app.core.cache.Redis.from_pool") as mock_from_pool:
+                    mock_client = MagicMock(spec=Redis)
+                    mock_from_pool.return_value = mock_client
 
-                result = create_client()
+                    result = create_client()
 
                 assert result is mock_client
                 # Verify the URL passed to from_url
@@ -55,7 +76,7 @@ class TestCreateClient:
                 assert "valkey" in call_args[0]
 
     def test_create_client_missing_valkey_url(self) -> None:
-        """Test client creation uses FakeRedis when VALKEY_URL is empty and FakeRedis is available."""
+        """Test client creation falls back to FakeRedis when VALKEY_URL is empty."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = ""
 
@@ -66,7 +87,7 @@ class TestCreateClient:
             assert hasattr(client, 'ping')
 
     def test_create_client_none_valkey_url(self) -> None:
-        """Test client creation uses FakeRedis when VALKEY_URL is None and FakeRedis is available."""
+        """Test client creation falls back to FakeRedis when VALKEY_URL is None."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = None
 
@@ -80,8 +101,10 @@ class TestCreateClient:
         """Test that unexpected errors during client creation are masked."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
 
-            with patch("app.core.cache.redis.from_url") as mock_from_url:
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
                 mock_from_url.side_effect = RuntimeError("Unexpected Redis driver error")
 
                 with pytest.raises(ValueError, match=CacheErrorMessage.CREATE_CLIENT_FAILED):
@@ -91,13 +114,24 @@ class TestCreateClient:
         """Test client creation with connection-related errors."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = "redis://invalid-host:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
 
-            with patch("app.core.cache.redis.from_url") as mock_from_url:
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
                 mock_from_url.side_effect = ConnectionError("Cannot resolve hostname")
 
                 with pytest.raises(ValueError, match=CacheErrorMessage.CREATE_CLIENT_FAILED):
                     create_client()
 
+    def test_create_client_invalid_pool_size(self) -> None:
+        """Test client creation fails with a pool size below 1."""
+        with patch("app.core.cache.settings") as mock_settings:
+            mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 0
+
+            with pytest.raises(ValueError, match=CacheErrorMessage.CREATE_CLIENT_POOL_MIN_SIZE):
+                create_client()
+
 
 class TestGetCache:
     """Test get_cache() async dependency."""
@@ -106,45 +140,22 @@ class TestGetCache:
     async def test_get_cache_success(self) -> None:
         """Test successful cache dependency injection."""
         mock_client = AsyncMock(spec=Redis)
-        mock_client.ping = AsyncMock()
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch("app.core.cache.get_client", return_value=mock_client):
             result = await get_cache()
 
             assert result is mock_client
-            mock_client.ping.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_get_cache_connection_failure(self) -> None:
-        """Test cache dependency with connection failure."""
-        mock_client = AsyncMock(spec=Redis)
-        mock_client.ping = AsyncMock(
-            side_effect=ConnectionError("Cannot connect to Valkey")
-        )
-
-        with patch("app.core.cache.cache_client", mock_client):
-            with pytest.raises(RuntimeError, match=CacheErrorMessage.GET_CACHE_FAILED):
-                await get_cache()
 
     @pytest.mark.asyncio
-    async def test_get_cache_timeout(self) -> None:
-        """Test cache dependency with timeout error."""
+    async def test_get_cache_does_not_ping(self) -> None:
+        """Test cache dependency does not add a PING round-trip per request."""
         mock_client = AsyncMock(spec=Redis)
-        mock_client.ping = AsyncMock(side_effect=TimeoutError("Connection timeout"))
-
-        with patch("app.core.cache.cache_client", mock_client):
-            with pytest.raises(RuntimeError, match=CacheErrorMessage.GET_CACHE_FAILED):
-                await get_cache()
+        mock_client.ping = AsyncMock()
 
-    @pytest.mark.asyncio
-    async def test_get_cache_generic_exception(self) -> None:
-        """Test cache dependency with generic exception."""
-        mock_client = AsyncMock(spec=Redis)
-        mock_client.ping = AsyncMock(side_effect=Exception("Unexpected error"))
+        with patch("app.core.cache.get_client", return_value=mock_client):
+            await get_cache()
 
-        with patch("app.core.cache.cache_client", mock_client):
-            with pytest.raises(RuntimeError, match=CacheErrorMessage.GET_CACHE_FAILED):
-                await get_cache()
+            mock_client.ping.assert_not_called()
 
 
 class TestCheckCacheConnection:
@@ -156,7 +167,7 @@ class TestCheckCacheConnection:
         mock_client = AsyncMock(spec=Redis)
         mock_client.ping = AsyncMock()
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch("app.core.cache.get_client", return_value=mock_client):
             result = await check_cache_connection()
 
             assert result is True
@@ -170,7 +181,7 @@ class TestCheckCacheConnection:
             side_effect=ConnectionError("Cannot connect to Valkey")
         )
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch("app.core.cache.get_client", return_value=mock_client):
             result = await check_cache_connection()
 
             assert result is False
@@ -181,7 +192,7 @@ class TestCheckCacheConnection:
         mock_client = AsyncMock(spec=Redis)
         mock_client.ping = AsyncMock(side_effect=TimeoutError("Connection timeout"))
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch("app.core.cache.get_client", return_value=mock_client):
             result = await check_cache_connection()
 
             assert result is False
@@ -192,7 +203,7 @@ class TestCheckCacheConnection:
         mock_client = AsyncMock(spec=Redis)
         mock_client.ping = AsyncMock(side_effect=Exception("Unexpected error"))
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch("app.core.cache.get_client", return_value=mock_client):
             result = await check_cache_connection()
 
             assert result is False
@@ -203,7 +214,7 @@ class TestCheckCacheConnection:
         mock_client = AsyncMock(spec=Redis)
         mock_client.ping = AsyncMock()
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch("app.core.cache.get_client", return_value=mock_client):
             result = await check_cache_connection()
 
             assert isinstance(result, bool)
@@ -222,7 +233,7 @@ class TestCloseCache:
         mock_pool.disconnect = AsyncMock()
         mock_client.connection_pool = mock_pool
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch.dict(_clients, {asyncio.get_running_loop(): mock_client}):
             await close_cache()
 
             mock_client.close.assert_called_once()
@@ -236,7 +247,7 @@ class TestCloseCache:
         mock_pool = AsyncMock()
         mock_client.connection_pool = mock_pool
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch.dict(_clients, {asyncio.get_running_loop(): mock_client}):
             with pytest.raises(RuntimeError, match=CacheErrorMessage.CLOSE_CACHE_FAILED):
                 await close_cache()
 
@@ -249,7 +260,7 @@ class TestCloseCache:
         mock_pool.disconnect = AsyncMock(side_effect=Exception("Disconnect error"))
         mock_client.connection_pool = mock_pool
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch.dict(_clients, {asyncio.get_running_loop(): mock_client}):
             with pytest.raises(RuntimeError, match=CacheErrorMessage.CLOSE_CACHE_FAILED):
                 await close_cache()
 
@@ -263,17 +274,55 @@ class TestCloseCache:
         mock_pool = AsyncMock()
         mock_client.connection_pool = mock_pool
 
-        with patch("app.core.cache.cache_client", mock_client):
+        with patch.dict(_clients, {asyncio.get_running_loop(): mock_client}):
             with pytest.raises(RuntimeError, match=CacheErrorMessage.CLOSE_CACHE_FAILED):
                 await close_cache()
 
 
 class TestClientInitialization:
-    """Test that client is properly initialized at module load."""
+    """Test lazy per-event-loop creation of the cache client."""
+
+    @pytest.mark.asyncio
+    async def test_get_client_returns_singleton(self) -> None:
+        """Test that get_client creates the client once per loop and reuses it."""
+        assert get_client() is not None
+        assert get_client() is get_client()
+
+    def test_get_client_per_event_loop(self) -> None:
+        """Test that each event loop gets its own client."""
+
+        async def fetch() -> Any:
+            return get_client()
+
+        first = asyncio.run(fetch())
+        second = asyncio.run(fetch())
+
+        assert first is not second
+
+    def test_get_client_requires_running_loop(self) -> None:
+        """Test that get_client refuses to bind a client outside a loop."""
+        with pytest.raises(RuntimeError):
+            get_client()
 
-    def test_cache_client_instance_created(self) -> None:
-        """Test that cache_client instance is created at module load."""
-        assert cache_client is not None
+    @pytest.mark.asyncio
+    async def test_close_cache_resets_client(self) -> None:
+        """Test that close_cache drops the loop's client."""
+        client = get_client()
+
+        await close_cache()
+
+        assert asyncio.get_running_loop() not in _clients
+        assert get_client() is not client
+
+    @pytest.mark.asyncio
+    async def test_close_cache_without_client(self) -> None:
+        """Test that close_cache does not create a client just to close it."""
+        _clients.pop(asyncio.get_running_loop(), None)
+
+        with patch("app.core.cache.create_client") as mock_create:
+            await close_cache()
+
+            mock_create.assert_not_called()
 
 
 class TestConnectionPoolConfiguration:
@@ -283,29 +332,104 @@ class TestConnectionPoolConfiguration:
         """Test that connection pool is configured with correct settings."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
 
-            with patch("app.core.cache.redis.from_url") as mock_from_url:
-                mock_client = MagicMock(spec=Redis)
-                mock_from_url.return_value = mock_client
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
+                mock_from_url.return_value = MagicMock()
 
                 create_client()
 
                 call_kwargs = mock_from_url.call_args[1]
 
                 # Verify pool configuration
-                assert call_kwargs["max_connections"] == 20
+                assert call_kwargs["max_connections"] == 10
+                assert call_kwargs["timeout"] == 2.0
                 assert call_kwargs["socket_connect_timeout"] == 5
                 assert call_kwargs["health_check_interval"] == 30
                 assert call_kwargs["socket_keepalive"] is True
 
+    def test_create_client_socket_buffer_configuration(self) -> None:
+        """Test that connections use enlarged socket buffers."""
+        with patch("app.core.cache.settings") as mock_settings:
+            mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
+
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
+                mock_from_url.return_value = MagicMock()
+
+                create_client()
+
+                call_kwargs = mock_from_url.call_args[1]
+
+                assert SOCKET_BUFFER_SIZE == 524288
+                assert call_kwargs["socket_read_size"] == SOCKET_BUFFER_SIZE
+                assert call_kwargs["connection_class"] is BufferedConnection
+
+    @pytest.mark.parametrize(
+        ("url", "expected_class"),
+        [
+            ("redis://localhost:6379/0", BufferedConnection),
+            ("rediss://localhost:6380/0", BufferedSSLConnection),
+        ],
+    )
+    def test_create_client_buffers_tcp_and_tls_connections(
+        self, url: str, expected_class: type
+    ) -> None:
+        """Test that TLS URLs, where redis-py picks SSLConnection, still get buffers."""
+        with patch("app.core.cache.settings") as mock_settings:
+            mock_settings.valkey_url = url
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
+
+            client = create_client()
+
+        assert client.connection_pool.connection_class is expected_class
+
+    def test_create_client_parser_configuration(self) -> None:
+        """Test that the pool uses the redis-py default (hiredis when installed) parser."""
+        with patch("app.core.cache.settings") as mock_settings:
+            mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
+
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
+                mock_from_url.return_value = MagicMock()
+
+                create_client()
+
+                call_kwargs = mock_from_url.call_args[1]
+
+                assert call_kwargs["parser_class"] is DefaultParser
+
+    def test_create_client_warns_without_hiredis(self) -> None:
+        """Test that a missing hiredis install is logged."""
+        with patch("app.core.cache.settings") as mock_settings:
+            mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
+
+            with patch("app.core.cache.HIREDIS_AVAILABLE", False):
+                with patch("app.core.cache.logger") as mock_logger:
+                    with patch(
+                        "app.core.cache.redis.BlockingConnectionPool.from_url"
+                    ) as mock_from_url:
+                        mock_from_url.return_value = MagicMock()
+
+                        create_client()
+
+                        mock_logger.warning.assert_called_once()
+
     def test_create_client_encoding_configuration(self) -> None:
         """Test that client is configured with proper encoding."""
         with patch("app.core.cache.settings") as mock_settings:
             mock_settings.valkey_url = "redis://localhost:6379/0"
+            mock_settings.valkey_pool_size = 10
+            mock_settings.valkey_pool_timeout = 2.0
 
-            with patch("app.core.cache.redis.from_url") as mock_from_url:
-                mock_client = MagicMock(spec=Redis)
-                mock_from_url.return_value = mock_client
+            with patch("app.core.cache.redis.BlockingConnectionPool.from_url") as mock_from_url:
+                mock_from_url.return_value = MagicMock()
 
                 create_client()
 
@@ -324,7 +448,6 @@ class TestErrorMessages:
         assert CacheErrorMessage.CREATE_CLIENT_NO_URL
         assert CacheErrorMessage.CREATE_CLIENT_POOL_MIN_SIZE
         assert CacheErrorMessage.CREATE_CLIENT_FAILED
-        assert CacheErrorMessage.GET_CACHE_FAILED
         assert CacheErrorMessage.CLOSE_CACHE_FAILED
 
     def test_error_messages_are_strings(self) -> None:
@@ -332,7 +455,6 @@ class TestErrorMessages:
         assert isinstance(CacheErrorMessage.CREATE_CLIENT_NO_URL, str)
         assert isinstance(CacheErrorMessage.CREATE_CLIENT_POOL_MIN_SIZE, str)
         assert isinstance(CacheErrorMessage.CREATE_CLIENT_FAILED, str)
-        assert isinstance(CacheErrorMessage.GET_CACHE_FAILED, str)
         assert isinstance(CacheErrorMessage.CLOSE_CACHE_FAILED, str)
         assert len(CacheErrorMessage.CREATE_CLIENT_NO_URL) > 0
         assert len(CacheErrorMessage.CREATE_CLIENT_FAILED) > 0
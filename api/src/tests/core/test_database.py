@@ -1,18 +1,19 @@
 """Test database connection management and session handling."""
 
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch, mock_open
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
-from sqlalchemy import text
 
 from app.core.database import (
     DBErrorMessage,
-    create_engine,
-    get_db,
+    _enable_sqlite_wal,
     check_database_connection,
     close_database,
-    engine,
-    async_session_maker,
+    create_engine,
+    get_db,
+    get_engine,
+    get_session_maker,
 )
 
 
@@ -37,8 +38,41 @@ class TestCreateEngine:
                 call_kwargs = mock_create.call_args[1]
                 assert call_kwargs["pool_size"] == 20
                 assert call_kwargs["max_overflow"] == 10
-                assert call_kwargs["pool_pre_ping"] is True
+                assert "pool_pre_ping" not in call_kwargs
+                assert call_kwargs["pool_use_lifo"] is True
                 assert call_kwargs["pool_recycle"] == 3600
+                assert call_kwargs["query_cache_size"] == 1200
+                assert call_kwargs["connect_args"] == {
+                    "prepared_statement_cache_size": 1024,
+                    "server_settings": {"jit": "off"},
+                }
+    
+    def test_create_engine_sqlite_connect_args(self) -> None:
+        """Test that SQLite engines get a statement cache instead of asyncpg options."""
+        with patch("app.core.database.settings") as mock_settings:
+            mock_settings.database_url = "sqlite+aiosqlite:///./test.db"
+            mock_settings.database_pool_size = 20
+            mock_settings.database_max_overflow = 10
+            
+            with patch("app.core.database.create_async_engine") as mock_create:
+                with patch("app.core.database.event") as mock_event:
+                    engine = create_engine()
+                    
+                    call_kwargs = mock_create.call_args[1]
+                    assert call_kwargs["connect_args"] == {"cached_statements": 1024}
+                    mock_event.listen.assert_called_once_with(
+                        engine.sync_engine, "connect", _enable_sqlite_wal
+                    )
+    
+    def test_enable_sqlite_wal(self) -> None:
+        """Test that the connect hook switches the connection to WAL journaling."""
+        dbapi_connection = MagicMock()
+        
+        _enable_sqlite_wal(dbapi_connection, None)
+        
+        cursor = dbapi_connection.cursor.return_value
+        cursor.execute.assert_called_once_with("PRAGMA journal_mode=WAL")
+        cursor.close.assert_called_once()
     
     def test_create_engine_missing_database_url(self) -> None:
         """Test engine creation fails with missing DATABASE_URL."""
@@ -64,7 +98,9 @@ class TestCreateEngine:
             mock_settings.database_pool_size = 20
             mock_settings.database_max_overflow = -1
             
-            with pytest.raises(ValueError, match=DBErrorMessage.CREATE_ENGINE_NEGATIVE_MAX_OVERFLOW):
+            with pytest.raises(
+                ValueError, match=DBErrorMessage.CREATE_ENGINE_NEGATIVE_MAX_OVERFLOW
+            ):
                 create_engine()
     
     def test_create_engine_unexpected_error_masked(self) -> None:
@@ -87,7 +123,8 @@ class TestCheckDatabaseConnection:
     @pytest.mark.asyncio
     async def test_check_connection_success(self) -> None:
         """Test successful database connection check."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             mock_conn = AsyncMock()
             mock_conn.execute = AsyncMock()
             
@@ -104,7 +141,8 @@ class TestCheckDatabaseConnection:
     @pytest.mark.asyncio
     async def test_check_connection_failure(self) -> None:
         """Test database connection check with connection failure."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             async_context = AsyncMock()
             async_context.__aenter__ = AsyncMock(
                 side_effect=ConnectionError("Cannot connect to database")
@@ -119,7 +157,8 @@ class TestCheckDatabaseConnection:
     @pytest.mark.asyncio
     async def test_check_connection_timeout(self) -> None:
         """Test database connection check with timeout."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             async_context = AsyncMock()
             async_context.__aenter__ = AsyncMock(
                 side_effect=TimeoutError("Connection timeout")
@@ -134,7 +173,8 @@ class TestCheckDatabaseConnection:
     @pytest.mark.asyncio
     async def test_check_connection_generic_exception(self) -> None:
         """Test database connection check with generic exception."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             async_context = AsyncMock()
             async_context.__aenter__ = AsyncMock(
                 side_effect=Exception("Unexpected error")
@@ -159,7 +199,7 @@ class TestGetDb:
         
         mock_session_maker = MagicMock(return_value=mock_session)
         
-        with patch("app.core.database.async_session_maker", mock_session_maker):
+        with patch("app.core.database.get_session_maker", return_value=mock_session_maker):
             async for db in get_db():
                 assert db is mock_session
                 break
@@ -173,7 +213,7 @@ class TestGetDb:
         
         mock_session_maker = MagicMock(return_value=mock_session)
         
-        with patch("app.core.database.async_session_maker", mock_session_maker):
+        with patch("app.core.database.get_session_maker", return_value=mock_session_maker):
             # Consume the generator normally
             async for db in get_db():
                 assert db is mock_session
@@ -191,7 +231,7 @@ class TestGetDb:
         
         mock_session_maker = MagicMock(return_value=mock_session)
         
-        with patch("app.core.database.async_session_maker", mock_session_maker):
+        with patch("app.core.database.get_session_maker", return_value=mock_session_maker):
             # Normal iteration without exceptions
             received_session = None
             async for db in get_db():
@@ -203,13 +243,37 @@ class TestGetDb:
             mock_session_maker.assert_called_once()
 
 
+    @pytest.mark.asyncio
+    async def test_get_db_rolls_back_before_close(self) -> None:
+        """Test that errors roll back the session while it is still open."""
+        calls: list[str] = []
+        mock_session = AsyncMock(spec=AsyncSession)
+        mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+        mock_session.__aexit__ = AsyncMock(
+            side_effect=lambda *args: calls.append("close")
+        )
+        mock_session.rollback = AsyncMock(side_effect=lambda: calls.append("rollback"))
+        
+        mock_session_maker = MagicMock(return_value=mock_session)
+        
+        with patch("app.core.database.get_session_maker", return_value=mock_session_maker):
+            generator = get_db()
+            await generator.__anext__()
+            
+            with pytest.raises(RuntimeError, match=DBErrorMessage.GET_DB_SESSION_FAILED):
+                await generator.athrow(ValueError("handler failed"))
+            
+            assert calls == ["rollback", "close"]
+
+
 class TestCloseDatabase:
     """Test close_database() function."""
     
     @pytest.mark.asyncio
     async def test_close_database_success(self) -> None:
         """Test successful database closure."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             mock_engine.dispose = AsyncMock()
             
             await close_database()
@@ -219,7 +283,8 @@ class TestCloseDatabase:
     @pytest.mark.asyncio
     async def test_close_database_failure(self) -> None:
         """Test database closure with connection disposal error."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             mock_engine.dispose = AsyncMock(
                 side_effect=Exception("Disposal error")
             )
@@ -230,7 +295,8 @@ class TestCloseDatabase:
     @pytest.mark.asyncio
     async def test_close_database_connection_error(self) -> None:
         """Test database closure with connection error."""
-        with patch("app.core.database.engine") as mock_engine:
+        with patch("app.core.database.get_engine") as mock_get_engine:
+            mock_engine = mock_get_engine.return_value
             mock_engine.dispose = AsyncMock(
                 side_effect=ConnectionError("Already disconnected")
             )
@@ -240,20 +306,32 @@ class TestCloseDatabase:
 
 
 class TestEngineInitialization:
-    """Test that engine is properly initialized at module load."""
+    """Test lazy creation of the shared engine and session factory."""
     
     def test_engine_instance_created(self) -> None:
-        """Test that engine instance is created at module load."""
-        assert engine is not None
+        """Test that get_engine creates the engine once and reuses it."""
+        engine = get_engine()
         assert isinstance(engine, AsyncEngine)
+        assert get_engine() is engine
     
     def test_async_session_maker_created(self) -> None:
-        """Test that async_session_maker is properly configured."""
-        assert async_session_maker is not None
+        """Test that the session factory is properly configured."""
+        async_session_maker = get_session_maker()
+        assert get_session_maker() is async_session_maker
         # Verify that the session maker is bound to the engine
         assert async_session_maker.kw.get("expire_on_commit") is False
         assert async_session_maker.kw.get("autocommit") is False
         assert async_session_maker.kw.get("autoflush") is False
-        # Verify that the session maker is bound to an engine
-        assert async_session_maker.kw.get("bind") is not None
-        assert isinstance(async_session_maker.kw.get("bind"), AsyncEngine)
+        # Verify that the session maker is bound to the shared engine
+        assert async_session_maker.kw.get("bind") is get_engine()
+    
+    @pytest.mark.asyncio
+    async def test_close_database_without_engine(self) -> None:
+        """Test that close_database does not create an engine just to dispose it."""
+        get_session_maker.cache_clear()
+        get_engine.cache_clear()
+        
+        with patch("app.core.database.create_engine") as mock_create:
+            await close_database()
+            
+            mock_create.assert_not_called()
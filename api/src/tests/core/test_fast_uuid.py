@@ -0,0 +1,35 @@
+"""Test fast request ID generation."""
+
+import uuid
+
+from app.core.fast_uuid import _reseed, _rng, new_request_id
+
+
+class TestNewRequestId:
+    """Test new_request_id() output format and uniqueness."""
+
+    def test_request_id_is_uuid4(self) -> None:
+        """Test that generated IDs are canonical RFC 4122 version 4 UUIDs."""
+        for _ in range(1000):
+            request_id = new_request_id()
+            parsed = uuid.UUID(request_id)
+
+            assert parsed.version == 4
+            assert parsed.variant == uuid.RFC_4122
+            assert str(parsed) == request_id
+
+    def test_request_ids_are_unique(self) -> None:
+        """Test that consecutive IDs do not repeat."""
+        request_ids = {new_request_id() for _ in range(10000)}
+
+        assert len(request_ids) == 10000
+
+    def test_reseed_changes_sequence(self) -> None:
+        """Test that reseeding (as done after fork) diverges from the parent sequence."""
+        state = _rng.getstate()
+        parent_next = new_request_id()
+
+        _rng.setstate(state)
+        _reseed()
+
+        assert new_request_id() != parent_next
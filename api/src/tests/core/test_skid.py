@@ -0,0 +1,47 @@
+"""Test 64-bit time-ordered ID generation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from app.core import skid
+from app.core.skid import EPOCH_MS, SEQUENCE_BITS, WORKER_BITS, next_skid
+
+
+class TestNextSkid:
+    """Test next_skid() ordering and layout."""
+
+    def test_ids_are_strictly_increasing(self) -> None:
+        """Test that consecutive IDs increase, including within one millisecond."""
+        ids = [next_skid() for _ in range(10000)]
+
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+
+    def test_id_fits_signed_bigint(self) -> None:
+        """Test that IDs are positive and fit a signed 64-bit column."""
+        assert 0 < next_skid() < 2**63
+
+    def test_id_leads_with_timestamp(self) -> None:
+        """Test that the high bits carry milliseconds since the custom epoch."""
+        with patch("app.core.skid.time.time_ns", return_value=(EPOCH_MS + 10**9) * 10**6):
+            with patch.object(skid, "_last_ms", 0), patch.object(skid, "_worker_id", 5):
+                value = next_skid()
+
+        assert value >> (WORKER_BITS + SEQUENCE_BITS) == 10**9
+        assert (value >> SEQUENCE_BITS) & ((1 << WORKER_BITS) - 1) == 5
+
+    def test_clock_going_backwards_keeps_order(self) -> None:
+        """Test that a clock step backwards does not produce smaller IDs."""
+        first = next_skid()
+        with patch("app.core.skid.time.time_ns", return_value=0):
+            second = next_skid()
+
+        assert second > first
+
+    def test_invalid_configured_worker_id(self) -> None:
+        """Test that an out-of-range SKID_WORKER_ID is rejected."""
+        with patch("app.core.skid.settings") as mock_settings:
+            mock_settings.skid_worker_id = 1 << WORKER_BITS
+            with pytest.raises(ValueError, match="SKID_WORKER_ID"):
+                skid._resolve_worker_id()
@@ -0,0 +1,159 @@
+"""Test OpenTelemetry tracing helpers."""
+
+from unittest.mock import patch
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from app.core.tracing import NOOP_SPAN, create_span, trace_async, trace_sync
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    """In-memory span exporter attached to a local tracer provider."""
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter: InMemorySpanExporter) -> trace.Tracer:
+    """Tracer that records finished spans into the in-memory exporter."""
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer(__name__)
+
+
+class TestCreateSpan:
+    """Test create_span() helper."""
+
+    def test_create_span_disabled_returns_noop(self, tracer: trace.Tracer) -> None:
+        """Test that the shared no-op span is returned when tracing is disabled."""
+        with patch("app.core.tracing._TRACING_ENABLED", False):
+            first = create_span(tracer, "test")
+            second = create_span(tracer, "other", attr=1)
+
+        assert first is NOOP_SPAN
+        assert second is NOOP_SPAN
+
+    def test_create_span_is_current_span(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that the span is current inside the with block so children nest."""
+        with patch("app.core.tracing._TRACING_ENABLED", True):
+            with create_span(tracer, "parent") as span:
+                assert trace.get_current_span() is span
+                with tracer.start_as_current_span("child"):
+                    pass
+
+        child, parent = exporter.get_finished_spans()
+        assert child.parent is not None
+        assert child.parent.span_id == parent.context.span_id
+
+    def test_create_span_keeps_native_attribute_types(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that attributes keep their types and None values are dropped."""
+        with patch("app.core.tracing._TRACING_ENABLED", True):
+            with create_span(tracer, "test", count=3, flag=True, label="x", missing=None):
+                pass
+
+        (span,) = exporter.get_finished_spans()
+        assert dict(span.attributes or {}) == {"count": 3, "flag": True, "label": "x"}
+
+
+class TestTraceDecorators:
+    """Test trace_async() and trace_sync() decorators."""
+
+    @pytest.mark.asyncio
+    async def test_trace_async_wraps_when_disabled_at_decoration(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that functions decorated before tracing is enabled are still traced."""
+        with (
+            patch("app.core.tracing._TRACING_ENABLED", False),
+            patch("app.core.tracing.get_tracer", return_value=tracer),
+        ):
+            @trace_async("test.async", component="test")
+            async def traced() -> int:
+                return 42
+
+        assert await traced() == 42
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "test.async"
+        assert dict(span.attributes or {}) == {"component": "test"}
+
+    def test_trace_sync_records_exception(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that exceptions are recorded on the span and re-raised."""
+        with (
+            patch("app.core.tracing._TRACING_ENABLED", False),
+            patch("app.core.tracing.get_tracer", return_value=tracer),
+        ):
+            @trace_sync("test.sync")
+            def failing() -> None:
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            failing()
+
+        (span,) = exporter.get_finished_spans()
+        assert span.status.status_code == trace.StatusCode.ERROR
+        assert span.events[0].name == "exception"
+
+    @pytest.mark.asyncio
+    async def test_trace_async_span_is_parent_of_nested_spans(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that the decorator span is current so nested spans become children."""
+        with patch("app.core.tracing.get_tracer", return_value=tracer):
+            @trace_async("test.parent", retries=3)
+            async def traced() -> None:
+                with tracer.start_as_current_span("child"):
+                    pass
+
+        await traced()
+
+        child, parent = exporter.get_finished_spans()
+        assert child.parent is not None
+        assert child.parent.span_id == parent.context.span_id
+        assert dict(parent.attributes or {}) == {"retries": 3}
+
+    @pytest.mark.asyncio
+    async def test_trace_async_sample_rate_skips_unsampled_calls(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that calls losing the coin flip outside a sampled trace get no span."""
+        with patch("app.core.tracing.get_tracer", return_value=tracer):
+            @trace_async("test.sampled", sample_rate=0.01)
+            async def traced() -> int:
+                return 42
+
+        with patch("app.core.tracing.random.random", return_value=0.5):
+            assert await traced() == 42
+        assert exporter.get_finished_spans() == ()
+
+        with patch("app.core.tracing.random.random", return_value=0.001):
+            assert await traced() == 42
+        (span,) = exporter.get_finished_spans()
+        assert span.name == "test.sampled"
+
+    @pytest.mark.asyncio
+    async def test_trace_async_sample_rate_always_traces_sampled_parent(
+        self, tracer: trace.Tracer, exporter: InMemorySpanExporter
+    ) -> None:
+        """Test that calls inside a sampled trace are traced regardless of sample_rate."""
+        with patch("app.core.tracing.get_tracer", return_value=tracer):
+            @trace_async("test.child", sample_rate=0.0)
+            async def traced() -> None:
+                pass
+
+        with tracer.start_as_current_span("parent"):
+            await traced()
+
+        child, parent = exporter.get_finished_spans()
+        assert child.name == "test.child"
+        assert child.parent is not None
+        assert child.parent.span_id == parent.context.span_id
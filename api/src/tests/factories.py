@@ -22,7 +22,7 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.api_key import APIKey, TierEnum
+from app.models.api_key import APIKey, TierEnum, hash_api_key
 from app.models.dependency import Dependency, DependencyTypeEnum
 from app.models.organization import Organization
 from app.models.package import Package
@@ -258,7 +258,7 @@ async def create_api_key(
         )
     """
     # Generate unique key_hash if not provided
-    default_key_hash = kwargs.get("key_hash", f"test_key_{uuid.uuid4().hex}")
+    default_key_hash = kwargs.get("key_hash", hash_api_key(f"test_key_{uuid.uuid4().hex}"))
 
     defaults = {
         "key_hash": default_key_hash,
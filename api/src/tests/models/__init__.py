@@ -0,0 +1 @@
+"""Tests for app.models module."""
@@ -0,0 +1,32 @@
+"""Test APIKey model helpers."""
+
+import hashlib
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.api_key import APIKey, hash_api_key
+from tests.factories import create_api_key
+
+
+class TestHashApiKey:
+    """Test hash_api_key() digests."""
+
+    def test_returns_raw_sha256_digest(self) -> None:
+        """Test that the stored form is the 32-byte digest, not hex."""
+        digest = hash_api_key("wump_secret")
+
+        assert digest == hashlib.sha256(b"wump_secret").digest()
+        assert len(digest) == 32
+
+    @pytest.mark.asyncio
+    async def test_lookup_by_key_hash(self, db_session: AsyncSession) -> None:
+        """Test that an API key is found by hashing the presented raw key."""
+        await create_api_key(db_session=db_session, key_hash=hash_api_key("wump_secret"))
+
+        result = await db_session.scalars(
+            select(APIKey).where(APIKey.key_hash == hash_api_key("wump_secret"))
+        )
+
+        assert result.one().key_hash == hash_api_key("wump_secret")
@@ -0,0 +1,108 @@
+"""Test model base helpers."""
+
+import uuid
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.base import SmallIntEnum, generate_repr, utc_now
+from app.models.dependency import DEPENDENCY_TYPE_CODES, Dependency, DependencyTypeEnum
+from app.models.organization import Organization
+from tests.factories import create_dependency, create_organization
+
+
+class TestGenerateRepr:
+    """Test generate_repr() output."""
+
+    def test_repr_multiple_attributes(self) -> None:
+        """Test that every attribute is rendered with repr() in order."""
+        org_id = uuid.uuid4()
+        org = Organization(id=org_id, name="repr-org")
+
+        assert repr(org) == f"Organization(id={org_id!r}, name='repr-org')"
+
+    def test_repr_single_and_no_attributes(self) -> None:
+        """Test the single-attribute and empty forms, including tuple values."""
+
+        class Single:
+            value = (1, 2)
+            __repr__ = generate_repr("value")
+
+        class Empty:
+            __repr__ = generate_repr()
+
+        assert repr(Single()) == "Single(value=(1, 2))"
+        assert repr(Empty()) == "Empty()"
+
+
+class TestSmallIntEnum:
+    """Test SmallIntEnum code mapping."""
+
+    def test_bind_and_result_round_trip(self) -> None:
+        """Test that members and raw values bind to codes and codes load as members."""
+        column_type = SmallIntEnum(DependencyTypeEnum, DEPENDENCY_TYPE_CODES)
+
+        assert column_type.process_bind_param(DependencyTypeEnum.PEER, None) == 4
+        assert column_type.process_bind_param("dev", None) == 2
+        assert column_type.process_bind_param(None, None) is None
+        assert column_type.process_result_value(3, None) is DependencyTypeEnum.OPTIONAL
+
+    def test_unknown_value_rejected(self) -> None:
+        """Test that values outside the enum are rejected before reaching the database."""
+        column_type = SmallIntEnum(DependencyTypeEnum, DEPENDENCY_TYPE_CODES)
+
+        with pytest.raises(ValueError):
+            column_type.process_bind_param("transitive", None)
+
+    @pytest.mark.asyncio
+    async def test_dependency_type_stored_as_code(self, db_session: AsyncSession) -> None:
+        """Test that dependency_type persists as its integer code and filters by value."""
+        dependency = await create_dependency(
+            db_session=db_session, dependency_type=DependencyTypeEnum.DEV
+        )
+
+        raw = await db_session.execute(
+            text("SELECT dependency_type FROM dependencies WHERE id = :id"),
+            {"id": dependency.id},
+        )
+        assert raw.scalar_one() == 2
+
+        loaded = await db_session.scalars(
+            select(Dependency).where(Dependency.dependency_type == "dev")
+        )
+        assert loaded.one().dependency_type is DependencyTypeEnum.DEV
+
+
+class TestSoftDeleteMixin:
+    """Test the AppSession soft-delete criteria and live-row index."""
+
+    def test_alive_partial_index(self) -> None:
+        """Test that soft-delete tables get a partial index over live rows."""
+        (index,) = [
+            index for index in Organization.__table__.indexes
+            if index.name == "idx_organizations_alive"
+        ]
+
+        assert [column.name for column in index.columns] == ["id"]
+        assert str(index.dialect_options["postgresql"]["where"]) == (
+            "organizations.deleted_at IS NULL"
+        )
+
+    @pytest.mark.asyncio
+    async def test_selects_skip_soft_deleted_unless_requested(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that plain ORM selects hide soft-deleted rows by default."""
+        live = await create_organization(db_session=db_session, name="alive-org")
+        deleted = await create_organization(db_session=db_session, name="deleted-org")
+        deleted.deleted_at = utc_now()
+        await db_session.flush()
+
+        visible = await db_session.scalars(select(Organization))
+        assert [org.id for org in visible] == [live.id]
+
+        everything = await db_session.scalars(
+            select(Organization).execution_options(include_deleted=True)
+        )
+        assert {org.id for org in everything} == {live.id, deleted.id}
@@ -0,0 +1,116 @@
+"""Test Package model name key and column loading."""
+
+import uuid
+
+import pytest
+from sqlalchemy import inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import undefer
+
+from app.models.package import Package, package_name_key
+from app.repositories.base import BaseRepository, ConflictError, PaginationParams
+from tests.factories import create_package
+
+
+class TestPackageNameKey:
+    """Test package_name_key() and how Package keeps it in sync."""
+
+    def test_key_is_deterministic_signed_64_bit(self) -> None:
+        """Test that the key is stable, fits BIGINT and separates ecosystems."""
+        key = package_name_key("npm", "react")
+
+        assert key == package_name_key("npm", "react")
+        assert -(2**63) <= key < 2**63
+        assert key != package_name_key("pypi", "react")
+        assert package_name_key("a/b", "c") != package_name_key("a", "b/c")
+
+    def test_instance_key_follows_name_changes(self) -> None:
+        """Test that setting name or ecosystem on an instance recomputes the key."""
+        package = Package(name="react", ecosystem="npm")
+        assert package.name_key == package_name_key("npm", "react")
+
+        package.name = "preact"
+        assert package.name_key == package_name_key("npm", "preact")
+
+    @pytest.mark.asyncio
+    async def test_bulk_insert_sets_key_and_enforces_uniqueness(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that bulk inserts get the key from the column default and duplicates fail."""
+        repo = BaseRepository(db_session, Package)
+
+        (package,) = await repo.bulk_create(
+            [{"name": "fastapi", "ecosystem": "pypi"}], returning=True
+        )
+        assert package.name_key == package_name_key("pypi", "fastapi")
+
+        with pytest.raises(ConflictError):
+            await repo.bulk_create([{"name": "fastapi", "ecosystem": "pypi"}])
+
+    @pytest.mark.asyncio
+    async def test_repository_updates_recompute_key(self, db_session: AsyncSession) -> None:
+        """Test that renames through update(), bulk_update() and bulk_update_rows() move the key."""
+        repo = BaseRepository(db_session, Package)
+        first, second = await repo.bulk_create(
+            [{"name": "a", "ecosystem": "pypi"}, {"name": "c", "ecosystem": "pypi"}],
+            returning=True,
+        )
+
+        renamed = await repo.update(first.id, return_row=True, name="b", ecosystem="pypi")
+        assert renamed is not None
+        assert renamed.name_key == package_name_key("pypi", "b")
+        await repo.bulk_update([second.id], name="d", ecosystem="npm")
+        await repo.bulk_update_rows([{"id": second.id, "name": "e", "ecosystem": "npm"}])
+
+        # The old name is free again and the new one is taken
+        await repo.create(name="a", ecosystem="pypi")
+        for name, ecosystem in (("b", "pypi"), ("e", "npm")):
+            with pytest.raises(ConflictError):
+                async with repo.savepoint():
+                    await repo.create(name=name, ecosystem=ecosystem)
+
+    @pytest.mark.asyncio
+    async def test_partial_updates_read_the_other_column(self, db_session: AsyncSession) -> None:
+        """Test that updating only name or ecosystem still recomputes the key."""
+        repo = BaseRepository(db_session, Package)
+        first, second, third = await repo.bulk_create(
+            [
+                {"name": "solo", "ecosystem": "pypi"},
+                {"name": "duo", "ecosystem": "npm"},
+                {"name": "trio", "ecosystem": "cargo"},
+            ],
+            returning=True,
+        )
+
+        renamed = await repo.update(first.id, return_row=True, name="renamed")
+        assert renamed is not None
+        assert renamed.name_key == package_name_key("pypi", "renamed")
+        await repo.bulk_update([second.id, third.id], name="shared")
+        await repo.bulk_update_rows([{"id": third.id, "ecosystem": "pypi"}])
+        await repo.bulk_update_rows([{"id": uuid.uuid4(), "name": "missing"}])
+
+        rows = await db_session.execute(select(Package.id, Package.name_key))
+        keys = {package_id: key for package_id, key in rows}
+        assert keys[second.id] == package_name_key("npm", "shared")
+        assert keys[third.id] == package_name_key("pypi", "shared")
+
+class TestPackageDescriptionLoading:
+    """Test that Package.description is deferred on list queries."""
+
+    @pytest.mark.asyncio
+    async def test_description_deferred_unless_undeferred(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that description is only loaded when the query asks for it."""
+        await create_package(db_session=db_session, description="Long text")
+        db_session.expunge_all()
+        repo = BaseRepository(db_session, Package)
+
+        (package,) = (await repo.list(PaginationParams())).items
+        assert "description" in inspect(package).unloaded
+
+        db_session.expunge_all()
+        (package,) = (
+            await repo.list(PaginationParams(), options=[undefer(Package.description)])
+        ).items
+        assert package.description == "Long text"
@@ -1,23 +1,30 @@
 """Test base repository functionality."""
 
 import uuid
-import pytest
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
-from sqlalchemy import String, DateTime
-from sqlalchemy.orm import Mapped, mapped_column
+
+import pytest
+from sqlalchemy import String, inspect
+from sqlalchemy.dialects.postgresql import asyncpg as postgresql_asyncpg
+from sqlalchemy.exc import IntegrityError, InvalidRequestError, SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.orm import Mapped, defer, mapped_column, selectinload
 
-from app.models.base import Base, UUIDMixin, TimestampMixin, SoftDeleteMixin
+from app.models.base import Base, SoftDeleteMixin, TimestampMixin, UUIDMixin, utc_now
+from app.models.dependency import Dependency, DependencyTypeEnum
+from app.models.organization import Organization
 from app.repositories.base import (
     BaseRepository,
-    PaginationParams,
+    ConflictError,
+    CursorPaginatedResult,
+    CursorPaginationParams,
+    NotFoundError,
     PaginatedResult,
+    PaginationParams,
     RepositoryError,
-    NotFoundError,
-    ConflictError,
 )
+from tests.factories import create_dependency, create_package
 
 
 # Test model for repository testing
@@ -60,6 +67,29 @@ class TestPaginationParams:
         with pytest.raises(ValueError, match="Limit must be between 1 and 1000"):
             PaginationParams(limit=1001)
 
+    
+    def test_no_instance_dict(self) -> None:
+        """Test that pagination containers use slots instead of a per-instance dict."""
+        params = PaginationParams()
+        result = PaginatedResult(items=[], total=0, offset=0, limit=50)
+        
+        assert not hasattr(params, "__dict__")
+        assert not hasattr(result, "__dict__")
+
+class TestCursorPaginationParams:
+    """Test CursorPaginationParams validation."""
+    
+    def test_default_params(self) -> None:
+        """Test default parameter values start at the first page."""
+        params = CursorPaginationParams()
+        assert params.after is None
+        assert params.limit == 50
+    
+    def test_excessive_limit(self) -> None:
+        """Test validation of excessive limit."""
+        with pytest.raises(ValueError, match="Limit must be between 1 and 1000"):
+            CursorPaginationParams(limit=1001)
+
 
 class TestPaginatedResult:
     """Test PaginatedResult functionality."""
@@ -124,17 +154,19 @@ class TestBaseRepository:
         created_entity.id = uuid.uuid4()
         
         # Mock session behavior
-        mock_session.add.return_value = None
-        mock_session.flush.return_value = None
-        mock_session.refresh.return_value = None
+        mock_result = MagicMock()
+        mock_result.scalar_one.return_value = created_entity
+        mock_session.execute.return_value = mock_result
         
         # Execute
         result = await repository.create(**entity_data)
         
-        # Verify
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        # Verify: a single INSERT ... RETURNING, no flush or refresh
+        mock_session.execute.assert_called_once()
+        statement = mock_session.execute.call_args.args[0]
+        assert statement.is_insert and statement._returning
+        mock_session.flush.assert_not_called()
+        mock_session.refresh.assert_not_called()
         assert isinstance(result, RepositoryTestModel)
         assert result.name == entity_data["name"]
         assert result.description == entity_data["description"]
@@ -144,22 +176,42 @@ class TestBaseRepository:
     ) -> None:
         """Test create with constraint violation."""
         # Setup
-        mock_session.flush.side_effect = IntegrityError(
+        unique_violation = Exception("duplicate key value violates unique constraint")
+        unique_violation.sqlstate = "23505"  # type: ignore[attr-defined]
+        mock_session.execute.side_effect = IntegrityError(
             statement="INSERT INTO test_models...",
             params={},
-            orig=Exception("UNIQUE constraint failed"),
+            orig=unique_violation,
         )
         
         # Execute & Verify
         with pytest.raises(ConflictError, match="Entity conflicts with existing data"):
             await repository.create(name="duplicate_name")
     
+    async def test_create_other_integrity_error_is_not_conflict(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that only the unique-violation error code maps to ConflictError."""
+        # Setup: message mentions "unique" but the code is a NOT NULL violation
+        not_null_violation = Exception('null value in column "unique_name"')
+        not_null_violation.sqlstate = "23502"  # type: ignore[attr-defined]
+        mock_session.execute.side_effect = IntegrityError(
+            statement="INSERT INTO test_models...",
+            params={},
+            orig=not_null_violation,
+        )
+        
+        # Execute & Verify
+        with pytest.raises(RepositoryError) as exc_info:
+            await repository.create(name="test_item")
+        assert not isinstance(exc_info.value, ConflictError)
+    
     async def test_create_generic_error(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
         """Test create with generic database error."""
         # Setup
-        mock_session.flush.side_effect = SQLAlchemyError("Database connection lost")
+        mock_session.execute.side_effect = SQLAlchemyError("Database connection lost")
         
         # Execute & Verify
         with pytest.raises(RepositoryError, match="Failed to create entity"):
@@ -168,39 +220,92 @@ class TestBaseRepository:
     async def test_get_existing_entity(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
-        """Test getting an existing entity by ID."""
+        """Test getting an existing entity by ID through Session.get()."""
         # Setup
         entity_id = uuid.uuid4()
         entity = RepositoryTestModel(id=entity_id, name="test_item")
-        
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = entity
-        mock_session.execute.return_value = mock_result
+        mock_session.get.return_value = entity
         
         # Execute
         result = await repository.get(entity_id)
         
-        # Verify
+        # Verify: identity-map aware lookup, no explicit SELECT
         assert result == entity
-        mock_session.execute.assert_called_once()
+        mock_session.get.assert_called_once()
+        assert mock_session.get.call_args.args == (RepositoryTestModel, entity_id)
+        mock_session.execute.assert_not_called()
     
-    async def test_get_nonexistent_entity(
+    async def test_get_filters_soft_deleted_entity_in_python(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
-        """Test getting a non-existent entity."""
+        """Test that soft-deleted entities are dropped after the lookup, not in SQL."""
         # Setup
         entity_id = uuid.uuid4()
+        entity = RepositoryTestModel(
+            id=entity_id, name="test_item", deleted_at=datetime.now(UTC)
+        )
+        mock_session.get.return_value = entity
         
+        # Execute & Verify
+        assert await repository.get(entity_id) is None
+        assert await repository.get(entity_id, include_deleted=True) is entity
+        for call in mock_session.get.call_args_list:
+            assert call.kwargs["execution_options"] == {"include_deleted": True}
+            assert call.kwargs["populate_existing"] is False
+    
+    async def test_count_shares_statement_across_repositories(
+        self, mock_session: AsyncMock
+    ) -> None:
+        """Test that count() on separate repositories executes one cached statement."""
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+        mock_result.scalar.return_value = 3
         mock_session.execute.return_value = mock_result
         
+        assert await BaseRepository(mock_session, RepositoryTestModel).count() == 3
+        await BaseRepository(mock_session, RepositoryTestModel).count()
+        await BaseRepository(mock_session, RepositoryTestModel).count(include_deleted=True)
+        
+        first, second, third = mock_session.execute.call_args_list
+        assert first.args[0] is second.args[0]
+        assert "count(*)" in str(first.args[0])
+        assert "deleted_at IS NULL" in str(first.args[0])
+        assert "deleted_at" not in str(third.args[0])
+        assert third.kwargs["execution_options"] == {"include_deleted": True}
+    
+    async def test_get_nonexistent_entity(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test getting a non-existent entity."""
+        # Setup
+        entity_id = uuid.uuid4()
+        mock_session.get.return_value = None
+        
         # Execute
         result = await repository.get(entity_id)
         
         # Verify
         assert result is None
     
+    async def test_get_skips_debug_logging_when_disabled(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that debug events are not built when debug logging is off."""
+        # Setup
+        mock_session.get.return_value = None
+        repository._logger = MagicMock()
+        repository._debug_enabled = False
+        
+        # Execute
+        await repository.get(uuid.uuid4())
+        
+        # Verify
+        repository._logger.debug.assert_not_called()
+        
+        # Re-enabled, both the lookup and its outcome are logged
+        repository._debug_enabled = True
+        await repository.get(uuid.uuid4())
+        assert repository._logger.debug.call_count == 2
+    
     async def test_get_or_404_existing(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
@@ -208,10 +313,7 @@ class TestBaseRepository:
         # Setup
         entity_id = uuid.uuid4()
         entity = RepositoryTestModel(id=entity_id, name="test_item")
-        
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = entity
-        mock_session.execute.return_value = mock_result
+        mock_session.get.return_value = entity
         
         # Execute
         result = await repository.get_or_404(entity_id)
@@ -225,19 +327,18 @@ class TestBaseRepository:
         """Test get_or_404 with non-existent entity."""
         # Setup
         entity_id = uuid.uuid4()
-        
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_session.execute.return_value = mock_result
+        mock_session.get.return_value = None
         
         # Execute & Verify
-        with pytest.raises(NotFoundError, match=f"RepositoryTestModel with id {entity_id} not found"):
+        with pytest.raises(
+            NotFoundError, match=f"RepositoryTestModel with id {entity_id} not found"
+        ):
             await repository.get_or_404(entity_id)
     
     async def test_update_existing_entity(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
-        """Test updating an existing entity."""
+        """Test updating an existing entity with the row returned."""
         # Setup
         entity_id = uuid.uuid4()
         updated_entity = RepositoryTestModel(id=entity_id, name="updated_name")
@@ -247,7 +348,7 @@ class TestBaseRepository:
         mock_session.execute.return_value = mock_result
         
         # Execute
-        result = await repository.update(entity_id, name="updated_name")
+        result = await repository.update(entity_id, return_row=True, name="updated_name")
         
         # Verify
         assert result == updated_entity
@@ -256,7 +357,7 @@ class TestBaseRepository:
     async def test_update_nonexistent_entity(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
-        """Test updating a non-existent entity."""
+        """Test updating a non-existent entity with the row requested."""
         # Setup
         entity_id = uuid.uuid4()
         
@@ -265,11 +366,28 @@ class TestBaseRepository:
         mock_session.execute.return_value = mock_result
         
         # Execute
-        result = await repository.update(entity_id, name="updated_name")
+        result = await repository.update(entity_id, return_row=True, name="updated_name")
         
         # Verify
         assert result is None
     
+    async def test_update_without_row_uses_rowcount(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that the default update is a plain UPDATE judged by rowcount."""
+        # Setup
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_session.execute.return_value = mock_result
+        
+        # Execute
+        result = await repository.update(uuid.uuid4(), name="updated_name")
+        
+        # Verify
+        assert result is True
+        statement = mock_session.execute.call_args.args[0]
+        assert not statement._returning
+    
     async def test_soft_delete_success(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
@@ -291,22 +409,22 @@ class TestBaseRepository:
     async def test_hard_delete_success(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
-        """Test successful hard delete."""
+        """Test that a hard delete is a single DELETE statement."""
         # Setup
         entity_id = uuid.uuid4()
-        entity = RepositoryTestModel(id=entity_id, name="test_item")
         
-        # Mock get method to return entity
-        mock_get_result = MagicMock()
-        mock_get_result.scalar_one_or_none.return_value = entity
-        mock_session.execute.return_value = mock_get_result
+        mock_result = MagicMock()
+        mock_result.rowcount = 1
+        mock_session.execute.return_value = mock_result
         
         # Execute
         result = await repository.delete(entity_id, soft=False)
         
         # Verify
         assert result is True
-        mock_session.delete.assert_called_once_with(entity)
+        mock_session.execute.assert_called_once()
+        assert mock_session.execute.call_args.args[0].is_delete
+        mock_session.delete.assert_not_called()
     
     async def test_delete_nonexistent_entity(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
@@ -333,14 +451,10 @@ class TestBaseRepository:
         entities = [RepositoryTestModel(name=f"item_{i}") for i in range(3)]
         pagination = PaginationParams(offset=0, limit=10)
         
-        # Mock execute calls for items and count
-        mock_items_result = MagicMock()
-        mock_items_result.scalars.return_value.all.return_value = entities
-        
-        mock_count_result = MagicMock()
-        mock_count_result.scalar.return_value = 25
-        
-        mock_session.execute.side_effect = [mock_items_result, mock_count_result]
+        # Mock the single page query returning (entity, window total) rows
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(entity, 25) for entity in entities]
+        mock_session.execute.return_value = mock_result
         
         # Execute
         result = await repository.list(pagination=pagination)
@@ -353,7 +467,7 @@ class TestBaseRepository:
         assert result.limit == 10
         assert result.has_next is True
         assert result.has_prev is False
-        assert len(mock_session.execute.call_args_list) == 2
+        mock_session.execute.assert_called_once()
     
     async def test_list_default_pagination(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
@@ -362,13 +476,9 @@ class TestBaseRepository:
         # Setup
         entities = [RepositoryTestModel(name=f"item_{i}") for i in range(5)]
         
-        mock_items_result = MagicMock()
-        mock_items_result.scalars.return_value.all.return_value = entities
-        
-        mock_count_result = MagicMock()
-        mock_count_result.scalar.return_value = 5
-        
-        mock_session.execute.side_effect = [mock_items_result, mock_count_result]
+        mock_result = MagicMock()
+        mock_result.all.return_value = [(entity, 5) for entity in entities]
+        mock_session.execute.return_value = mock_result
         
         # Execute
         result = await repository.list()
@@ -378,6 +488,20 @@ class TestBaseRepository:
         assert result.limit == 50  # Default limit
         assert result.total == 5
     
+    async def test_list_applies_loader_options(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that caller-supplied loader options are applied to the items query."""
+        mock_result = MagicMock()
+        mock_result.all.return_value = []
+        mock_session.execute.return_value = mock_result
+        option = defer(RepositoryTestModel.description)
+        
+        await repository.list(options=[option])
+        
+        items_query = mock_session.execute.call_args_list[0][0][0]
+        assert option in items_query._with_options
+    
     async def test_count_entities(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
@@ -410,6 +534,30 @@ class TestBaseRepository:
         assert result == 50
         # Should not have deleted_at filter in query
     
+    async def test_approx_count_reads_catalog_estimate_on_postgresql(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that approx_count() uses pg_class.reltuples and falls back when unanalyzed."""
+        # Setup
+        mock_session.get_bind.return_value.dialect.name = "postgresql"
+        estimate_result = MagicMock()
+        estimate_result.scalar.return_value = 1_000_000
+        mock_session.execute.return_value = estimate_result
+        
+        # Execute & Verify
+        assert await repository.approx_count() == 1_000_000
+        statement, params = mock_session.execute.call_args.args
+        assert "pg_class" in str(statement)
+        assert params == {"table": "test_models"}
+        
+        # Never analyzed: reltuples is -1, so the exact count is used
+        unanalyzed_result = MagicMock()
+        unanalyzed_result.scalar.return_value = -1
+        count_result = MagicMock()
+        count_result.scalar.return_value = 7
+        mock_session.execute.side_effect = [unanalyzed_result, count_result]
+        assert await repository.approx_count() == 7
+    
     async def test_commit_transaction(
         self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
     ) -> None:
@@ -452,6 +600,44 @@ class TestBaseRepository:
         with pytest.raises(RepositoryError, match="Failed to rollback transaction"):
             await repository.rollback()
     
+    async def test_unit_of_work_commits_once(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that a unit of work commits once on exit and not per operation."""
+        mock_session.execute.return_value = MagicMock()
+        
+        async with repository.unit_of_work() as repo:
+            assert repo is repository
+            await repo.create(name="first")
+            await repo.create(name="second")
+            mock_session.commit.assert_not_called()
+        
+        mock_session.commit.assert_awaited_once()
+        mock_session.rollback.assert_not_called()
+    
+    async def test_unit_of_work_rolls_back_on_error(
+        self, repository: BaseRepository[RepositoryTestModel], mock_session: AsyncMock
+    ) -> None:
+        """Test that an exception in the block rolls back instead of committing."""
+        with pytest.raises(ValueError):
+            async with repository.unit_of_work():
+                raise ValueError("boom")
+        
+        mock_session.rollback.assert_awaited_once()
+        mock_session.commit.assert_not_called()
+    
+    async def test_mixin_columns_resolved_at_init(self, mock_session: AsyncMock) -> None:
+        """Test that mixin columns are bound once, or None when the model lacks them."""
+        repository = BaseRepository(mock_session, RepositoryTestModel)
+        dependency_repository = BaseRepository(mock_session, Dependency)
+        
+        assert repository._deleted_column is RepositoryTestModel.deleted_at
+        assert repository._created_column is RepositoryTestModel.created_at
+        assert dependency_repository._deleted_column is None
+        assert dependency_repository._not_deleted is None
+        assert str(repository._not_deleted) == "test_models.deleted_at IS NULL"
+        assert dependency_repository._id_column is Dependency.id
+    
     async def test_caching_disabled_by_default(
         self, repository: BaseRepository[RepositoryTestModel]
     ) -> None:
@@ -473,4 +659,552 @@ class TestBaseRepository:
         assert hasattr(repository.get, '__wrapped__') or hasattr(repository.get, '__name__')
         assert hasattr(repository.update, '__wrapped__') or hasattr(repository.update, '__name__')
         assert hasattr(repository.delete, '__wrapped__') or hasattr(repository.delete, '__name__')
-        assert hasattr(repository.list, '__wrapped__') or hasattr(repository.list, '__name__')
\ No newline at end of file
+        assert hasattr(repository.list, '__wrapped__') or hasattr(repository.list, '__name__')
+
+
+class TestRelationshipLoading:
+    """Test eager loading of many-to-one relationships through the repository."""
+
+    @pytest.mark.asyncio
+    async def test_dependency_parents_loaded_with_list(self, db_session: AsyncSession) -> None:
+        """Test that listed dependencies have repository and package loaded without lazy IO."""
+        await create_dependency(db_session=db_session)
+        await create_dependency(db_session=db_session)
+        db_session.expunge_all()
+        repo = BaseRepository(db_session, Dependency)
+
+        result = await repo.list()
+
+        # Lazy loads would need IO here and fail outside the async context
+        assert len(result.items) == 2
+        for dependency in result.items:
+            assert dependency.repository.id == dependency.repository_id
+            assert dependency.package.id == dependency.package_id
+
+
+class TestBulkOperations:
+    """Test bulk_create() and bulk_update() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_inserts_all_batches(self, db_session: AsyncSession) -> None:
+        """Test that rows spanning several batches are all inserted."""
+        repo = BaseRepository(db_session, Organization)
+
+        created = await repo.bulk_create(
+            ({"name": f"bulk-org-{i}"} for i in range(5)), batch_size=2
+        )
+
+        assert created == []
+        assert await repo.count() == 5
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_returning_entities(self, db_session: AsyncSession) -> None:
+        """Test that returning=True yields created entities with generated fields."""
+        repo = BaseRepository(db_session, Organization)
+
+        created = await repo.bulk_create(
+            [{"name": "bulk-a"}, {"name": "bulk-b"}, {"name": "bulk-c"}],
+            batch_size=2,
+            returning=True
+        )
+
+        assert [org.name for org in created] == ["bulk-a", "bulk-b", "bulk-c"]
+        assert all(org.id is not None and org.created_at is not None for org in created)
+
+    @pytest.mark.asyncio
+    async def test_timestamps_generated_client_side(self, db_session: AsyncSession) -> None:
+        """Test that timestamps are set at flush without fetching server defaults."""
+        organization = Organization(name="client-side-timestamps")
+        db_session.add(organization)
+        await db_session.flush()
+
+        # Server-generated values would be expired here and need a lazy load
+        assert organization.created_at is not None
+        assert organization.created_at.tzinfo is not None
+        assert organization.updated_at is not None
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_uses_copy_on_asyncpg(self) -> None:
+        """Test that asyncpg sessions COPY rows with defaults and bind processing applied."""
+        dialect = postgresql_asyncpg.dialect()
+        driver_connection = MagicMock()
+        driver_connection.is_in_transaction.return_value = True
+        driver_connection.copy_records_to_table = AsyncMock()
+        connection = MagicMock(dialect=dialect)
+        connection.get_raw_connection = AsyncMock(
+            return_value=MagicMock(driver_connection=driver_connection)
+        )
+        session = AsyncMock()
+        session.get_bind = MagicMock(return_value=MagicMock(dialect=dialect))
+        session.connection.return_value = connection
+        repo = BaseRepository(session, Dependency)
+        repository_id, package_id = uuid.uuid4(), uuid.uuid4()
+
+        await repo.bulk_create([{
+            "repository_id": repository_id,
+            "package_id": package_id,
+            "dependency_type": DependencyTypeEnum.DEV,
+        }])
+
+        session.execute.assert_not_called()
+        call = driver_connection.copy_records_to_table.await_args
+        assert call.args == ("dependencies",)
+        columns = call.kwargs["columns"]
+        assert columns[:3] == ["repository_id", "package_id", "dependency_type"]
+        assert {"id", "detected_at", "created_at", "updated_at"} <= set(columns)
+        (record,) = call.kwargs["records"]
+        values = dict(zip(columns, record))
+        assert values["dependency_type"] == 2
+        assert isinstance(values["id"], int)
+        assert values["detected_at"].tzinfo is not None
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_commit_each_batch(self) -> None:
+        """Test that commit_each_batch commits once per executed batch."""
+        session = AsyncMock()
+        session.get_bind = MagicMock()
+        session.get_bind.return_value.dialect.name = "sqlite"
+        repo = BaseRepository(session, Organization)
+
+        await repo.bulk_create(
+            ({"name": f"batch-org-{i}"} for i in range(5)), batch_size=2, commit_each_batch=True
+        )
+
+        assert session.execute.await_count == 3
+        assert session.commit.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_invalid_batch_size(self, db_session: AsyncSession) -> None:
+        """Test that a non-positive batch size is rejected."""
+        repo = BaseRepository(db_session, Organization)
+
+        with pytest.raises(ValueError, match="batch_size"):
+            await repo.bulk_create([{"name": "x"}], batch_size=0)
+
+    @pytest.mark.asyncio
+    async def test_bulk_update_skips_soft_deleted(self, db_session: AsyncSession) -> None:
+        """Test that bulk_update updates live entities only and returns the count."""
+        repo = BaseRepository(db_session, Organization)
+        orgs = await repo.bulk_create(
+            [{"name": f"bulk-upd-{i}"} for i in range(3)], returning=True
+        )
+        await repo.delete(orgs[0].id, soft=True)
+
+        updated = await repo.bulk_update(
+            [org.id for org in orgs], batch_size=2, description="bulk"
+        )
+
+        assert updated == 2
+        assert orgs[1].description == "bulk"
+        assert orgs[2].description == "bulk"
+
+
+class TestGetIdentityMap:
+    """Test get() identity-map lookups against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_get_hit_skips_query_and_respects_soft_delete(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that an entity loaded in the session is returned without a query."""
+        repo = BaseRepository(db_session, Organization)
+        org = await repo.create(name="identity-org")
+        sync_session = db_session.sync_session
+
+        with patch.object(sync_session, "execute", wraps=sync_session.execute) as execute:
+            assert await repo.get(org.id) is org
+        execute.assert_not_called()
+
+        await repo.delete(org.id, soft=True)
+        assert await repo.get(org.id) is None
+        assert await repo.get(org.id, include_deleted=True) is org
+
+
+class TestGetMany:
+    """Test get_many() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_maps_found_ids_across_batches(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that found live entities are keyed by ID and others are absent."""
+        repo = BaseRepository(db_session, Organization)
+        orgs = await repo.bulk_create(
+            [{"name": f"get-many-{i}"} for i in range(4)], returning=True
+        )
+        await repo.delete(orgs[3].id, soft=True)
+        missing_id = uuid.uuid4()
+
+        found = await repo.get_many(
+            [orgs[0].id, orgs[1].id, missing_id, orgs[2].id, orgs[3].id, orgs[0].id],
+            batch_size=2
+        )
+
+        assert found == {org.id: org for org in orgs[:3]}
+        with_deleted = await repo.get_many([orgs[3].id], include_deleted=True)
+        assert with_deleted == {orgs[3].id: orgs[3]}
+        assert await repo.get_many([]) == {}
+
+
+class TestLoadOptions:
+    """Test eager-load defaults and raiseload against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_load_defaults_apply_to_get_and_list(self, db_session: AsyncSession) -> None:
+        """Test that load_defaults eager-load relationships on every read."""
+        repo = BaseRepository(
+            db_session, Organization, load_defaults=(selectinload(Organization.repositories),)
+        )
+        org = await repo.create(name="eager-org")
+        db_session.expunge_all()
+
+        fetched = await repo.get(org.id)
+        assert fetched is not None
+        assert "repositories" not in inspect(fetched).unloaded
+        db_session.expunge_all()
+
+        page = await repo.list()
+        assert "repositories" not in inspect(page.items[0]).unloaded
+
+    @pytest.mark.asyncio
+    async def test_raiseload_blocks_lazy_loads_unless_eager_loaded(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that DATABASE_RAISELOAD makes lazy loads raise; explicit options still load."""
+        with patch("app.repositories.base.settings.database_raiseload", True):
+            repo = BaseRepository(db_session, Organization)
+        org = await repo.create(name="raiseload-org")
+        db_session.expunge_all()
+
+        fetched = await repo.get(org.id)
+        assert fetched is not None
+        with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+            _ = fetched.repositories
+        db_session.expunge_all()
+
+        eager = await repo.get(org.id, options=(selectinload(Organization.repositories),))
+        assert eager is not None
+        assert eager.repositories == []
+        db_session.expunge_all()
+
+        with patch("app.repositories.base.settings.database_raiseload", True):
+            eager_repo = BaseRepository(
+                db_session, Organization,
+                load_defaults=(selectinload(Organization.repositories),)
+            )
+        by_default = await eager_repo.get(org.id)
+        assert by_default is not None
+        assert by_default.repositories == []
+
+    @pytest.mark.asyncio
+    async def test_raiseload_keeps_mapped_eager_relationships(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that lazy="selectin" relationships still load with DATABASE_RAISELOAD."""
+        package = await create_package(db_session=db_session, name="raiseload-package")
+        dependency = await create_dependency(db_session=db_session, package=package)
+        package_name = package.name
+        db_session.expunge_all()
+        with patch("app.repositories.base.settings.database_raiseload", True):
+            repo = BaseRepository(db_session, Dependency)
+
+        fetched = await repo.get(dependency.id)
+        assert fetched is not None
+        assert fetched.package.name == package_name
+        db_session.expunge_all()
+
+        page = await repo.list()
+        assert page.items[0].package.name == package_name
+        assert page.items[0].repository.id == dependency.repository_id
+
+
+class TestApproximateTotals:
+    """Test approx_count() and list(exact_total=False) against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_list_without_exact_total_uses_approx_count(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that the estimate replaces the window total (exact count on SQLite)."""
+        repo = BaseRepository(db_session, Organization)
+        await repo.bulk_create([{"name": f"approx-org-{i}"} for i in range(3)])
+
+        assert await repo.approx_count() == 3
+        page = await repo.list(PaginationParams(offset=0, limit=2), exact_total=False)
+
+        assert len(page.items) == 2
+        assert page.total == 3
+        assert page.has_next
+
+
+class TestIterAll:
+    """Test iter_all() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_iter_all_yields_batches_in_id_order(self, db_session: AsyncSession) -> None:
+        """Test that every live entity is streamed once, in batches of batch_size."""
+        repo = BaseRepository(db_session, Organization)
+        orgs = await repo.bulk_create(
+            [{"name": f"stream-org-{i}"} for i in range(5)], returning=True
+        )
+        await repo.delete(orgs[4].id, soft=True)
+
+        batches = [batch async for batch in repo.iter_all(batch_size=2)]
+
+        assert [len(batch) for batch in batches] == [2, 2]
+        streamed = [org.id for batch in batches for org in batch]
+        assert streamed == sorted(org.id for org in orgs[:4])
+
+    @pytest.mark.asyncio
+    async def test_iter_all_closes_result_when_stopped_early(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that closing the generator after one batch closes the stream result."""
+        repo = BaseRepository(db_session, Organization)
+        await repo.bulk_create([{"name": f"early-stop-org-{i}"} for i in range(4)])
+        stream = db_session.stream
+        results = []
+
+        async def tracking_stream(*args, **kwargs):
+            results.append(await stream(*args, **kwargs))
+            return results[-1]
+
+        with patch.object(db_session, "stream", side_effect=tracking_stream):
+            batches = repo.iter_all(batch_size=2)
+            assert len(await anext(batches)) == 2
+            await batches.aclose()
+
+        assert results[0].closed
+        assert await repo.count() == 4
+
+
+class TestSoftDeleteFiltering:
+    """Test that repository reads hide soft-deleted rows on any session."""
+
+    @pytest.mark.asyncio
+    async def test_reads_skip_soft_deleted_on_plain_session(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that the filter does not depend on the AppSession criteria."""
+        live, deleted = await BaseRepository(db_session, Organization).bulk_create(
+            [{"name": "plain-live-org"}, {"name": "plain-deleted-org"}], returning=True
+        )
+        deleted.deleted_at = utc_now()
+        await db_session.flush()
+
+        async with AsyncSession(db_session.bind) as plain_session:
+            repo = BaseRepository(plain_session, Organization)
+            ids = [live.id, deleted.id]
+
+            assert await repo.get(deleted.id) is None
+            assert list(await repo.get_many(ids)) == [live.id]
+            assert [org.id for org in (await repo.list()).items] == [live.id]
+            assert [org.id for org in (await repo.list_keyset()).items] == [live.id]
+            assert [org.id async for batch in repo.iter_all() for org in batch] == [live.id]
+            assert await repo.count() == 1
+            assert await repo.count(include_deleted=True) == 2
+
+class TestUpdateAndDeleteStatements:
+    """Test the plain UPDATE and DELETE paths against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_update_syncs_instance_in_session(self, db_session: AsyncSession) -> None:
+        """Test that an update without RETURNING still refreshes the loaded instance."""
+        repo = BaseRepository(db_session, Organization)
+        org = await repo.create(name="plain-update-org")
+
+        assert await repo.update(org.id, description="synced") is True
+        assert org.description == "synced"
+        assert await repo.update(uuid.uuid4(), description="missing") is False
+
+    @pytest.mark.asyncio
+    async def test_soft_delete_stamps_one_timestamp(self, db_session: AsyncSession) -> None:
+        """Test that a soft delete sets updated_at and deleted_at to the same instant."""
+        repo = BaseRepository(db_session, Organization)
+        org = await repo.create(name="soft-delete-stamp-org")
+
+        assert await repo.delete(org.id, soft=True) is True
+        assert org.deleted_at is not None
+        assert org.updated_at == org.deleted_at
+
+    @pytest.mark.asyncio
+    async def test_hard_delete_removes_row(self, db_session: AsyncSession) -> None:
+        """Test that a hard delete removes the row, including a soft-deleted one."""
+        repo = BaseRepository(db_session, Organization)
+        org = await repo.create(name="plain-delete-org")
+        await repo.delete(org.id, soft=True)
+
+        assert await repo.delete(org.id, soft=False) is True
+        assert await repo.count(include_deleted=True) == 0
+        assert await repo.delete(org.id, soft=False) is False
+
+
+class TestBulkUpdateRows:
+    """Test bulk_update_rows() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_per_row_values_skip_missing_and_soft_deleted(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that each row gets its own values and the count covers live matches."""
+        repo = BaseRepository(db_session, Organization)
+        orgs = await repo.bulk_create(
+            [{"name": f"rows-org-{i}"} for i in range(3)], returning=True
+        )
+        await repo.delete(orgs[2].id, soft=True)
+        db_session.expunge_all()
+
+        updated = await repo.bulk_update_rows(
+            [
+                {"id": orgs[0].id, "description": "first"},
+                {"id": orgs[1].id, "description": "second"},
+                {"id": orgs[2].id, "description": "deleted"},
+                {"id": uuid.uuid4(), "description": "missing"},
+            ],
+            batch_size=3
+        )
+
+        assert updated == 2
+        found = await repo.get_many([org.id for org in orgs], include_deleted=True)
+        assert [found[org.id].description for org in orgs] == ["first", "second", None]
+
+    @pytest.mark.asyncio
+    async def test_row_without_id_is_rejected(self, db_session: AsyncSession) -> None:
+        """Test that every row must identify its entity."""
+        repo = BaseRepository(db_session, Organization)
+
+        with pytest.raises(ValueError, match="'id'"):
+            await repo.bulk_update_rows([{"description": "no id"}])
+
+
+class TestSavepoint:
+    """Test savepoint() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_failed_block_rolls_back_only_its_own_work(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that a failing savepoint keeps earlier work in the outer transaction."""
+        repo = BaseRepository(db_session, Organization)
+        await repo.create(name="outer-org")
+
+        with pytest.raises(ConflictError):
+            async with repo.savepoint():
+                await repo.create(name="inner-org")
+                await repo.create(name="outer-org")
+
+        async with repo.savepoint():
+            await repo.create(name="kept-org")
+
+        result = await repo.list(PaginationParams())
+        assert sorted(org.name for org in result.items) == ["kept-org", "outer-org"]
+
+
+class TestCursorPagination:
+    """Test list() with CursorPaginationParams against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_cursor_pages_cover_all_entities_in_id_order(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that following next_cursor walks every live entity exactly once."""
+        repo = BaseRepository(db_session, Organization)
+        orgs = await repo.bulk_create(
+            [{"name": f"cursor-org-{i}"} for i in range(5)], returning=True
+        )
+        await repo.delete(orgs[2].id, soft=True)
+
+        seen = []
+        page = await repo.list(pagination=CursorPaginationParams(limit=2))
+        while True:
+            assert isinstance(page, CursorPaginatedResult)
+            seen.extend(org.name for org in page.items)
+            if not page.has_next:
+                break
+            page = await repo.list(
+                pagination=CursorPaginationParams(after=page.next_cursor, limit=2)
+            )
+
+        assert seen == ["cursor-org-0", "cursor-org-1", "cursor-org-3", "cursor-org-4"]
+
+    @pytest.mark.asyncio
+    async def test_cursor_last_page_has_no_next(self, db_session: AsyncSession) -> None:
+        """Test that an exactly full last page reports no next cursor."""
+        repo = BaseRepository(db_session, Organization)
+        await repo.bulk_create([{"name": f"cursor-full-{i}"} for i in range(2)])
+
+        page = await repo.list(pagination=CursorPaginationParams(limit=2))
+
+        assert len(page.items) == 2
+        assert page.next_cursor is None
+        assert page.has_next is False
+
+
+class TestKeysetPagination:
+    """Test list_keyset() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_pages_follow_created_at_then_id_descending(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that pages are newest first and ties on created_at are split by id."""
+        repo = BaseRepository(db_session, Organization)
+        base = datetime(2026, 1, 1, tzinfo=UTC)
+        # Two pairs share a timestamp so the id tie-breaker crosses page boundaries
+        created = await repo.bulk_create(
+            [
+                {"name": f"keyset-org-{i}", "created_at": base + timedelta(minutes=i // 2)}
+                for i in range(5)
+            ],
+            returning=True
+        )
+        expected = sorted(created, key=lambda org: (org.created_at, org.id), reverse=True)
+
+        seen: list[Organization] = []
+        page = await repo.list_keyset(limit=2)
+        seen.extend(page.items)
+        while page.has_next:
+            page = await repo.list_keyset(after=page.next_cursor, limit=2)
+            seen.extend(page.items)
+
+        assert [org.id for org in seen] == [org.id for org in expected]
+        assert page.next_cursor is None
+
+    @pytest.mark.asyncio
+    async def test_invalid_limit(self, db_session: AsyncSession) -> None:
+        """Test that an out-of-range limit is rejected."""
+        repo = BaseRepository(db_session, Organization)
+
+        with pytest.raises(ValueError, match="Limit must be between 1 and 1000"):
+            await repo.list_keyset(limit=0)
+
+
+class TestOffsetPaginationTotal:
+    """Test the window-function total of offset list() against the test database."""
+
+    @pytest.mark.asyncio
+    async def test_total_from_page_query(self, db_session: AsyncSession) -> None:
+        """Test that the total counts live entities across pages."""
+        repo = BaseRepository(db_session, Organization)
+        orgs = await repo.bulk_create(
+            [{"name": f"window-org-{i}"} for i in range(5)], returning=True
+        )
+        await repo.delete(orgs[0].id, soft=True)
+
+        page = await repo.list(pagination=PaginationParams(offset=2, limit=2))
+
+        assert page.total == 4
+        assert len(page.items) == 2
+        assert all(isinstance(item, Organization) for item in page.items)
+
+    @pytest.mark.asyncio
+    async def test_total_past_last_page(self, db_session: AsyncSession) -> None:
+        """Test that an empty page past the end still reports the total."""
+        repo = BaseRepository(db_session, Organization)
+        await repo.bulk_create([{"name": f"window-end-{i}"} for i in range(3)])
+
+        page = await repo.list(pagination=PaginationParams(offset=10, limit=5))
+
+        assert page.items == []
+        assert page.total == 3
+        assert page.has_next is False
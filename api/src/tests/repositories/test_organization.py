@@ -3,6 +3,7 @@
 import uuid
 import pytest
 from unittest.mock import patch
+from sqlalchemy import inspect
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.repositories.organization import OrganizationRepository
@@ -13,6 +14,7 @@ from app.repositories.base import (
     NotFoundError,
     ConflictError,
 )
+from tests.factories import create_organization, create_repository
 
 
 class TestCreate:
@@ -29,6 +31,33 @@ class TestCreate:
 
         assert org is not None
 
+    @pytest.mark.asyncio
+    async def test_create_populates_columns_without_refresh(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test that every column is loaded from the INSERT's RETURNING."""
+        repo = OrganizationRepository(db_session)
+
+        org = await repo.create(name="no-refresh-org")
+
+        assert inspect(org).unloaded == {"repositories"}
+        assert org.created_at is not None
+        assert org in db_session
+
+    @pytest.mark.asyncio
+    async def test_create_assigns_time_ordered_uuid7_ids(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test creation assigns UUIDv7 ids that increase with insertion order."""
+        repo = OrganizationRepository(db_session)
+
+        first = await repo.create(name="first-org")
+        second = await repo.create(name="second-org")
+
+        assert first.id.version == 7
+        assert second.id.version == 7
+        assert first.id < second.id
+
     @pytest.mark.asyncio
     async def test_create_sets_name_correctly(
         self, db_session: AsyncSession
@@ -675,3 +704,44 @@ class TestGetByName:
         # Different whitespace should not match
         org_trimmed = await repo.get_by_name("org with  spaces")
         assert org_trimmed is None
+
+
+
+class TestRefreshStats:
+    """Test refresh_stats() method."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_stats_aggregates_repositories_per_organization(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test stats are recomputed from the organization's repositories."""
+        repo = OrganizationRepository(db_session)
+        org = await create_organization(db_session=db_session)
+        await create_repository(db_session=db_session, organization=org, stars=10)
+        await create_repository(db_session=db_session, organization=org, stars=32)
+        previous_update = org.updated_at.replace(tzinfo=None)
+
+        updated = await repo.refresh_stats()
+        await db_session.refresh(org)
+
+        assert updated >= 1
+        assert org.total_repositories == 2
+        assert org.total_stars == 42
+        # SQLite hands timestamps back without a zone
+        assert org.updated_at.replace(tzinfo=None) > previous_update
+
+    @pytest.mark.asyncio
+    async def test_refresh_stats_organization_without_repositories_is_zeroed(
+        self, db_session: AsyncSession
+    ) -> None:
+        """Test organizations with no repositories get zero counts, not NULL."""
+        repo = OrganizationRepository(db_session)
+        org = await create_organization(
+            db_session=db_session, total_repositories=5, total_stars=500
+        )
+
+        await repo.refresh_stats()
+        await db_session.refresh(org)
+
+        assert org.total_repositories == 0
+        assert org.total_stars == 0
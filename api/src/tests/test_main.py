@@ -1,13 +1,15 @@
 """Test basic application health."""
+import asyncio
 import time
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
 
-from app.main import app
+from app.main import _iso_now_z, app
 
 
 @pytest_asyncio.fixture
@@ -222,6 +224,46 @@ async def test_health_check_response_time_reasonable(async_client: AsyncClient)
     assert elapsed < 5.0
 
 
+@pytest.mark.asyncio
+async def test_health_check_runs_checks_concurrently(async_client: AsyncClient) -> None:
+    """Test that database and cache checks overlap instead of running back to back."""
+    both_started = asyncio.Event()
+    started = 0
+
+    async def slow_check() -> bool:
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1.0)
+        return True
+
+    with patch("app.main.check_database_connection", slow_check), patch(
+        "app.main.check_cache_connection", slow_check
+    ):
+        response = await async_client.get("/health")
+
+    assert response.status_code == 200
+    assert response.json()["status"] == "healthy"
+
+
+def test_iso_now_z_matches_datetime_format() -> None:
+    """Test that the fast timestamp formatter matches datetime's ISO output."""
+    for t in (0.0, 1700000000.123456, 1767225599.999):
+        expected = datetime.fromtimestamp(t, UTC).isoformat(timespec="milliseconds")
+        assert _iso_now_z(t) == expected.replace("+00:00", "Z")
+
+
+@pytest.mark.asyncio
+async def test_health_check_shares_one_timestamp(async_client: AsyncClient) -> None:
+    """Test that the response and per-check timestamps are computed once."""
+    response = await async_client.get("/health")
+
+    data = response.json()
+    assert data["checks"]["database"]["timestamp"] == data["timestamp"]
+    assert data["checks"]["cache"]["timestamp"] == data["timestamp"]
+
+
 @pytest.mark.asyncio
 async def test_docs_accessible(async_client: AsyncClient) -> None:
     """Test that API documentation is accessible."""
@@ -1,11 +1,15 @@
 """Tests for request ID middleware."""
 import uuid
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import structlog
 from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
 
 from app.core.middleware import RequestIDMiddleware, get_request_id, request_id_var
 
@@ -88,17 +92,17 @@ class TestRequestIDMiddleware:
         assert response_data["request_id"] == response.headers["x-request-id"]
 
     @patch("app.core.middleware.logger")
-    def test_request_start_logged(self, mock_logger: MagicMock, client: TestClient) -> None:
-        """Test that request start is logged with correct information."""
+    def test_request_logged_once(self, mock_logger: MagicMock, client: TestClient) -> None:
+        """Test that a single completion event carries the request information."""
         client.get("/test")
 
-        # Check that logger.info was called for request start
-        mock_logger.info.assert_any_call(
-            "Request started",
-            method="GET",
-            path="/test",
-            query_params=None,
-        )
+        # Only the completion event is logged; there is no separate start event
+        mock_logger.info.assert_called_once()
+        call_args = mock_logger.info.call_args
+        assert call_args[0][0] == "Request completed"
+        assert call_args[1]["method"] == "GET"
+        assert call_args[1]["path"] == "/test"
+        assert call_args[1]["query_params"] is None
 
     @patch("app.core.middleware.logger")
     def test_request_completion_logged(self, mock_logger: MagicMock, client: TestClient) -> None:
@@ -122,13 +126,10 @@ class TestRequestIDMiddleware:
         """Test that query parameters are included in logs."""
         client.get("/test?param1=value1&param2=value2")
 
-        # Check for request start log with query params
-        mock_logger.info.assert_any_call(
-            "Request started",
-            method="GET",
-            path="/test",
-            query_params="param1=value1&param2=value2",
-        )
+        # Check for request completion log with query params
+        call_args = mock_logger.info.call_args
+        assert call_args[0][0] == "Request completed"
+        assert call_args[1]["query_params"] == "param1=value1&param2=value2"
 
     @patch("app.core.middleware.logger")
     def test_error_request_logged(self, mock_logger: MagicMock, client: TestClient) -> None:
@@ -141,6 +142,8 @@ class TestRequestIDMiddleware:
         call_args = mock_logger.error.call_args
 
         assert call_args[0][0] == "Request failed"
+        assert call_args[1]["method"] == "GET"
+        assert call_args[1]["path"] == "/error"
         assert "error" in call_args[1]
         assert "error_type" in call_args[1]
         assert "duration_ms" in call_args[1]
@@ -204,35 +207,100 @@ class TestRequestIDMiddleware:
         assert response.status_code == 404
         assert "x-request-id" in response.headers
 
-    @patch("app.core.middleware.structlog.contextvars.bind_contextvars")
+    @patch(
+        "app.core.middleware.structlog.contextvars.bound_contextvars",
+        wraps=structlog.contextvars.bound_contextvars,
+    )
     def test_structlog_context_binding(self, mock_bind: MagicMock, client: TestClient) -> None:
         """Test that request ID is bound to structlog context."""
         response = client.get("/test")
         request_id = response.headers["x-request-id"]
 
-        # Verify bind_contextvars was called with the request ID
+        # Verify bound_contextvars was called with the request ID
         mock_bind.assert_called_once_with(request_id=request_id)
 
-    @patch("app.core.middleware.structlog.contextvars.clear_contextvars")
-    def test_structlog_context_cleared_after_request(
-        self, mock_clear: MagicMock, client: TestClient
-    ) -> None:
-        """Test that structlog context is cleared after request completion."""
-        client.get("/test")
+    @pytest.mark.asyncio
+    async def test_structlog_context_reset_after_request(self) -> None:
+        """Test that request_id is unbound after the request, keeping other bindings."""
+        seen: dict[str, Any] = {}
 
-        # Verify clear_contextvars was called
-        mock_clear.assert_called_once()
+        async def inner_app(scope: Any, receive: Any, send: Any) -> None:
+            seen.update(structlog.contextvars.get_contextvars())
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
 
-    @patch("app.core.middleware.structlog.contextvars.clear_contextvars")
-    def test_structlog_context_cleared_even_on_error(
-        self, mock_clear: MagicMock, client: TestClient
-    ) -> None:
-        """Test that structlog context is cleared even when request fails."""
+        middleware = RequestIDMiddleware(inner_app)
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+
+        structlog.contextvars.clear_contextvars()
+        structlog.contextvars.bind_contextvars(worker="w1")
+        try:
+            await middleware(scope, AsyncMock(), AsyncMock())
+
+            assert "request_id" in seen
+            assert structlog.contextvars.get_contextvars() == {"worker": "w1"}
+        finally:
+            structlog.contextvars.clear_contextvars()
+
+    @pytest.mark.asyncio
+    async def test_structlog_context_reset_even_on_error(self) -> None:
+        """Test that request_id is unbound even when the request fails."""
+
+        async def inner_app(scope: Any, receive: Any, send: Any) -> None:
+            raise ValueError("Test error")
+
+        middleware = RequestIDMiddleware(inner_app)
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+
+        structlog.contextvars.clear_contextvars()
         with pytest.raises(ValueError):
-            client.get("/error")
+            await middleware(scope, AsyncMock(), AsyncMock())
+
+        assert "request_id" not in structlog.contextvars.get_contextvars()
+
+    @pytest.mark.asyncio
+    async def test_non_http_scopes_passed_through(self) -> None:
+        """Test that lifespan/websocket scopes bypass request ID handling."""
+        calls: list[dict[str, Any]] = []
+
+        async def inner_app(scope: Any, receive: Any, send: Any) -> None:
+            calls.append(scope)
+
+        middleware = RequestIDMiddleware(inner_app)
+        scope = {"type": "lifespan"}
+
+        with patch("app.core.middleware.structlog.contextvars.bound_contextvars") as mock_bind:
+            await middleware(scope, MagicMock(), MagicMock())
+
+            mock_bind.assert_not_called()
+
+        assert calls == [scope]
+
+    @pytest.mark.asyncio
+    async def test_request_id_set_on_current_server_span(self) -> None:
+        """Test that the instrumentor's span is tagged instead of starting a new span."""
+        exporter = InMemorySpanExporter()
+        provider = TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(exporter))
+        tracer = provider.get_tracer(__name__)
+        headers: list[Any] = []
+
+        async def inner_app(scope: Any, receive: Any, send: Any) -> None:
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+
+        async def capture_send(message: Any) -> None:
+            headers.extend(message.get("headers", []))
+
+        middleware = RequestIDMiddleware(inner_app)
+        scope = {"type": "http", "method": "GET", "path": "/", "headers": []}
+
+        with patch("app.core.middleware.is_tracing_enabled", return_value=True):
+            with tracer.start_as_current_span("GET /"):
+                await middleware(scope, AsyncMock(), capture_send)
 
-        # Verify clear_contextvars was called even though request failed
-        mock_clear.assert_called_once()
+        (span,) = exporter.get_finished_spans()
+        request_id = dict(headers)[b"x-request-id"].decode()
+        assert (span.attributes or {})["request.id"] == request_id
 
     def test_timing_accuracy(self, client: TestClient) -> None:
         """Test that request timing is reasonably accurate."""